@@ -0,0 +1,194 @@
+"""해상도별 에셋 팩: 크기 조정/회전까지 끝난 Surface의 픽셀을 한 파일에 모아 두고 실행 시 mmap으로 바로 사용
+
+매 실행마다 PNG를 디코딩하고 화면 크기에 맞춰 transform.scale/rotate 하는 대신,
+한 번 만든 결과를 BGRA 원시 픽셀로 저장해 두었다가 pygame.image.frombuffer로 복사 없이 Surface를 만듭니다.
+(쓰기 시 복사(copy-on-write) 매핑이라 같은 팩을 쓰는 여러 실행이 메모리를 공유하며, 팩에서 나온 Surface는 수정 금지)
+
+- 팩은 key(해상도, 타일 크기, 원본 PNG 크기/내용 해시, 버전)가 같을 때만 사용하고, 다르면 무시하고 새로 만듭니다.
+- surface(name, make): 팩에 있으면 팩에서, 없으면 make()로 만들고 기록해 두었다가 save() 때 팩으로 씀
+  (name은 entry_name으로 만듦: 같은 원본이라도 크기/회전/알파가 다르면 다른 항목)
+- 빌드 단계에서 미리 만들기: python asset_pack.py 1920 1080  (게임의 내부 렌더링 해상도 기준)
+
+파일 구조: MAGIC(8) + 헤더 길이(8, little endian) + JSON 헤더 + (ALIGN 단위로 정렬된) 픽셀 데이터
+"""
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+
+import pygame
+
+MAGIC = b"SSPACK01"
+ALIGN = 64
+PIXEL_FORMAT = "BGRA" # little endian에서 convert_alpha() 결과(ARGB8888)와 같은 메모리 배치
+
+
+def source_signature(root="assets"):
+    """원본 이미지 파일들의 (크기, 내용 해시): 하나라도 바뀌면 팩을 다시 만듦
+    (수정 시각은 쓰지 않음: checkout/복사/압축 해제만으로 바뀌어 미리 구운 팩이 매번 버려지므로)"""
+    sources = {}
+    for dirpath, _, filenames in os.walk(root):
+        for filename in filenames:
+            if filename.lower().endswith(".png"):
+                path = os.path.join(dirpath, filename)
+                with open(path, "rb") as f:
+                    data = f.read()
+                sources[path.replace(os.sep, "/")] = [len(data), hashlib.sha256(data).hexdigest()]
+    return dict(sorted(sources.items()))
+
+
+def entry_name(source, size=None, rotation=None, alpha=True):
+    """팩 항목 이름: 원본 + 변환(크기, 회전 각도, 알파 여부). 예: assets/ui/main_bg.png@1920x1080@opaque"""
+    name = source
+    if size:
+        name += "@" + "x".join(str(v) for v in size)
+    if rotation is not None:
+        name += f"@rot{rotation % 360}"
+    if not alpha:
+        name += "@opaque"
+    return name
+
+
+class AssetPack:
+    def __init__(self, path=None, key=None, rebuild=False):
+        self.path = path # None이면 팩을 쓰지 않음 (항상 make())
+        self.key = key
+        self.entries = {}  # 이름 -> [offset, width, height, alpha]
+        self.recorded = {} # 팩에 없어서 make()로 만든 Surface (save() 때 기록)
+        self.stats = {"hits": 0, "misses": 0, "converted": 0}
+        self._mmap = None
+        self._data_start = 0
+        self._zero_copy = False
+        if path and not rebuild:
+            self.load()
+
+    def load(self):
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "rb") as f:
+                if f.read(len(MAGIC)) != MAGIC:
+                    raise ValueError("not an asset pack")
+                (header_len,) = struct.unpack("<Q", f.read(8))
+                header = json.loads(f.read(header_len).decode("utf-8"))
+                if header.get("key") != self.key:
+                    print(f"Asset pack {self.path} is stale, rebuilding")
+                    return
+                # ACCESS_COPY: 읽기는 파일 페이지를 공유, 쓰기는 이 프로세스 사본에만 (frombuffer는 쓰기 가능한 버퍼 필요)
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+            self.entries = header["entries"]
+            self._data_start = header["data_start"]
+            self._zero_copy = self._display_matches()
+        except Exception as e:
+            print(f"Error: asset pack could not be loaded: {e}")
+            self.entries = {}
+            self._mmap = None
+
+    @staticmethod
+    def _display_matches():
+        """팩의 BGRA 픽셀을 그대로 써도 화면(convert_alpha) 형식과 같은지 (다르면 불러올 때 한 번 변환)"""
+        probe = pygame.image.frombuffer(bytearray(4), (1, 1), PIXEL_FORMAT)
+        return probe.get_masks() == pygame.Surface((1, 1), pygame.SRCALPHA).convert_alpha().get_masks()
+
+    def surface(self, name, make):
+        entry = self.entries.get(name)
+        if entry is not None and self._mmap is not None:
+            self.stats["hits"] += 1
+            return self._from_pack(entry)
+
+        self.stats["misses"] += 1
+        surface = make()
+        if self.path:
+            self.recorded[name] = surface
+        return surface
+
+    def _from_pack(self, entry):
+        offset, width, height, alpha = entry
+        start = self._data_start + offset
+        view = memoryview(self._mmap)[start:start + width * height * 4]
+        surface = pygame.image.frombuffer(view, (width, height), PIXEL_FORMAT)
+        if not alpha:
+            self.stats["converted"] += 1
+            return surface.convert() # 불투명 이미지는 알파 없는 화면 형식으로 (blit이 단순 복사가 되도록)
+        if not self._zero_copy:
+            self.stats["converted"] += 1
+            return surface.convert_alpha()
+        return surface
+
+    def save(self):
+        """make()로 새로 만든 Surface가 있으면 (팩에 있던 것과 합쳐) 팩 파일을 다시 씀"""
+        if not self.path or not self.recorded:
+            return False
+        surfaces = {}
+        for name, entry in self.entries.items():
+            if name not in self.recorded and self._mmap is not None:
+                surfaces[name] = self._from_pack(entry)
+        surfaces.update(self.recorded)
+
+        entries = {}
+        blobs = []
+        offset = 0
+        for name, surface in surfaces.items():
+            data = pygame.image.tobytes(surface, PIXEL_FORMAT)
+            alpha = bool(surface.get_flags() & pygame.SRCALPHA)
+            entries[name] = [offset, surface.get_width(), surface.get_height(), alpha]
+            pad = -len(data) % ALIGN
+            blobs.append(data + b"\0" * pad)
+            offset += len(data) + pad
+
+        header = {"key": self.key, "entries": entries, "data_start": 0}
+        # data_start는 헤더 길이에 따라 달라지므로 자리 수를 넉넉히 잡고 두 번 계산
+        header["data_start"] = 10 ** 12
+        header_len = len(json.dumps(header, ensure_ascii=False).encode("utf-8"))
+        data_start = len(MAGIC) + 8 + header_len
+        data_start += -data_start % ALIGN
+        header["data_start"] = data_start
+        header_bytes = json.dumps(header, ensure_ascii=False).encode("utf-8")
+        header_bytes += b" " * (header_len - len(header_bytes)) # 앞서 잡은 길이에 맞춤
+
+        tmp_path = self.path + ".tmp"
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                f.write(MAGIC)
+                f.write(struct.pack("<Q", len(header_bytes)))
+                f.write(header_bytes)
+                f.write(b"\0" * (data_start - f.tell()))
+                for blob in blobs:
+                    f.write(blob)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            print(f"Error: asset pack could not be written: {e}")
+            return False
+        print(f"Asset pack written: {self.path} ({len(entries)} images, {(data_start + offset) / 2**20:.1f} MB)")
+        self.recorded = {}
+        return True
+
+    def get_stats(self):
+        return dict(self.stats, entries=len(self.entries), path=self.path)
+
+
+def build(width, height):
+    """빌드 단계: 창/카메라 없이 (width, height) 내부 해상도용 팩을 만듦"""
+    from game import Game
+
+    pygame.init()
+    pygame.display.set_mode((width, height))
+    builder = Game.__new__(Game) # 이미지 로더만 사용 (__init__의 카메라/로딩 스레드 없이)
+    builder.SCREEN_WIDTH, builder.SCREEN_HEIGHT = width, height
+    builder.assets = AssetPack(builder.asset_pack_path(), builder.asset_pack_key(), rebuild=True)
+    builder.load_login_assets()
+    builder.load_ui_assets()
+    builder.load_game_assets()
+    builder.assets.save()
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        print("usage: python asset_pack.py WIDTH HEIGHT")
+        sys.exit(1)
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    build(int(sys.argv[1]), int(sys.argv[2]))
@@ -5,7 +5,7 @@ class Background:
         self.game = game
         try:
             # 업로드하신 이미지 로드
-            self.image = pygame.image.load("assets/background_grass.png").convert()
+            self.image = game.load_image("assets/background_grass.png", alpha=False)
         except:
             # 이미지가 없으면 기본 초록색으로 대체
             self.image = pygame.Surface((200, 200))
@@ -19,29 +19,46 @@ class Background:
         self.x_shift = 0
         self.y_shift = 0
 
+        # 화면 크기에 맞춰 미리 타일을 깔아 둔 배경 (draw에서 처음 필요할 때 생성)
+        self.baked = None
+        self.baked_size = None
+
     def update(self):
-        # 게임 속도(world_velocity)의 반대 방향으로 배경을 이동시킵니다.
-        self.x_shift -= self.game.world_velocity[0]
-        self.y_shift -= self.game.world_velocity[1]
+        # 카메라가 움직인 반대 방향으로 배경을 이동시킵니다 (도로와 같은 보간된 정수 카메라 위치 사용).
+        camera_x, camera_y = self.game.camera_offset()
         
         # 무한 스크롤을 위해 좌표가 이미지 크기를 넘어가면 0으로 리셋 (나머지 연산)
-        self.x_shift %= self.w
-        self.y_shift %= self.h
+        self.x_shift = -camera_x % self.w
+        self.y_shift = -camera_y % self.h
 
-    def draw(self, screen):
-        # 화면 전체를 덮을 때까지 타일을 반복해서 그립니다.
-        
-        # 필요한 타일 개수 계산 (화면 크기보다 넉넉하게)
-        cols = (self.game.SCREEN_WIDTH // self.w) + 2
-        rows = (self.game.SCREEN_HEIGHT // self.h) + 2
-        
-        # 그리기 시작 위치 (화면 왼쪽/위쪽 바깥에서 시작해야 끊기지 않음)
-        # x_shift, y_shift는 0~w, 0~h 사이의 값이므로, 여기서 w, h를 빼서 시작점을 잡습니다.
-        start_x = self.x_shift - self.w
-        start_y = self.y_shift - self.h
-        
+    def bake(self, width, height):
+        """화면을 덮는 타일 배경을 한 번만 그려 둡니다 (화면 크기가 바뀔 때만 다시 그림)
+
+        크기를 타일 크기의 배수로 맞춰 두면 가로/세로로 이어 붙여도 무늬가 끊기지 않으므로,
+        매 프레임 x_shift/y_shift만큼 밀어서 최대 4번의 blit으로 화면을 덮을 수 있습니다.
+        """
+        cols = -(-width // self.w) # 올림
+        rows = -(-height // self.h)
+        self.baked = pygame.Surface((cols * self.w, rows * self.h)).convert()
         for c in range(cols):
             for r in range(rows):
-                draw_x = start_x + c * self.w
-                draw_y = start_y + r * self.h
-                screen.blit(self.image, (draw_x, draw_y))
\ No newline at end of file
+                self.baked.blit(self.image, (c * self.w, r * self.h))
+        self.baked_size = (width, height)
+
+    def draw(self, screen):
+        self.update() # 그리는 시점의 카메라 위치에 맞춤
+        size = (self.game.SCREEN_WIDTH, self.game.SCREEN_HEIGHT)
+        if self.baked_size != size:
+            self.bake(*size)
+
+        # 구운 배경을 (x_shift, y_shift)만큼 밀어서 그리고, 밀려서 비는 왼쪽/위쪽은 한 장 앞의 복사본으로 채움
+        bw, bh = self.baked.get_size()
+        x = int(self.x_shift)
+        y = int(self.y_shift)
+        screen.blit(self.baked, (x, y))
+        if x > 0:
+            screen.blit(self.baked, (x - bw, y))
+        if y > 0:
+            screen.blit(self.baked, (x, y - bh))
+            if x > 0:
+                screen.blit(self.baked, (x - bw, y - bh))
@@ -0,0 +1,114 @@
+"""제스처 판정기 마이크로 벤치마크 (카메라 없이 실행)
+
+fixtures/gesture_landmarks.json의 라벨 붙은 랜드마크로
+판정 속도(프레임당), calculate_angle 호출당 시간, 호출당 메모리 할당량, 혼동 행렬을 출력합니다.
+    python bench_classifier.py            # 결과 출력
+    python bench_classifier.py --check    # 오분류가 있으면 종료 코드 1 (배포 전 확인용)
+"""
+import argparse
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+from pose_detector import (POSE_NAMES, calculate_angle, calculate_angles, classify_batch,
+                           classify_landmarks, R_ELBOW, R_SHOULDER, R_WRIST)
+from pose_fixtures import FIXTURE_PATH, LABELS, load_fixtures
+
+LABEL_NAMES = {code: label for label, code in LABELS.items()}
+
+
+def time_per_call(func, args_list, repeat):
+    """args_list의 각 인자로 func를 repeat번 돌린 호출당 평균 시간(us)"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for args in args_list:
+            func(*args)
+    return (time.perf_counter() - start) * 1e6 / (repeat * len(args_list))
+
+
+def alloc_per_call(func, args_list):
+    """호출 1번 동안 새로 잡힌 메모리의 최대치(바이트) 평균 (tracemalloc 기준, numpy 버퍼 포함)"""
+    tracemalloc.start()
+    total = 0
+    for args in args_list:
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        func(*args)
+        _, peak = tracemalloc.get_traced_memory()
+        total += peak - before
+    tracemalloc.stop()
+    return total / len(args_list)
+
+
+def confusion_matrix(labels, predicted):
+    n = len(POSE_NAMES)
+    matrix = np.zeros((n, n), dtype=np.int64)
+    np.add.at(matrix, (labels, predicted), 1)
+    return matrix
+
+
+def run(path=FIXTURE_PATH, repeat=20):
+    names, labels, landmarks = load_fixtures(path)
+    frames = [(lm,) for lm in landmarks]
+    triplets = [(lm[R_SHOULDER, :2].tolist(), lm[R_ELBOW, :2].tolist(), lm[R_WRIST, :2].tolist()) for lm in landmarks]
+    a = landmarks[:, R_SHOULDER, :2]
+    b = landmarks[:, R_ELBOW, :2]
+    c = landmarks[:, R_WRIST, :2]
+
+    predicted = classify_batch(landmarks)
+    batch_us = time_per_call(classify_batch, [(landmarks,)], repeat) / len(landmarks)
+    angles_us = time_per_call(calculate_angles, [(a, b, c)], repeat) / len(landmarks)
+
+    return {
+        "fixtures": len(names),
+        "classify_us_per_frame": time_per_call(classify_landmarks, frames, repeat),
+        "classify_batch_us_per_frame": batch_us,
+        "calculate_angle_us_per_call": time_per_call(calculate_angle, triplets, repeat),
+        "calculate_angles_us_per_triplet": angles_us,
+        "classify_alloc_bytes_per_call": alloc_per_call(classify_landmarks, frames),
+        "calculate_angle_alloc_bytes_per_call": alloc_per_call(calculate_angle, triplets),
+        "accuracy": float((predicted == labels).mean()),
+        "confusion": confusion_matrix(labels, predicted),
+        "misclassified": [(name, LABEL_NAMES[l], LABEL_NAMES[p])
+                          for name, l, p in zip(names, labels, predicted) if l != p],
+    }
+
+
+def print_report(result):
+    print(f"fixtures: {result['fixtures']}")
+    print(f"classify_landmarks     : {result['classify_us_per_frame']:8.2f} us/frame, "
+          f"{result['classify_alloc_bytes_per_call']:8.0f} B/call")
+    print(f"classify_batch         : {result['classify_batch_us_per_frame']:8.3f} us/frame")
+    print(f"calculate_angle        : {result['calculate_angle_us_per_call']:8.2f} us/call, "
+          f"{result['calculate_angle_alloc_bytes_per_call']:8.0f} B/call")
+    print(f"calculate_angles       : {result['calculate_angles_us_per_triplet']:8.3f} us/triplet")
+    print(f"accuracy: {result['accuracy'] * 100:.1f}%")
+
+    # 혼동 행렬: 행 = 라벨, 열 = 판정 결과
+    order = list(range(len(POSE_NAMES)))
+    width = max(len(LABEL_NAMES[c]) for c in order) + 2
+    print("confusion (row = label, col = predicted):")
+    print(" " * width + "".join(f"{LABEL_NAMES[c]:>{width}}" for c in order))
+    for r in order:
+        print(f"{LABEL_NAMES[r]:<{width}}" + "".join(f"{result['confusion'][r, c]:>{width}}" for c in order))
+    for name, label, pred in result["misclassified"]:
+        print(f"  MISS {name}: expected {label}, got {pred}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="제스처 판정기 속도/정확도 벤치마크")
+    parser.add_argument("--fixtures", default=FIXTURE_PATH)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--check", action="store_true", help="오분류가 있으면 종료 코드 1")
+    args = parser.parse_args()
+
+    result = run(args.fixtures, args.repeat)
+    print_report(result)
+    if args.check and result["misclassified"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
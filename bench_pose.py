@@ -0,0 +1,94 @@
+"""녹화된 세션으로 포즈 파이프라인(캡처 -> 추론 -> 판정) 처리량을 측정하는 스크립트
+
+카메라 없이 같은 입력으로 릴리스 간 성능을 비교할 때 사용합니다.
+    python bench_pose.py session.mp4              # 최대 속도(fast)로 측정
+    python bench_pose.py frames_dir --pacing realtime --roi
+    python bench_pose.py session.mp4 --trace-alloc  # 프레임당 실제 메모리 할당량 (tracemalloc, 느려짐)
+"""
+import argparse
+import time
+import tracemalloc
+from collections import Counter
+
+from frame_source import PACING_FAST, PACING_REALTIME, VideoFileSource
+from pose_detector import PoseDetector
+
+
+WARMUP_FRAMES = 5 # 버퍼가 준비되는 첫 프레임들은 할당량 평균에서 뺌
+
+
+def run(path, pacing=PACING_FAST, roi_tracking=False, inference_size=320, max_frames=None, fps=None, trace_alloc=False):
+    source = VideoFileSource(path, pacing=pacing, fps=fps)
+    detector = PoseDetector(roi_tracking=roi_tracking, inference_size=inference_size, source=source)
+    if not detector.start():
+        return None
+
+    poses = Counter()
+    traced = [] # 프레임별 update() 동안 새로 잡힌 메모리의 최대치 (바이트, numpy/cv2 배열 포함)
+    if trace_alloc:
+        tracemalloc.start()
+    start = time.perf_counter()
+    frames = 0
+    while not source.exhausted and (max_frames is None or frames < max_frames):
+        if trace_alloc:
+            before, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+        detector.update()
+        if source.exhausted:
+            break
+        if trace_alloc:
+            _, peak = tracemalloc.get_traced_memory()
+            traced.append(peak - before)
+        frames += 1
+        poses[detector.get_current_pose()] += 1
+        detector.get_snapshot() # 게임처럼 게시된 버퍼를 받아 감
+    elapsed = time.perf_counter() - start
+    if trace_alloc:
+        tracemalloc.stop()
+    detector.stop()
+
+    steady = traced[WARMUP_FRAMES:]
+    return {
+        "frames": frames,
+        "seconds": elapsed,
+        "fps": frames / elapsed if elapsed else 0.0,
+        "ms_per_frame": elapsed * 1000 / frames if frames else 0.0,
+        "poses": dict(poses),
+        "stats": detector.get_stats(),
+        "buffers": detector.get_buffer_alloc_stats(),
+        "traced_alloc": {
+            "first_frame_bytes": traced[0] if traced else 0,
+            "avg_bytes_per_frame": sum(steady) / len(steady) if steady else 0.0,
+            "max_bytes_per_frame": max(steady, default=0),
+            "frames": len(steady),
+        } if trace_alloc else None,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="포즈 파이프라인 처리량 측정 (녹화 영상/이미지 폴더)")
+    parser.add_argument("path", help="영상 파일 또는 이미지 폴더")
+    parser.add_argument("--pacing", choices=[PACING_FAST, PACING_REALTIME], default=PACING_FAST)
+    parser.add_argument("--fps", type=float, default=None, help="이미지 폴더의 FPS (realtime 모드)")
+    parser.add_argument("--roi", action="store_true", help="ROI 추적 모드 사용")
+    parser.add_argument("--inference-size", type=int, default=320)
+    parser.add_argument("--frames", type=int, default=None, help="최대 처리 프레임 수")
+    parser.add_argument("--trace-alloc", action="store_true", help="tracemalloc으로 프레임당 실제 할당량 측정")
+    args = parser.parse_args()
+
+    result = run(args.path, args.pacing, args.roi, args.inference_size, args.frames, args.fps, args.trace_alloc)
+    if result is None:
+        print(f"Error: {args.path} could not be opened.")
+        return
+    print(f"frames: {result['frames']}  time: {result['seconds']:.2f}s  "
+          f"fps: {result['fps']:.1f}  ({result['ms_per_frame']:.2f} ms/frame)")
+    print(f"poses: {result['poses']}")
+    if result["stats"]:
+        print(f"stats: {result['stats']}")
+    print(f"buffer allocations: {result['buffers']}")
+    if result["traced_alloc"]:
+        print(f"traced allocations (tracemalloc): {result['traced_alloc']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+import pygame
+
+
+class DirtyRectRenderer:
+    """pygame.display.flip() 대신 바뀐 영역만 pygame.display.update(rects)로 내보내는 렌더러
+
+    - 매 프레임 그린 작은 요소(HUD 글자, 미니맵, 플레이어 등)의 영역을 add()로 등록
+    - 지난 프레임에 등록한 영역도 함께 내보내 이전 위치의 잔상을 지움
+    - invalidate()된 프레임이거나 바뀐 넓이가 화면의 full_ratio를 넘으면 전체 flip
+    - 아무것도 바뀌지 않은 프레임은 skip()으로 내보내기 자체를 생략
+    - partial=False면 부분 내보내기 없이 바뀐 프레임은 항상 flip (pygame.SCALED 화면은 update(rects)도
+      확대된 전체 프레임을 다시 내보내므로 영역 계산만 낭비됨)
+    """
+    def __init__(self, screen_size, full_ratio=0.5, partial=True):
+        self.screen_rect = pygame.Rect((0, 0), screen_size)
+        self.full_ratio = full_ratio
+        self.partial = partial
+        self._rects = []  # 이번 프레임에 바뀐 영역
+        self._prev = []   # 지난 프레임에 바뀐 영역
+        self._full = True
+        self.stats = {"full_flips": 0, "partial_updates": 0, "skipped": 0, "partial_area": 0}
+
+    def invalidate(self):
+        """다음 present()는 전체 flip (상태 전환, 화면 스크롤 등)"""
+        self._full = True
+
+    def add(self, rect):
+        if rect is None:
+            return
+        rect = self.screen_rect.clip(rect)
+        if rect.width and rect.height:
+            self._rects.append(rect)
+
+    def skip(self):
+        """화면이 그대로인 프레임: 그리지도 내보내지도 않음"""
+        self.stats["skipped"] += 1
+        self._rects = []
+
+    def present(self):
+        rects = self._prev + self._rects
+        area = sum(r.width * r.height for r in rects) # 겹친 부분은 중복 계산 (보수적으로 flip 쪽으로)
+        if self._full or (rects and not self.partial) or area > self.screen_rect.width * self.screen_rect.height * self.full_ratio:
+            pygame.display.flip()
+            self.stats["full_flips"] += 1
+        elif rects:
+            pygame.display.update(rects)
+            self.stats["partial_updates"] += 1
+            self.stats["partial_area"] += area
+        else:
+            self.stats["skipped"] += 1
+        self._prev = self._rects
+        self._rects = []
+        self._full = False
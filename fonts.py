@@ -0,0 +1,59 @@
+"""글꼴 로딩: pygame.font.SysFont 대신 사용
+
+SysFont는 처음 부를 때 시스템 글꼴 전체를 훑어 목록을 만듭니다 (Windows 레지스트리/fc-list, 글꼴이 많으면 수백 ms~수 초).
+이름 -> 글꼴 파일 경로를 한 번 찾으면 FONT_CACHE_PATH에 저장해 두고, 다음 실행부터는 목록을 만들지 않고 파일을 바로 엽니다.
+저장된 파일이 사라졌으면 다시 찾습니다. (글꼴을 새로 설치했다면 캐시 파일을 지우면 됨)
+"""
+import json
+import os
+
+import pygame
+
+FONT_CACHE_PATH = "font_cache.json"
+
+_paths = None # "이름|bold" -> {"path": 경로 또는 None, "fake_bold": bool}
+
+
+def _load_paths():
+    global _paths
+    if _paths is None:
+        _paths = {}
+        if os.path.exists(FONT_CACHE_PATH):
+            try:
+                with open(FONT_CACHE_PATH, "r", encoding="utf-8") as f:
+                    _paths = json.load(f)
+            except Exception as e:
+                print(f"Error: font cache could not be read: {e}")
+    return _paths
+
+
+def _save_paths():
+    try:
+        with open(FONT_CACHE_PATH, "w", encoding="utf-8") as f:
+            json.dump(_paths, f, ensure_ascii=False, indent=2)
+    except Exception as e:
+        print(f"Error: font cache could not be written: {e}")
+
+
+def _resolve(name, bold):
+    """SysFont와 같은 규칙으로 경로 결정: 굵은 글꼴 파일이 따로 없으면 보통 글꼴을 굵게 렌더링"""
+    path = pygame.font.match_font(name, bold=bold)
+    if path is None: # 글꼴 없음 -> pygame 기본 글꼴
+        return {"path": None, "fake_bold": bool(bold)}
+    fake_bold = bool(bold) and path == pygame.font.match_font(name)
+    return {"path": path, "fake_bold": fake_bold}
+
+
+def load_font(name, size, bold=False):
+    paths = _load_paths()
+    key = f"{name}|{int(bool(bold))}"
+    entry = paths.get(key)
+    if entry is None or (entry["path"] is not None and not os.path.exists(entry["path"])):
+        entry = _resolve(name, bold)
+        paths[key] = entry
+        _save_paths()
+
+    font = pygame.font.Font(entry["path"], size)
+    if entry["fake_bold"]:
+        font.set_bold(True)
+    return font
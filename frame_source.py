@@ -0,0 +1,306 @@
+"""PoseDetector가 프레임을 받아오는 입력 소스들
+
+모두 cv2.VideoCapture와 같은 방식(read / grab / isOpened / release)으로 쓸 수 있고,
+open()으로 (다시) 엽니다. 카메라 없이도 포즈 파이프라인을 돌려 보고 시간을 잴 수 있도록
+녹화 영상·이미지 폴더·합성 랜드마크 소스를 제공합니다.
+"""
+import os
+import time
+from collections import deque
+
+import cv2
+import numpy as np
+
+PACING_REALTIME = "realtime" # 원래 FPS에 맞춰 프레임 전달 (실제 게임과 같은 조건)
+PACING_FAST = "fast"         # 기다리지 않고 최대한 빨리 전달 (처리량 측정용)
+
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".bmp")
+
+
+class _Pacer:
+    """realtime 모드에서 i번째 프레임을 시작 후 i/fps 초에 내보내도록 대기"""
+    def __init__(self, fps, pacing):
+        self.period = 1.0 / fps if fps and fps > 0 else 0.0
+        self.pacing = pacing
+        self.start = None
+        self.index = 0
+
+    def reset(self):
+        self.start = None
+        self.index = 0
+
+    def wait(self):
+        if self.pacing == PACING_REALTIME and self.period:
+            now = time.perf_counter()
+            if self.start is None:
+                self.start = now
+            delay = self.start + self.index * self.period - now
+            if delay > 0:
+                time.sleep(delay)
+        self.index += 1
+
+
+class CameraSource:
+    """실제 웹캠 (기존 cv2.VideoCapture(0))
+
+    width/height/fps/fourcc/buffer_size: 드라이버에 요청할 캡처 설정 (None이면 드라이버 기본값).
+    USB 카메라는 기본적으로 몇 프레임을 내부 큐에 쌓아 두므로 read()가 100ms 넘게 지난 영상을
+    돌려줄 수 있습니다. buffer_size=1로 큐를 줄이고, latest_only=True면 쌓여 있던 프레임을
+    grab()으로 버린 뒤 가장 최근 프레임만 넘깁니다.
+    """
+    provides_landmarks = False
+
+    # grab()이 이보다 빨리 돌아오면 새 프레임을 기다린 게 아니라 큐에 쌓여 있던 프레임으로 봄 (프레임 주기 대비 비율)
+    QUEUED_GRAB_RATIO = 0.25
+    MAX_DRAIN = 8            # 한 번에 버릴 최대 프레임 수
+    STATS_WINDOW = 120       # FPS/프레임 지연 통계를 낼 최근 프레임 수
+
+    def __init__(self, index=0, width=None, height=None, fps=None, fourcc=None, buffer_size=None,
+                 latest_only=False):
+        self.index = index
+        self.name = f"Camera {index}"
+        self.width = width
+        self.height = height
+        self.fps = fps
+        self.fourcc = fourcc
+        self.buffer_size = buffer_size
+        self.latest_only = latest_only
+        self.cap = None
+
+        self.period = 1.0 / 30       # 실제 적용된 FPS 기준 프레임 주기 (open에서 갱신)
+        self.last_frame_age = 0.0    # 마지막으로 넘긴 프레임의 추정 지연 (초)
+        self.last_capture_time = None # 마지막 프레임의 추정 촬영 시각 (perf_counter)
+        self._grab_times = deque(maxlen=self.STATS_WINDOW)
+        self._ages = deque(maxlen=self.STATS_WINDOW)
+        self.drained_frames = 0
+
+    def open(self):
+        self.cap = cv2.VideoCapture(self.index)
+        if not self.cap.isOpened():
+            self.cap = None
+            return False
+        self._configure()
+        return True
+
+    def _configure(self):
+        """요청한 캡처 설정을 적용하고 실제 적용된 값을 출력 (드라이버가 무시하는 설정도 있음)"""
+        # FOURCC는 해상도보다 먼저 설정해야 MJPG 고해상도/고FPS 모드가 선택되는 드라이버가 많음
+        if self.fourcc:
+            self.cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*self.fourcc))
+        if self.width:
+            self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, self.width)
+        if self.height:
+            self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, self.height)
+        if self.fps:
+            self.cap.set(cv2.CAP_PROP_FPS, self.fps)
+        if self.buffer_size is not None:
+            self.cap.set(cv2.CAP_PROP_BUFFERSIZE, self.buffer_size)
+
+        fps = self.cap.get(cv2.CAP_PROP_FPS) or self.fps or 30
+        self.period = 1.0 / fps
+        self.last_capture_time = None
+        self._grab_times.clear()
+        self._ages.clear()
+        code = int(self.cap.get(cv2.CAP_PROP_FOURCC))
+        fourcc = "".join(chr((code >> (8 * i)) & 0xFF) for i in range(4)) if code else "?"
+        print(f"{self.name}: {int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH))}x{int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT))} "
+              f"@ {fps:.0f}fps, {fourcc}, buffer={self.cap.get(cv2.CAP_PROP_BUFFERSIZE):.0f}")
+
+    def isOpened(self):
+        return self.cap is not None and self.cap.isOpened()
+
+    def _timed_grab(self):
+        """grab() 1번. (성공 여부, 큐에 이미 있던 프레임인지) 반환하고 추정 촬영 시각을 갱신"""
+        start = time.perf_counter()
+        success = self.cap.grab()
+        now = time.perf_counter()
+        if not success:
+            return False, False
+        queued = now - start < self.period * self.QUEUED_GRAB_RATIO
+        if queued and self.last_capture_time is not None:
+            # 큐에 있던 프레임: 직전 프레임보다 한 주기 뒤에 찍혔다고 보고, 큐 길이 이상 오래되진 않았다고 가정
+            oldest = now - self.period * max(self.buffer_size or 4, 1)
+            self.last_capture_time = min(now, max(self.last_capture_time + self.period, oldest))
+        else:
+            self.last_capture_time = now # 새 프레임을 기다렸다 받음 -> 방금 찍힌 프레임
+        self._grab_times.append(now)
+        return True, queued
+
+    def read(self, image=None):
+        success, queued = self._timed_grab()
+        if self.latest_only:
+            # 큐에 쌓인 오래된 프레임은 디코딩하지 않고 버림 (grab만 하고 retrieve는 마지막 1장만)
+            drained = 0
+            while success and queued and drained < self.MAX_DRAIN:
+                success, queued = self._timed_grab()
+                drained += 1
+            self.drained_frames += drained
+        if not success:
+            return False, None
+        success, frame = self.cap.retrieve(image)
+        if success:
+            self.last_frame_age = time.perf_counter() - self.last_capture_time
+            self._ages.append(self.last_frame_age)
+        return success, frame
+
+    def grab(self):
+        return self.cap.grab()
+
+    def get_stats(self):
+        """실제 캡처 FPS(버린 프레임 포함)와 넘긴 프레임의 추정 지연(ms)"""
+        times = self._grab_times
+        capture_fps = (len(times) - 1) / (times[-1] - times[0]) if len(times) > 1 and times[-1] > times[0] else 0.0
+        ages = self._ages
+        return {
+            "capture_fps": round(capture_fps, 1),
+            "frame_age_ms": round(self.last_frame_age * 1000, 1),
+            "avg_frame_age_ms": round(sum(ages) * 1000 / len(ages), 1) if ages else 0.0,
+            "max_frame_age_ms": round(max(ages) * 1000, 1) if ages else 0.0,
+            "drained_frames": self.drained_frames,
+        }
+
+    def release(self):
+        if self.cap is not None:
+            self.cap.release()
+            self.cap = None
+
+
+class VideoFileSource:
+    """녹화 영상 파일 또는 이미지 폴더(파일명 순)를 프레임 소스로 사용"""
+    provides_landmarks = False
+
+    def __init__(self, path, pacing=PACING_REALTIME, fps=None, loop=False):
+        self.path = path
+        self.name = path
+        self.pacing = pacing
+        self.fps = fps # 이미지 폴더이거나 영상 FPS를 덮어쓸 때
+        self.loop = loop
+        self.exhausted = False # 끝까지 읽었는지 (loop=False일 때)
+
+        self.cap = None
+        self.images = None
+        self._image_index = 0
+        self._pacer = None
+
+    def open(self):
+        self.exhausted = False
+        if os.path.isdir(self.path):
+            self.images = sorted(os.path.join(self.path, f) for f in os.listdir(self.path)
+                                 if f.lower().endswith(IMAGE_EXTENSIONS))
+            self._image_index = 0
+            fps = self.fps or 30
+            opened = bool(self.images)
+        else:
+            self.cap = cv2.VideoCapture(self.path)
+            fps = self.fps or self.cap.get(cv2.CAP_PROP_FPS) or 30
+            opened = self.cap.isOpened()
+        self._pacer = _Pacer(fps, self.pacing)
+        return opened
+
+    def isOpened(self):
+        return bool(self.images) or (self.cap is not None and self.cap.isOpened())
+
+    def _rewind(self):
+        if self.images is not None:
+            self._image_index = 0
+        else:
+            self.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+        self._pacer.reset()
+
+    def read(self, image=None):
+        if self.exhausted:
+            return False, None
+        self._pacer.wait()
+        success, frame = self._read_next(image)
+        if not success and self.loop:
+            self._rewind()
+            success, frame = self._read_next(image)
+        if not success:
+            self.exhausted = True
+        return success, frame
+
+    def _read_next(self, image):
+        if self.images is None:
+            return self.cap.read(image)
+        if self._image_index >= len(self.images):
+            return False, None
+        frame = cv2.imread(self.images[self._image_index])
+        self._image_index += 1
+        if frame is None:
+            return False, None
+        if image is not None and image.shape == frame.shape:
+            np.copyto(image, frame) # 호출 측 버퍼 재사용 (VideoCapture.read와 동일한 동작)
+            return True, image
+        return True, frame
+
+    def grab(self):
+        success, _ = self.read()
+        return success
+
+    def release(self):
+        if self.cap is not None:
+            self.cap.release()
+            self.cap = None
+        self.images = None
+
+
+class SyntheticLandmarkSource:
+    """MediaPipe를 건너뛰고 미리 준비한 (33, 4) 랜드마크를 바로 넘겨주는 소스
+
+    landmarks: (F, 33, 4) 배열 또는 프레임별 배열/None(사람 없음)의 시퀀스.
+    read()는 미니맵용 빈 프레임을 돌려주고, 같은 프레임의 랜드마크는 last_landmarks에 둡니다.
+    """
+    provides_landmarks = True
+
+    def __init__(self, landmarks, pacing=PACING_REALTIME, fps=30, loop=False, frame_size=(320, 240)):
+        self.landmarks = landmarks
+        self.name = "synthetic landmarks"
+        self.pacing = pacing
+        self.fps = fps
+        self.loop = loop
+        self.frame_size = frame_size
+        self.exhausted = False
+        self.last_landmarks = None
+
+        self._index = 0
+        self._opened = False
+        self._pacer = _Pacer(fps, pacing)
+        self._blank = None
+
+    def open(self):
+        self._index = 0
+        self._opened = True
+        self.exhausted = False
+        self._pacer.reset()
+        w, h = self.frame_size
+        self._blank = np.zeros((h, w, 3), dtype=np.uint8)
+        return True
+
+    def isOpened(self):
+        return self._opened
+
+    def read(self, image=None):
+        if self.exhausted:
+            return False, None
+        if self._index >= len(self.landmarks):
+            if not self.loop or len(self.landmarks) == 0:
+                self.exhausted = True
+                return False, None
+            self._index = 0
+            self._pacer.reset()
+        self._pacer.wait()
+        lm = self.landmarks[self._index]
+        self._index += 1
+        self.last_landmarks = None if lm is None else np.asarray(lm, dtype=np.float32)
+
+        if image is not None and image.shape == self._blank.shape:
+            image[:] = 0
+            return True, image
+        return True, self._blank.copy()
+
+    def grab(self):
+        success, _ = self.read()
+        return success
+
+    def release(self):
+        self._opened = False
@@ -1,14 +1,29 @@
 from user_manager import UserManager
 import pygame
+import json
+import os
 import sys
 import random
+import threading
+import time
 import numpy as np
+from collections import deque
 
 from player import Player
 # road.py에서 방향 상수 import
 from road import RoadSegment, DIR_UP, DIR_DOWN, DIR_LEFT, DIR_RIGHT 
-from pose_detector import PoseDetector
+# pose_detector(cv2, mediapipe)와 frame_source는 무거워서 로딩 스레드에서 import (load_pose_detector)
+from pose_types import MODE_THREAD, PoseBudget
 from background import Background
+from grader import StreamingGrader
+from latency import LatencyTracker
+from dirty_rects import DirtyRectRenderer
+from text_cache import TextCache
+from timestep import FixedTimestep
+from fonts import load_font
+from startup import StartupTimer
+from asset_pack import AssetPack, entry_name, source_signature
+from track import TrackPlan
 
 class Game:
     STATE_MENU = 0
@@ -23,26 +38,104 @@ class Game:
     
     MISSIONS = ["좌회전", "우회전", "정지"] 
 
-    def draw_login_menu(self):
+    COLORS = {
+        "dark_blue": (44, 62, 80), "white": (255, 255, 255),
+        "green": (46, 204, 113), "red": (231, 76, 60),
+        "yellow": (241, 196, 15), "blue": (52, 152, 219),
+        "road_gray": (50, 50, 60), "black" : (40, 40, 40)
+    }
+
+    # 포즈 인식 실행 방식: MODE_THREAD(기본) / MODE_PROCESS(추론을 별도 프로세스·코어에서) / MODE_SYNC
+    POSE_MODE = MODE_THREAD
+    # ROI 추적 모드: 직전 프레임의 몸 주변만 잘라 POSE_INFERENCE_SIZE(긴 변 px) 이하로 축소해 추론
+    POSE_ROI_TRACKING = False
+    POSE_INFERENCE_SIZE = 320
+    # 카메라 캡처 설정 (None이면 드라이버 기본값). MJPG + 버퍼 1장 + 최신 프레임만 사용으로 입력 지연을 줄임
+    CAMERA_INDEX = 0
+    CAMERA_WIDTH = 640
+    CAMERA_HEIGHT = 480
+    CAMERA_FPS = 30
+    CAMERA_FOURCC = "MJPG"
+    CAMERA_BUFFER_SIZE = 1
+    CAMERA_LATEST_ONLY = True
+    # 웹캠 미니맵 크기 (W, H): 포즈 워커가 이 크기로 미리 줄여 게시하므로 화면에는 그대로 올리기만 함
+    MINIMAP_SIZE = (300, 200)
+
+    # 채점: 미션 안내 후 LAG 동안은 준비 시간, 이후 StreamingGrader가 결과가 확정되는 즉시 종료
+    GRADING_LAG_TIME = 1500
+    GRADING_MIN_PASS_TIME = 1000  # 이보다 빨리 성공 처리하지 않음 (0.5초 자세 하나로 확정되지 않도록)
+    GRADING_MIN_FAIL_TIME = 1500  # 이보다 빨리 실패 처리하지 않음
+    GRADING_MAX_TIME = 2000       # 기존 채점 창 길이 (이때까지 확정 안 되면 정답 비율 0.4로 판정)
+
+    # 시뮬레이션은 SIM_HZ 고정 간격으로 돌리고, 렌더링은 RENDER_FPS(0이면 제한 없음)까지 보간해서 그림
+    SIM_HZ = 30
+    RENDER_FPS = 60
+    MAX_SIM_STEPS = 5 # 한 프레임이 크게 밀려도 이만큼만 따라잡음
+    BASE_SPEED = 450  # 주행 속도 (px/초, 기존 30fps x 15px)
+
+    # 내부 렌더링 해상도: 화면 세로가 RENDER_HEIGHT보다 크면 이 높이(가로는 모니터 비율대로)로 그리고
+    # pygame.SCALED로 한 번에 확대해 표시 (4K에서 매 blit이 건드리는 픽셀 수를 줄임, None이면 항상 원래 해상도)
+    RENDER_HEIGHT = 1080
+
+    # 렌더링: True면 바뀐 영역만 화면에 내보냄 (display.update(rects)).
+    # 바뀐 넓이가 화면의 DIRTY_FULL_RATIO를 넘거나 화면 구성이 바뀌면 전체 flip
+    # SCALED 화면에서는 update(rects)도 전체 프레임을 내보내므로 부분 내보내기는 끄고
+    # 바뀐 게 없는 정적 화면을 건너뛰는 것만 남김
+    RENDER_DIRTY_RECTS = True
+    DIRTY_FULL_RATIO = 0.5
+    # 한 번 그리면 입력이 있기 전까지 바뀌지 않는 화면
+    STATIC_STATES = (STATE_LOGIN, STATE_MENU, STATE_HELP, STATE_RANKING, STATE_PAUSE)
+
+    # 에셋 팩: 내부 해상도별로 크기 조정/회전까지 끝난 이미지를 ASSET_PACK_DIR에 구워 두고 다음 실행부터 mmap으로 사용
+    # (원본 PNG나 해상도가 바뀌면 자동으로 다시 구움, 이미지 가공 코드를 바꿨다면 ASSET_PACK_VERSION을 올릴 것)
+    ASSET_PACK = True
+    ASSET_PACK_DIR = "assets/packs"
+    ASSET_PACK_VERSION = 2
+
+    # 렌더링한 글자 Surface 캐시 크기 (랭킹 화면 30여 개 + HUD + 로그인 입력을 넉넉히 담음)
+    TEXT_CACHE_SIZE = 256
+
+    # 제스처 입력 지연 리포트 (game_over 때마다 단계별 p50/p95/p99를 기록)
+    LATENCY_REPORT_PATH = "latency_report.json"
+    # 마지막 게임 세션 기록 (시드 + 채점에 들어간 포즈의 틱): sim_replay.py로 헤드리스에서 똑같이 재생
+    SESSION_RECORD_PATH = "last_session.json"
+
+    # 상태별 포즈 인식 예산: 채점 중에만 최대 속도, 주행 중엔 미니맵용으로 낮춘 속도,
+    # 메뉴류 화면에선 일시정지하고 오래 머물면 카메라까지 해제 (start_game에서 warm_start로 다시 켬)
+    POSE_SCHEDULE = {
+        STATE_GRADING: PoseBudget(),
+        STATE_PLAYING: PoseBudget(rate=10),
+        STATE_RESULT_ANIM: PoseBudget(rate=10),
+        STATE_GAMEOVER: PoseBudget(rate=5),
+        STATE_PAUSE: PoseBudget(rate=0),
+        STATE_LOGIN: PoseBudget(rate=0, release_after=60),
+        STATE_MENU: PoseBudget(rate=0, release_after=60),
+        STATE_HELP: PoseBudget(rate=0, release_after=60),
+        STATE_RANKING: PoseBudget(rate=0, release_after=60),
+    }
+
+    def compose_login_menu(self, surface):
         # 1) 배경
-        self.screen.blit(self.bg_main, (0, 0))
-        self.screen.blit(self.title_banner, self.title_banner_rect)
+        surface.blit(self.bg_main, (0, 0))
+        surface.blit(self.title_banner, self.title_banner_rect)
 
         # 2) EMAIL 입력 박스
-        self.screen.blit(self.img_email_box, self.email_rect)
+        surface.blit(self.img_email_box, self.email_rect)
 
 
         # 3) PASSWORD 입력 박스(PNG)
-        self.screen.blit(self.img_pw_box, self.pw_rect)
-
-        hidden_pw = "*" * len(self.login_pw) if self.login_pw else "Password"
+        surface.blit(self.img_pw_box, self.pw_rect)
 
 
         # 4) LOGIN 버튼(PNG)
-        self.screen.blit(self.img_login_btn, self.btn_login_rect)
+        surface.blit(self.img_login_btn, self.btn_login_rect)
 
         # 5) SIGNUP 버튼(PNG)
-        self.screen.blit(self.img_signup_btn, self.btn_signup_rect)
+        surface.blit(self.img_signup_btn, self.btn_signup_rect)
+
+    def draw_login_menu(self):
+        # 1)~5) 배경/입력 박스/버튼은 한 장으로 구워 둔 것 사용
+        self.screen.blit(self.cached_screen("login", (), self.compose_login_menu), (0, 0))
 
         if self.login_email:
             self.draw_text(
@@ -74,150 +167,304 @@ class Game:
                 self.btn_login_rect.bottom + 60,
             )
 
-    def __init__(self):
-        pygame.mixer.init()
-        pygame.init()
+    def create_display(self, native_w, native_h):
+        """전체 화면 생성. 내부 해상도가 모니터보다 작으면 SCALED 모드로 만들어
+        그리는 쪽(SCREEN_WIDTH/HEIGHT, UI 배치, 마우스 좌표)은 모두 내부 해상도 기준이 됨"""
+        if self.RENDER_HEIGHT and native_h > self.RENDER_HEIGHT:
+            size = (round(native_w * self.RENDER_HEIGHT / native_h), self.RENDER_HEIGHT)
+            try:
+                screen = pygame.display.set_mode(size, pygame.FULLSCREEN | pygame.SCALED)
+                self.display_scaled = True
+                print(f"Render resolution: {size[0]}x{size[1]} (scaled to {native_w}x{native_h})")
+                return screen
+            except pygame.error as e:
+                print(f"Error: scaled display unavailable, using native resolution: {e}")
+        return pygame.display.set_mode((native_w, native_h), pygame.FULLSCREEN)
+
+    def __init__(self, headless=False, seed=None, screen_size=None, pose_factory=None):
+        """headless: SDL dummy 드라이버로 창 없이 실행 (지연 리포트/세션 기록을 쓰지 않음, sim_replay.py에서 사용)
+        seed: 도로 생성 시드 (None이면 게임마다 새로 뽑아 세션 기록에 남김)
+        screen_size: 화면(내부 렌더링) 크기 지정 (None이면 모니터에 맞춤)
+        pose_factory: game을 받아 PoseDetector 대신 쓸 객체를 만드는 함수 (예: ScriptedPoseDetector)"""
+        # 로그인 화면에 필요한 것만 먼저 준비해 바로 띄우고, 나머지(포즈 인식, 카메라, 다른 화면 이미지)는
+        # 로딩 스레드가 이어서 불러옴 (load_in_background). 단계별 소요 시간은 self.startup에 기록
+        self.headless = headless
+        self.seed = seed
+        self.pose_factory = pose_factory
+        if headless:
+            os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+            os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+        self.startup = StartupTimer()
+        with self.startup.phase("pygame_init"):
+            pygame.mixer.init()
+            pygame.init()
         info = pygame.display.Info()     
-        self.screen = pygame.display.set_mode((info.current_w, info.current_h), pygame.FULLSCREEN)
+        self.display_scaled = False # create_display가 SCALED 화면을 만들면 True
+        with self.startup.phase("display"):
+            if screen_size:
+                self.screen = pygame.display.set_mode(screen_size)
+            else:
+                self.screen = self.create_display(info.current_w, info.current_h)
         
         self.SCREEN_WIDTH, self.SCREEN_HEIGHT = self.screen.get_size()
 
         
         pygame.display.set_caption("SignalSmart Final Count (v21)")
         self.clock = pygame.time.Clock()
+        self.timestep = FixedTimestep(self.SIM_HZ, self.MAX_SIM_STEPS)
+
+        with self.startup.phase("asset_pack"):
+            self.assets = AssetPack(self.asset_pack_path(), self.asset_pack_key()) if self.ASSET_PACK else AssetPack()
+        with self.startup.phase("login_assets"):
+            self.load_login_assets()
+
+        with self.startup.phase("fonts"):
+            self.load_fonts()
+
+        # 로그인 시스템 초기화
+        self.user_manager = UserManager()
+
+        self.logged_in = False
+        self.login_email = ""
+        self.login_pw = ""
+        self.login_message = ""
+        self.is_register_mode = False
+        self.is_typing_pw = False
+        # 게임 시작 상태를 로그인 화면으로 설정
+        self.game_state = self.STATE_LOGIN
+
+
+        # 웹캠 미니맵 (매 프레임 새로 만들지 않고 재사용, 새 프레임이 게시됐을 때만 갱신)
+        self.minimap_surface = pygame.Surface(self.MINIMAP_SIZE)
+        self.minimap_generation = -1
+        # 캡처 -> 판정 -> 게임 반영까지 단계별 지연 (self.latency.percentiles()로 조회)
+        self.latency = LatencyTracker()
+        self.minimap_stats = {"uploads": 0, "skipped": 0, "fallbacks": 0, "fallback_ms": 0.0, "errors": 0}
+
+        self.renderer = DirtyRectRenderer((self.SCREEN_WIDTH, self.SCREEN_HEIGHT), self.DIRTY_FULL_RATIO,
+                                          partial=not self.display_scaled)
+        self.last_screen_key = None
+        self.text_cache = TextCache(self.TEXT_CACHE_SIZE)
+        # 메뉴/도움말/랭킹/일시정지/로그인 배경처럼 정적인 화면을 구워 둔 Surface (이름 -> (deps, Surface))
+        self.screen_cache = {}
+        self.screen_cache_stats = {"bakes": 0, "hits": 0}
+        # 화면 밖 도로 조각은 그리지 않음 (culled_last_frame: 지난 프레임에 아낀 blit 수)
+        self.cull_stats = {"drawn": 0, "culled": 0, "culled_last_frame": 0}
+        self.road_segments = pygame.sprite.Group()
+        
+        # ★★★ 추가: 생성된 도로 순서 관리용 (앞에서 빼므로 deque) ★★★
+        self.generated_roads = deque()
+        
+        # --- 큐 변수 ---
+        self.map_queue = deque()
+        self.logical_direction = DIR_UP 
+        # 도로 계획: 타일 격자 위에 미리 깔아 보고 이미 있는 도로와 겹치는 굽은 길은 버림 (start_game에서 시드로 생성)
+        self.track = None
+        self.track_origin = (0, 0) # 시작 조각(타일 (0, 0))의 월드 중심 좌표
+        self.removed_segments = 0  # cleanup_segments로 지운 앞쪽 조각 수 (= 남은 첫 조각의 트랙 번호)
+        
+        # self.game_state = self.STATE_MENU
+        self.score = 0
+        self.mistakes = 0
+        self.current_mission = ""
+        self.result_text = ""
+        self.grader = StreamingGrader(min_pass_ms=self.GRADING_MIN_PASS_TIME,
+                                      min_fail_ms=self.GRADING_MIN_FAIL_TIME,
+                                      max_window_ms=self.GRADING_MAX_TIME)
+        self.grading_started = False
+        self.last_pose_generation = 0 # 같은 포즈 결과를 두 번 세지 않도록
+        # 게임 시간은 시뮬레이션 틱으로 셈 (now_ms): 같은 시드와 같은 틱의 포즈 입력이면 결과가 항상 같음
+        self.sim_ticks = 0
+        self.rng = random.Random()
+        self.session_seed = None
+        self.session_start_tick = 0
+        self.session_poses = [] # [(세션 틱, 포즈 이름), ...] 채점에 들어간 포즈
+        self.game_over_tick = None
+        self.last_state_change_time = 0
+        self.active_mission_segment = None
+        self.player_direction = DIR_UP 
+        self.base_speed = self.BASE_SPEED
+        self.world_velocity = [0, -self.base_speed] # px/초
+        # 카메라(화면 왼쪽 위)의 월드 좌표: 도로는 월드 좌표에 고정, 스크롤은 이 값만 바꿈
+        self.camera_pos = [0.0, 0.0]
+        self.prev_camera_pos = [0.0, 0.0] # 직전 틱의 카메라 위치 (렌더링 보간용)
+        self.last_spawned_segment = None
+
+        # 로딩 스레드가 채우는 것: pose_detector, 메뉴/랭킹/도움말/일시정지 이미지, background, 도로 이미지, player
+        self.pose_detector = None
+        self.loaded = False
+        self.load_progress = 0.0
+        self.load_phase = ""
+        self.load_error = None
+        self.first_frame_shown = False
+        self.startup_reported = False
+        self.loader = threading.Thread(target=self.load_in_background, name="AssetLoader", daemon=True)
+        self.loader.start()
+
+    def asset_pack_path(self):
+        return f"{self.ASSET_PACK_DIR}/{self.SCREEN_WIDTH}x{self.SCREEN_HEIGHT}.pack"
+
+    def asset_pack_key(self):
+        """이 값이 팩을 만들 때와 같아야 팩을 사용 (해상도, 타일 크기, 원본 PNG, 버전)"""
+        return {
+            "version": self.ASSET_PACK_VERSION,
+            "size": [self.SCREEN_WIDTH, self.SCREEN_HEIGHT],
+            "tile_size": RoadSegment.TILE_SIZE,
+            "sources": source_signature("assets"),
+        }
 
+    def load_image(self, path, size=None, alpha=True):
+        """assets 이미지 로드 (+ size로 크기 조정). 에셋 팩에 있으면 디코딩/크기 조정 없이 팩에서 가져옴"""
+        def make():
+            image = pygame.image.load(path)
+            image = image.convert_alpha() if alpha else image.convert()
+            return pygame.transform.scale(image, size) if size else image
+        return self.assets.surface(entry_name(path, size, alpha=alpha), make)
+
+    def load_login_assets(self):
         # 배경 이미지 로딩
-        original_image = pygame.image.load("assets/ui/main_bg.png").convert()
-        self.bg_main = pygame.transform.scale(original_image, (self.SCREEN_WIDTH, self.SCREEN_HEIGHT))
+        self.bg_main = self.load_image("assets/ui/main_bg.png", (self.SCREEN_WIDTH, self.SCREEN_HEIGHT), alpha=False)
 
         # 타이틀 이미지(투명 PNG)
-        self.title_banner = pygame.image.load("assets/ui/title_banner.png").convert_alpha()
+        self.title_banner = self.load_image("assets/ui/title_banner.png")
         # 타이틀 이미지 위치 설정
         self.title_banner_rect = self.title_banner.get_rect(center=(self.SCREEN_WIDTH // 2, 200))
 
+        # 로그인 UI 이미지 로딩
+        self.img_email_box = self.load_image("assets/ui/btn_email.png")
+        self.img_pw_box = self.load_image("assets/ui/btn_password.png")
+        self.img_login_btn = self.load_image("assets/ui/btn_login.png")
+        self.img_signup_btn = self.load_image("assets/ui/btn_SIGNUP.png")
+
+        # 로그인 UI 좌표 설정
+        self.email_rect = self.img_email_box.get_rect(
+            center=(self.SCREEN_WIDTH // 2, 440)
+        )
+        self.pw_rect = self.img_pw_box.get_rect(
+            center=(self.SCREEN_WIDTH // 2, 540)
+        )
+        self.btn_login_rect = self.img_login_btn.get_rect(
+            center=(self.SCREEN_WIDTH // 2 - 180, 670)
+        )
+        self.btn_signup_rect = self.img_signup_btn.get_rect(
+            center=(self.SCREEN_WIDTH // 2 + 180, 670)
+        )
+
+    def load_fonts(self):
+        self.font_large = load_font("malgungothic", 60, bold=True)
+        self.font_medium = load_font("malgungothic", 36, bold=True)
+        self.font_small = load_font("malgungothic", 24)
+
+        base_h = self.SCREEN_HEIGHT
+
+        self.font_rank = load_font("malgungothic", int(base_h * 0.035), bold=True)
+
+    def load_ui_assets(self):
+        """로그인 이후 화면(메뉴/랭킹/도움말/일시정지)에 쓰는 이미지"""
         # 게임 시작 버튼 이미지 로딩
-        self.btn_start = pygame.image.load("assets/ui/btn_start.png").convert_alpha()
+        self.btn_start = self.load_image("assets/ui/btn_start.png")
         # 시작 버튼 위치 설정
         self.btn_start_rect = self.btn_start.get_rect(center=(self.SCREEN_WIDTH // 2, 540))
 
         # 랭킹 버튼 이미지 로딩
-        self.btn_ranking = pygame.image.load("assets/ui/btn_ranking.png").convert_alpha()
+        self.btn_ranking = self.load_image("assets/ui/btn_ranking.png")
         # 랭킹 버튼 위치 설정
         self.btn_ranking_rect = self.btn_ranking.get_rect(center=(self.SCREEN_WIDTH // 1.5, 680)) 
 
-        # 랭킹 배경 이미지 로딩
-        self.ranking_bg = pygame.image.load("assets/ui/ranking_bg.png").convert_alpha()
-        # 랭킹 배경 확장
-        self.ranking_bg = pygame.transform.scale(self.ranking_bg, (self.SCREEN_WIDTH, self.SCREEN_HEIGHT))
+        # 랭킹 배경 이미지 로딩 (화면 크기로 확장)
+        self.ranking_bg = self.load_image("assets/ui/ranking_bg.png", (self.SCREEN_WIDTH, self.SCREEN_HEIGHT))
         
         # 랭킹 목록 이미지 로딩
-        self.ranking_table = pygame.image.load("assets/ui/ranking_table.png").convert_alpha()
         # 화면 너비의 76% 크기로 스케일
         new_width = int(self.SCREEN_WIDTH * 0.76)
+        def make_ranking_table():
+            table = pygame.image.load("assets/ui/ranking_table.png").convert_alpha()
+            # 테이블 원본 비율 유지
+            orig_w, orig_h = table.get_size()
+            new_height = int(orig_h * (new_width / orig_w))
+            return pygame.transform.scale(table, (new_width, new_height))
+        # 높이는 원본 비율로 정해지므로 이름에는 너비만
+        self.ranking_table = self.assets.surface(entry_name("assets/ui/ranking_table.png", (new_width,)), make_ranking_table)
 
         # 랭킹 페이지 내 뒤로가기 버튼
-        self.btn_back_rank = pygame.image.load("assets/ui/btn_back.png").convert_alpha()
+        self.btn_back_rank = self.load_image("assets/ui/btn_back.png")
         # 뒤로가기 버튼 배치
         self.btn_back_rank_rect = self.btn_back_rank.get_rect(center = (80, 80))
 
-        # 테이블 원본 비율 유지
-        orig_w, orig_h = self.ranking_table.get_size()
-        new_height = int(orig_h * (new_width / orig_w))
-
-        self.ranking_table = pygame.transform.scale(self.ranking_table, (new_width, new_height))
-
         self.ranking_table_rect = self.ranking_table.get_rect(center=(self.SCREEN_WIDTH // 2, self.SCREEN_HEIGHT * 0.42))
 
         # 수신호 교육 버튼 이미지 로딩
-        self.btn_tutorial = pygame.image.load("assets/ui/btn_tutorial.png").convert_alpha()
+        self.btn_tutorial = self.load_image("assets/ui/btn_tutorial.png")
         # 수신호 교육 버튼 위치 설정
         self.btn_tutorial_rect = self.btn_tutorial.get_rect(center=(self.SCREEN_WIDTH // 3.14, 680))
 
         # 수신호 팝업 이미지 로딩
-        self.help_img = pygame.image.load("assets/ui/help_popup.png").convert_alpha()
+        self.help_img = self.load_image("assets/ui/help_popup.png")
         self.help_img_rect = self.help_img.get_rect(center=(self.SCREEN_WIDTH // 2, self.SCREEN_HEIGHT // 2))
 
         # Pause 화면 버튼들
-        self.btn_resume = pygame.image.load("assets/ui/btn_resume.png").convert_alpha()
+        self.btn_resume = self.load_image("assets/ui/btn_resume.png")
         self.btn_resume_rect = self.btn_resume.get_rect(center=(self.SCREEN_WIDTH // 2, self.SCREEN_HEIGHT // 2 - 80))
 
-        self.btn_quit_game = pygame.image.load("assets/ui/btn_quit.png").convert_alpha()
+        self.btn_quit_game = self.load_image("assets/ui/btn_quit.png")
         self.btn_quit_game_rect = self.btn_quit_game.get_rect(center=(self.SCREEN_WIDTH // 2, self.SCREEN_HEIGHT // 2 + 80))
 
-        # 로그인 UI 이미지 로딩
-        self.img_email_box = pygame.image.load("assets/ui/btn_email.png").convert_alpha()
-        self.img_pw_box = pygame.image.load("assets/ui/btn_password.png").convert_alpha()
-        self.img_login_btn = pygame.image.load("assets/ui/btn_login.png").convert_alpha()
-        self.img_signup_btn = pygame.image.load("assets/ui/btn_signup.png").convert_alpha()
-
-        # 로그인 UI 좌표 설정
-        self.email_rect = self.img_email_box.get_rect(
-            center=(self.SCREEN_WIDTH // 2, 440)
-        )
-        self.pw_rect = self.img_pw_box.get_rect(
-            center=(self.SCREEN_WIDTH // 2, 540)
-        )
-        self.btn_login_rect = self.img_login_btn.get_rect(
-            center=(self.SCREEN_WIDTH // 2 - 180, 670)
-        )
-        self.btn_signup_rect = self.img_signup_btn.get_rect(
-            center=(self.SCREEN_WIDTH // 2 + 180, 670)
-        )
-
-
-        self.COLORS = {
-            "dark_blue": (44, 62, 80), "white": (255, 255, 255),
-            "green": (46, 204, 113), "red": (231, 76, 60),
-            "yellow": (241, 196, 15), "blue": (52, 152, 219),
-            "road_gray": (50, 50, 60), "black" : (40, 40, 40)
-        }
-        self.font_large = pygame.font.SysFont("malgungothic", 60, bold=True)
-        self.font_medium = pygame.font.SysFont("malgungothic", 36, bold=True)
-        self.font_small = pygame.font.SysFont("malgungothic", 24)
-
-        base_h = self.SCREEN_HEIGHT
-
-        self.font_rank = pygame.font.SysFont("malgungothic", int(base_h * 0.035), bold=True)
-
-        # 로그인 시스템 초기화
-        self.user_manager = UserManager()
-
-        self.logged_in = False
-        self.login_email = ""
-        self.login_pw = ""
-        self.login_message = ""
-        self.is_register_mode = False
-        self.is_typing_pw = False
-        # 게임 시작 상태를 로그인 화면으로 설정
-        self.game_state = self.STATE_LOGIN
-
-
-        self.pose_detector = PoseDetector() 
-        self.pose_detector.start()
-        
+    def load_game_assets(self):
         self.background = Background(self)
+        RoadSegment.preload(self) # 도로 이미지는 한 번만 만들어 모든 조각이 공유
         self.player = Player(self)
-        self.road_segments = pygame.sprite.Group()
-        
-        # ★★★ 추가: 생성된 도로 순서 관리용 리스트 ★★★
-        self.generated_roads = []
-        
-        # --- 큐 변수 ---
-        self.map_queue = [] 
-        self.logical_direction = DIR_UP 
-        
-        # self.game_state = self.STATE_MENU
-        self.score = 0
-        self.mistakes = 0
-        self.current_mission = ""
-        self.result_text = ""
-        self.pose_buffer = []
-        self.last_state_change_time = 0
-        self.active_mission_segment = None
-        self.player_direction = DIR_UP 
-        self.base_speed = 15 
-        self.world_velocity = [0, -self.base_speed] 
-        self.last_spawned_segment = None
+
+    def load_pose_detector(self):
+        if self.pose_factory: # 헤드리스/재생: 카메라 없이 대본대로 포즈 게시
+            pose_detector = self.pose_factory(self)
+            pose_detector.start()
+            self.pose_detector = pose_detector
+            return
+
+        from frame_source import CameraSource
+        from pose_detector import PoseDetector
+
+        # 스레드/프로세스 모드: 캡처/추론은 워커가 담당하고 렌더링 루프는 카메라를 기다리지 않음
+        camera = CameraSource(self.CAMERA_INDEX, width=self.CAMERA_WIDTH, height=self.CAMERA_HEIGHT, fps=self.CAMERA_FPS,
+                              fourcc=self.CAMERA_FOURCC, buffer_size=self.CAMERA_BUFFER_SIZE,
+                              latest_only=self.CAMERA_LATEST_ONLY)
+        pose_detector = PoseDetector(mode=self.POSE_MODE, roi_tracking=self.POSE_ROI_TRACKING,
+                                     inference_size=self.POSE_INFERENCE_SIZE, source=camera,
+                                     minimap_size=self.MINIMAP_SIZE)
+        pose_detector.set_schedule(self.POSE_SCHEDULE)
+        pose_detector.apply_schedule(self.game_state)
+        pose_detector.start()
+        self.pose_detector = pose_detector # 시작까지 끝난 뒤에 공개 (메인 루프는 None이면 건너뜀)
+
+    def load_in_background(self):
+        """로딩 스레드: 단계마다 load_progress(0~1)와 load_phase를 갱신하고, 모두 끝나면 loaded = True
+        실패하면 load_error에 남기고 loaded는 False로 둠 (메인 루프가 로딩 화면에 오류를 표시, ESC로 종료)"""
+        steps = [
+            ("ui_assets", self.load_ui_assets),
+            ("game_assets", self.load_game_assets),
+            ("pose_detector", self.load_pose_detector), # mediapipe import + 모델 로딩 + 카메라 열기 (가장 느림)
+        ]
+        for i, (name, load) in enumerate(steps):
+            self.load_phase = name
+            try:
+                with self.startup.phase(name):
+                    load()
+            except Exception as e:
+                print(f"Error: loading {name} failed: {e}")
+                self.load_error = f"{name}: {e}"
+                return
+            self.load_progress = (i + 1) / len(steps)
+        # 팩이 없거나 오래된 경우: 이번에 만든 이미지로 팩을 구워 둠 (다음 실행부터 사용)
+        # 팩 파일을 읽고 쓰는 동안 메인 스레드가 에셋을 쓰지 않도록 loaded = True 전에 끝냄
+        if self.assets.recorded:
+            self.load_phase = "asset_pack_save"
+            try:
+                with self.startup.phase("asset_pack_save"):
+                    self.assets.save()
+            except Exception as e: # 팩은 다음 실행에 다시 구우면 되므로 로딩은 계속
+                print(f"Error: saving asset pack failed: {e}")
+        self.startup.mark("ready")
+        self.loaded = True
 
 
     def process_auth(self):
@@ -247,6 +494,12 @@ class Game:
         while running:
             for event in pygame.event.get():
 
+                # 로딩이 끝나기 전에는 로그인 화면 입력과 종료(ESC)만 받음 (메뉴 등은 로딩 화면)
+                if not self.loaded and self.game_state != self.STATE_LOGIN:
+                    if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+                        running = False
+                    continue
+
                 # --- HELP 팝업 상태 우선 처리 ---
                 if self.game_state == self.STATE_HELP:
                     # 클릭하면 팝업 닫기
@@ -265,8 +518,7 @@ class Game:
 
                     # 플레이 중 ESC → 일시정지
                     if self.game_state == self.STATE_PLAYING:
-                        pygame.mixer.music.pause()
-                        self.game_state = self.STATE_PAUSE
+                        self.pause_game()
                         continue
 
                     # 메뉴에서 ESC → 프로그램 종료
@@ -372,8 +624,7 @@ class Game:
 
                         # Resume 버튼
                         if self.btn_resume_rect.collidepoint(mouse_pos):
-                            pygame.mixer.music.unpause()
-                            self.game_state = self.STATE_PLAYING
+                            self.resume_game()
                             continue
 
                         # Quit 버튼
@@ -385,49 +636,49 @@ class Game:
                     continue
 
             
-            self.pose_detector.update()
+            if self.pose_detector: # 로딩 스레드가 아직 만드는 중이면 None
+                self.pose_detector.apply_schedule(self.game_state)
+                self.pose_detector.update() # 스레드 모드에서는 즉시 반환
             
-            if self.game_state == self.STATE_PLAYING:
-                self.update_playing()
-            elif self.game_state == self.STATE_GRADING:
-                self.update_grading()
-            elif self.game_state == self.STATE_RESULT_ANIM:
-                self.update_result_animation()
-            elif self.game_state == self.STATE_GAMEOVER:
-                self.update_gameover()
+            # 흐른 시간만큼 고정 간격 틱을 실행 (렌더링이 밀려도 주행 속도는 그대로)
+            for _ in range(self.timestep.advance()):
+                self.update_simulation()
                 
-            self.draw()
-            pygame.display.flip()
-            self.clock.tick(30) 
-
-        self.pose_detector.stop()
+            self.render_frame()
+            if not self.first_frame_shown:
+                self.startup.mark("first_frame")
+                self.first_frame_shown = True
+            elif self.loaded and not self.startup_reported:
+                self.startup.report() # 첫 화면 표시와 로딩이 모두 끝난 뒤 한 번
+                self.startup_reported = True
+            self.clock.tick(self.RENDER_FPS) 
+
+        self.loader.join(timeout=5) # 로딩 중 종료: 카메라가 열린 뒤에 해제되도록 기다림
+        if self.pose_detector:
+            print(f"Pose stats: {self.pose_detector.get_stats()}")
+            self.pose_detector.stop()
+        print(f"Minimap stats: {self.minimap_stats}")
+        print(f"Render stats: {self.renderer.stats}")
+        print(f"Text cache stats: {self.text_cache.get_stats()}")
+        print(f"Road cull stats: {self.cull_stats}")
+        print(f"Screen cache stats: {self.screen_cache_stats}")
+        print(f"Asset pack stats: {self.assets.get_stats()}")
+        if self.track:
+            print(f"Track stats: {self.track.stats}")
+        print(f"Frame pacing stats: {self.timestep.get_stats()}")
         pygame.quit()
         sys.exit()
 
     def fill_map_queue(self):
         while len(self.map_queue) < 20:
-            count = random.randint(3, 6) 
-            for _ in range(count):
-                self.map_queue.append('straight')
-            
-            mission = random.choice(['left_turn', 'right_turn', 'stop_signal'])
-            self.map_queue.append(mission)
-            
-            if mission == 'left_turn':
-                if self.logical_direction == DIR_UP: self.logical_direction = DIR_LEFT
-                elif self.logical_direction == DIR_LEFT: self.logical_direction = DIR_DOWN
-                elif self.logical_direction == DIR_DOWN: self.logical_direction = DIR_RIGHT
-                elif self.logical_direction == DIR_RIGHT: self.logical_direction = DIR_UP
-            elif mission == 'right_turn':
-                if self.logical_direction == DIR_UP: self.logical_direction = DIR_RIGHT
-                elif self.logical_direction == DIR_RIGHT: self.logical_direction = DIR_DOWN
-                elif self.logical_direction == DIR_DOWN: self.logical_direction = DIR_LEFT
-                elif self.logical_direction == DIR_LEFT: self.logical_direction = DIR_UP
+            # 직진 3~6개 + 미션 1개 블록 (겹치지 않는 자리로 계획된 것)
+            self.map_queue.extend(self.track.next_block())
+        self.logical_direction = self.track.direction
 
     def spawn_from_queue(self):
         if not self.map_queue: return
 
-        segment_type = self.map_queue.pop(0)
+        segment_type = self.map_queue.popleft()
         new_segment = RoadSegment(self, segment_type, self.last_spawned_segment)
         
         self.road_segments.add(new_segment)
@@ -436,12 +687,62 @@ class Game:
         
         self.last_spawned_segment = new_segment
 
+    def player_track_index(self):
+        """플레이어가 서 있는 타일의 트랙 조각 번호 (도로 밖이면 None)"""
+        x, y = self.player_world_pos()
+        tile = RoadSegment.TILE_SIZE
+        return self.track.index_at(round((x - self.track_origin[0]) / tile),
+                                   round((y - self.track_origin[1]) / tile))
+
     def cleanup_segments(self):
         """★ 수정됨: 리스트 개수 기반으로 정확하게 삭제 ★"""
-        # 도로가 20개를 넘으면 가장 오래된 것(리스트의 0번째)을 삭제
+        # 도로가 20개를 넘으면 가장 오래된 것(deque의 0번째)을 삭제
+        # 단, 플레이어가 지나온 조각만 (앞쪽 도로가 많이 생성돼도 다가올 미션 조각을 지우지 않도록)
+        player_index = self.player_track_index()
         while len(self.generated_roads) > 20:
-            old_segment = self.generated_roads.pop(0) # 리스트에서 제거
+            if player_index is None or self.removed_segments >= player_index - 1:
+                break
+            old_segment = self.generated_roads.popleft()
             old_segment.kill() # 스프라이트 그룹에서 제거 (화면에서 사라짐)
+            self.removed_segments += 1
+        # 지운 조각의 타일은 다시 도로를 놓을 수 있게 풀어 줌
+        self.track.release(self.removed_segments)
+
+    def update_simulation(self):
+        """고정 간격(1/SIM_HZ초) 시뮬레이션 틱 1번"""
+        self.prev_camera_pos[:] = self.camera_pos
+        if self.game_state == self.STATE_PLAYING:
+            self.update_playing()
+        elif self.game_state == self.STATE_GRADING:
+            self.update_grading()
+        elif self.game_state == self.STATE_RESULT_ANIM:
+            self.update_result_animation()
+        elif self.game_state == self.STATE_GAMEOVER:
+            self.update_gameover()
+        elif self.game_state == self.STATE_PAUSE:
+            return # 일시정지 중엔 게임 시간도 멈춤 (세션 기록에 없는 시간이 session_tick에 섞이면 재생이 어긋남)
+        self.sim_ticks += 1
+
+    def now_ms(self):
+        """게임 시간 (ms): 시뮬레이션 틱 수 x 틱 간격 (채점 창, 결과 표시 시간 등에 사용, 일시정지 중엔 멈춤)"""
+        return self.sim_ticks * 1000 // self.SIM_HZ
+
+    def session_tick(self):
+        """이번 게임(start_game) 시작 후 지난 시뮬레이션 틱 수"""
+        return self.sim_ticks - self.session_start_tick
+
+    def camera_offset(self):
+        """화면에 그릴 때 뺄 정수 카메라 위치: 직전 틱과 현재 틱 사이를 보간
+        (도로와 배경이 같은 값을 써야 어긋나지 않음)"""
+        alpha = self.timestep.alpha
+        x = self.prev_camera_pos[0] + (self.camera_pos[0] - self.prev_camera_pos[0]) * alpha
+        y = self.prev_camera_pos[1] + (self.camera_pos[1] - self.prev_camera_pos[1]) * alpha
+        return round(x), round(y)
+
+    def player_world_pos(self):
+        """화면에 고정된 플레이어 중심의 월드 좌표 (시뮬레이션 기준, 보간 없음)"""
+        return (self.player.rect.centerx + round(self.camera_pos[0]),
+                self.player.rect.centery + round(self.camera_pos[1]))
 
     def update_playing(self):
         if self.player_direction == DIR_UP: self.world_velocity = [0, -self.base_speed]
@@ -452,15 +753,16 @@ class Game:
         self.fill_map_queue()
         
         # ★★★ 생성 조건: 선두 거리 체크 (앞이 비면 채움) ★★★
+        player_pos = np.array(self.player_world_pos())
         if self.last_spawned_segment:
-            player_pos = np.array(self.player.rect.center)
             # 안전하게 반복 생성
             while True:
                 exit_pos = np.array(self.last_spawned_segment.exit_point)
                 dist_to_head = np.linalg.norm(exit_pos - player_pos)
                 
                 # 화면 밖(2000px)까지 도로가 꽉 차있지 않으면 계속 생성
-                if dist_to_head < 2000:
+                # (굽은 길이 플레이어 쪽으로 되돌아오면 큐가 바닥날 수 있음 -> 다음 틱에 다시 채워서 이어감)
+                if dist_to_head < 2000 and self.map_queue:
                     self.spawn_from_queue()
                 else:
                     break
@@ -470,12 +772,15 @@ class Game:
         # ★★★ 삭제 조건: 개수 체크 (뒤를 자름) ★★★
         self.cleanup_segments()
 
-        self.background.update()
-        self.road_segments.update()
+        # 스크롤: 도로 조각을 하나하나 옮기지 않고 카메라만 이동 (속도는 px/초)
+        dt = self.timestep.dt
+        self.camera_pos[0] += self.world_velocity[0] * dt
+        self.camera_pos[1] += self.world_velocity[1] * dt
+        player_pos = np.array(self.player_world_pos())
         
         for segment in self.road_segments:
             if segment.mission_name and not segment.is_judged:
-                dist = np.linalg.norm(np.array(self.player.rect.center) - np.array(segment.rect.center))
+                dist = np.linalg.norm(player_pos - np.array(segment.rect.center))
                 
                 threshold = 50 # 기본 거리 (좌/우회전은 가까이서)
                 
@@ -493,35 +798,41 @@ class Game:
         self.game_state = self.STATE_GRADING
         self.current_mission = segment.mission_name
         self.active_mission_segment = segment
-        self.pose_buffer = []
+        self.grading_started = False
         self.result_text = ""
-        self.last_state_change_time = pygame.time.get_ticks()
+        self.last_state_change_time = self.now_ms()
         self.world_velocity = [0, 0] 
+        self.last_pose_generation = self.pose_detector.frame_generation # 미션 전에 나온 포즈는 세지 않음
 
     def update_grading(self):
-        now = pygame.time.get_ticks()
-        LAG_TIME = 1500
-        GRADING_TIME = 2000
+        now = self.now_ms()
         
         start = self.last_state_change_time
-        if now < start + LAG_TIME:
+        if now < start + self.GRADING_LAG_TIME:
             self.result_text = f"미션: {self.current_mission}!"
-        elif now < start + LAG_TIME + GRADING_TIME:
-            current_pose = self.pose_detector.get_current_pose()
-            self.pose_buffer.append(current_pose)
+            # 준비 시간에 나온 포즈는 세지 않음 (지난 틱까지만 맞춰 두므로 채점 첫 틱에 나온 포즈는 아래에서 셈)
+            self.last_pose_generation = self.pose_detector.frame_generation
+            return
+
+        if not self.grading_started:
+            self.grader.start(self.current_mission, now)
+            self.grading_started = True
+
+        # 새로 판정된 포즈만 샘플로 추가 (렌더링이 추론보다 빠르면 같은 결과가 반복되므로)
+        snapshot = self.pose_detector.get_snapshot()
+        if snapshot.generation != self.last_pose_generation:
+            self.last_pose_generation = snapshot.generation
+            self.grader.add(snapshot.pose_name)
+            self.session_poses.append((self.session_tick(), snapshot.pose_name))
+            self.latency.add(snapshot.stamps)
+
+        if self.grader.decide(now) is None:
             self.result_text = "포즈 유지!"
         else:
             self.finish_grading()
 
     def finish_grading(self):
-        correct = 0
-        if self.pose_buffer:
-            for p in self.pose_buffer:
-                if p == self.current_mission: correct += 1
-            acc = correct / len(self.pose_buffer)
-        else: acc = 0
-        
-        if acc >= 0.4: 
+        if self.grader.result: 
             self.result_text = "SUCCESS!"
             self.score += 100
             
@@ -567,10 +878,10 @@ class Game:
         
         self.active_mission_segment = None
         self.game_state = self.STATE_RESULT_ANIM
-        self.last_state_change_time = pygame.time.get_ticks()
+        self.last_state_change_time = self.now_ms()
 
     def update_result_animation(self):
-        if pygame.time.get_ticks() > self.last_state_change_time + 1000:
+        if self.now_ms() > self.last_state_change_time + 1000:
             if self.mistakes >= 3:
                 self.game_over()
             else:
@@ -579,63 +890,155 @@ class Game:
 
     def update_gameover(self):
         self.world_velocity = [0, 0]
-        now = pygame.time.get_ticks()
+        now = self.now_ms()
         if now > self.last_state_change_time + 3000:
             self.game_state = self.STATE_MENU
 
+    def screen_key(self):
+        """이 값이 그대로면 배경/도로처럼 화면 대부분을 차지하는 요소가 바뀌지 않은 것
+        (HUD 글자/미니맵/플레이어처럼 작은 요소는 그릴 때 renderer.add로 등록)"""
+        size = (self.SCREEN_WIDTH, self.SCREEN_HEIGHT)
+        loading = None if self.loaded else (self.load_phase, self.load_progress, self.load_error)
+        if self.game_state == self.STATE_LOGIN:
+            return (self.game_state, size, self.login_email, self.login_pw, self.login_message, loading)
+        if loading:
+            return ("loading", size, loading)
+        if self.game_state == self.STATE_PAUSE: # 오버레이 아래 미니맵
+            return (self.game_state, size, self.pose_detector.frame_generation)
+        if self.game_state in self.STATIC_STATES:
+            return (self.game_state, size)
+        # 주행 중엔 카메라가 움직이므로 카메라 위치로 판단 (판정/결과/게임오버 중엔 멈춰 있음)
+        return (self.game_state, size, self.camera_offset())
+
+    def render_frame(self):
+        """한 프레임을 그려 화면에 내보냄 (RENDER_DIRTY_RECTS면 바뀐 영역만)"""
+        if not self.RENDER_DIRTY_RECTS:
+            self.draw()
+            pygame.display.flip()
+            return
+        key = self.screen_key()
+        if key != self.last_screen_key:
+            self.last_screen_key = key
+            self.renderer.invalidate()
+        elif self.game_state in self.STATIC_STATES:
+            self.renderer.skip() # 바뀐 게 없으면 그리지도 않음
+            return
+        self.draw()
+        self.renderer.present()
+
     def draw(self):
         # 1) 로그인 화면 먼저 확인
         if self.game_state == self.STATE_LOGIN:
             self.draw_login_menu()
+            if not self.loaded:
+                self.draw_loading_bar(self.SCREEN_HEIGHT - 60)
+            return
+
+        # 로그인은 끝났는데 아직 로딩 중이면 진행 표시만
+        if not self.loaded:
+            self.screen.blit(self.bg_main, (0, 0))
+            self.draw_loading_bar(self.SCREEN_HEIGHT // 2)
             return
         
-        self.background.draw(self.screen)
+        # 2) 메뉴/도움말/랭킹은 불투명한 전체 화면 이미지라 배경을 그릴 필요 없음
         if self.game_state == self.STATE_MENU:
             self.draw_menu()
+            return
         elif self.game_state == self.STATE_HELP:
             self.draw_help_popup()
+            return
         elif self.game_state == self.STATE_RANKING:
             self.draw_ranking()
+            return
         elif self.game_state == self.STATE_PAUSE:
             self.draw_pause()
+            return
+
+        self.background.draw(self.screen)
+        self.draw_game()
+
+    def draw_loading_bar(self, y):
+        """로딩 진행 막대 (load_progress) + 현재 단계 이름, 실패했으면 오류 메시지"""
+        if self.load_error:
+            self.draw_text(f"로딩 실패 - {self.load_error}", self.font_small, self.COLORS["red"], self.SCREEN_WIDTH // 2, y)
+            return
+        bar = pygame.Rect(0, 0, self.SCREEN_WIDTH // 3, 16)
+        bar.center = (self.SCREEN_WIDTH // 2, y)
+        pygame.draw.rect(self.screen, self.COLORS["dark_blue"], bar)
+        fill = bar.copy()
+        fill.width = int(bar.width * self.load_progress)
+        pygame.draw.rect(self.screen, self.COLORS["green"], fill)
+        self.renderer.add(bar)
+        self.draw_text(f"로딩 중... {self.load_phase}", self.font_small, self.COLORS["white"], bar.centerx, bar.top - 20)
+
+    def cached_screen(self, name, deps, compose):
+        """정적인 화면 구성을 한 장의 Surface로 구워 두고, 화면 크기나 deps가 바뀔 때만 compose(surface)로 다시 굽습니다."""
+        key = ((self.SCREEN_WIDTH, self.SCREEN_HEIGHT),) + tuple(deps)
+        entry = self.screen_cache.get(name)
+        if entry is None or entry[0] != key:
+            surface = pygame.Surface((self.SCREEN_WIDTH, self.SCREEN_HEIGHT)).convert()
+            compose(surface)
+            entry = (key, surface)
+            self.screen_cache[name] = entry
+            self.screen_cache_stats["bakes"] += 1
         else:
-            self.draw_game()
+            self.screen_cache_stats["hits"] += 1
+        return entry[1]
 
     def draw_menu(self):
-        self.screen.blit(self.bg_main, (0, 0))
+        self.screen.blit(self.cached_screen("menu", (), self.compose_menu), (0, 0))
+
+    def compose_menu(self, surface):
+        surface.blit(self.bg_main, (0, 0))
     # TITLE 버튼 
-        self.screen.blit(self.title_banner, self.title_banner_rect)
+        surface.blit(self.title_banner, self.title_banner_rect)
     # START 버튼 
-        self.screen.blit(self.btn_start, self.btn_start_rect)
+        surface.blit(self.btn_start, self.btn_start_rect)
     # RANKING 버튼
-        self.screen.blit(self.btn_ranking, self.btn_ranking_rect)
+        surface.blit(self.btn_ranking, self.btn_ranking_rect)
     # TUTORIAL 버튼
-        self.screen.blit(self.btn_tutorial, self.btn_tutorial_rect)
+        surface.blit(self.btn_tutorial, self.btn_tutorial_rect)
 
     def draw_help_popup(self):
-        self.screen.blit(self.bg_main, (0, 0))
+        self.screen.blit(self.cached_screen("help", (), self.compose_help_popup), (0, 0))
+
+    def compose_help_popup(self, surface):
+        surface.blit(self.bg_main, (0, 0))
         
         # 도움말 이미지 표시
-        self.screen.blit(self.help_img, self.help_img_rect)
+        surface.blit(self.help_img, self.help_img_rect)
 
     def draw_pause(self):
+        # 멈춘 게임 화면 + 어두운 오버레이 + 버튼을 한 장으로 구워 둠 (일시정지 중엔 게임 화면이 바뀌지 않음)
+        deps = (self.camera_offset(), self.score, self.mistakes, self.result_text,
+                self.player.current_direction, self.player.rect.topleft, self.pose_detector.frame_generation)
+        self.screen.blit(self.cached_screen("pause", deps, self.compose_pause), (0, 0))
+
+    def compose_pause(self, surface):
+        self.background.draw(self.screen)
         self.draw_game()
+        surface.blit(self.screen, (0, 0))
 
         overlay = pygame.Surface((self.SCREEN_WIDTH, self.SCREEN_HEIGHT))
         overlay.set_alpha(160)
         overlay.fill((0, 0, 0))
-        self.screen.blit(overlay, (0, 0))
+        surface.blit(overlay, (0, 0))
 
         # 버튼 배치
-        self.screen.blit(self.btn_resume, self.btn_resume_rect)
-        self.screen.blit(self.btn_quit_game, self.btn_quit_game_rect)
+        surface.blit(self.btn_resume, self.btn_resume_rect)
+        surface.blit(self.btn_quit_game, self.btn_quit_game_rect)
 
     def draw_ranking(self):
+        # 랭킹 데이터(user_manager.version)나 로그인한 사용자가 바뀔 때만 다시 구움
+        deps = (self.user_manager.version, self.login_email)
+        self.screen.blit(self.cached_screen("ranking", deps, self.compose_ranking), (0, 0))
+
+    def compose_ranking(self, surface):
         # 배경
-        self.screen.blit(self.ranking_bg, (0,0))
+        surface.blit(self.ranking_bg, (0,0))
         
         # 랭킹 테이블 이미지
-        self.screen.blit(self.ranking_table, self.ranking_table_rect)
+        surface.blit(self.ranking_table, self.ranking_table_rect)
 
         ranking_raw = self.user_manager.get_ranking(top_n=10)
 
@@ -669,19 +1072,19 @@ class Game:
                 rank,
                 self.font_rank,
                 self.COLORS["black"],
-                x_rank, y_rank, "center"
+                x_rank, y_rank, "center", surface
             )
             self.draw_text(
                 name, 
                 self.font_rank,
                 self.COLORS["black"],
-                x_name,  y_rank, "center"
+                x_name,  y_rank, "center", surface
             )
             self.draw_text(
                 str(score),
                 self.font_rank,
                 self.COLORS["black"],
-                x_score, y_rank, "center"
+                x_score, y_rank, "center", surface
             )
 
 
@@ -719,7 +1122,7 @@ class Game:
             self.font_rank,
             self.COLORS["white"],
             x_rank, y_myrank,
-            "center"
+            "center", surface
         )
 
         self.draw_text(
@@ -727,7 +1130,7 @@ class Game:
             self.font_rank,
             self.COLORS["white"],
             x_name, y_myrank,
-            "center"
+            "center", surface
         )
 
         self.draw_text(
@@ -735,16 +1138,16 @@ class Game:
             self.font_rank,
             self.COLORS["white"],
             x_score, y_myrank,
-            "center"
+            "center", surface
         )
         
-        self.screen.blit(self.btn_back_rank, self.btn_back_rank_rect)
+        surface.blit(self.btn_back_rank, self.btn_back_rank_rect)
 
 
 
     def draw_game(self):
-        self.road_segments.draw(self.screen)
-        self.player.draw(self.screen)
+        self.draw_road_segments()
+        self.renderer.add(self.player.draw(self.screen))
         self.draw_text(f"점수: {self.score}", self.font_medium, self.COLORS["white"], 100, 30, "topleft")
         self.draw_text(f"실수: {self.mistakes}/3", self.font_medium, self.COLORS["white"], self.SCREEN_WIDTH-150, 30, "topleft")
         
@@ -754,25 +1157,63 @@ class Game:
             self.draw_text("GAME OVER", self.font_large, self.COLORS["red"], self.SCREEN_WIDTH//2, 300)
         self.draw_webcam_minimap()
 
+    def draw_road_segments(self):
+        """화면(뷰포트)과 겹치는 도로 조각만 그림: 굽은 길에선 생성된 조각 상당수가 화면 밖"""
+        camera = self.camera_offset()
+        viewport = pygame.Rect(camera, (self.SCREEN_WIDTH, self.SCREEN_HEIGHT)) # 월드 좌표
+        culled = 0
+        for segment in self.road_segments:
+            if segment.rect.colliderect(viewport):
+                segment.draw(self.screen, camera)
+            else:
+                culled += 1
+        self.cull_stats["drawn"] += len(self.road_segments) - culled
+        self.cull_stats["culled"] += culled
+        self.cull_stats["culled_last_frame"] = culled
+
     def draw_webcam_minimap(self):
-        frame = self.pose_detector.get_minimap_frame()
-        if frame is not None:
-            try:
-                surf = pygame.surfarray.make_surface(frame.swapaxes(0,1))
-                surf = pygame.transform.scale(surf, (300, 200))
-                self.screen.blit(surf, (self.SCREEN_WIDTH-310, self.SCREEN_HEIGHT-210))
-            except: pass
+        snapshot = self.pose_detector.get_snapshot()
+        if snapshot.frame is None:
+            return
+        if snapshot.generation != self.minimap_generation:
+            self.upload_minimap_frame(snapshot.frame)
+            self.minimap_generation = snapshot.generation
+        else:
+            self.minimap_stats["skipped"] += 1 # 새 프레임이 없으면 지난 Surface를 그대로 사용
+        self.renderer.add(self.screen.blit(self.minimap_surface, (self.SCREEN_WIDTH-310, self.SCREEN_HEIGHT-210)))
 
-    def draw_text(self, text, font, color, x, y, align="center"):
-        s = font.render(text, True, color)
+    def upload_minimap_frame(self, frame):
+        """게시된 (H, W, 3) RGB 프레임을 미니맵 Surface에 복사 (이미 MINIMAP_SIZE면 축소 없이 blit 한 번)"""
+        try:
+            h, w = frame.shape[:2]
+            surf = pygame.image.frombuffer(frame, (w, h), "RGB") # 복사 없이 감싸기만 함
+            if (w, h) == self.MINIMAP_SIZE:
+                self.minimap_surface.blit(surf, (0, 0))
+                self.minimap_stats["uploads"] += 1
+            else:
+                # 크기가 다른 프레임이 들어온 경우 (설정 불일치 등): 느린 경로이므로 횟수와 시간을 기록
+                start = time.perf_counter()
+                self.minimap_surface.blit(pygame.transform.scale(surf, self.MINIMAP_SIZE), (0, 0))
+                self.minimap_stats["fallbacks"] += 1
+                self.minimap_stats["fallback_ms"] += (time.perf_counter() - start) * 1000
+        except Exception as e:
+            if self.minimap_stats["errors"] == 0:
+                print(f"Error: minimap upload failed: {e}")
+            self.minimap_stats["errors"] += 1
+
+    def draw_text(self, text, font, color, x, y, align="center", surface=None):
+        s = self.text_cache.render(font, text, color) # 바뀐 글자만 새로 렌더링
         r = s.get_rect()
         if align == "center": r.center = (x, y)
         elif align == "topleft": r.topleft = (x, y)
         elif align == "topright": r.topright = (x, y)
-        self.screen.blit(s, r)
+        if surface is not None: # 구워 둘 화면에 그리는 중
+            surface.blit(s, r)
+            return
+        self.renderer.add(self.screen.blit(s, r))
 
     def start_game(self):
-        if self.pose_detector.cap is None: self.pose_detector.start()
+        self.pose_detector.warm_start() # 메뉴에서 해제된 카메라를 다시 켜도록 요청만 함 (여는 건 포즈 워커 스레드)
         
         try:
             pygame.mixer.music.load("assets/sound/bgm.mp3")
@@ -782,28 +1223,41 @@ class Game:
             print("⚠️ BGM 파일 로드 실패: assets/sound/bgm.mp3")
 
 
+        # 세션 시드: 지정하지 않았으면 새로 뽑아 기록 (이 시드와 session_poses로 같은 게임을 재생할 수 있음)
+        self.session_seed = self.seed if self.seed is not None else random.randrange(2 ** 32)
+        self.rng.seed(self.session_seed)
+        self.session_start_tick = self.sim_ticks
+        self.session_poses = []
+        self.game_over_tick = None
+        self.latency.reset() # 지연 리포트는 판마다 새로 모음
+
         self.score = 0
         self.mistakes = 0
         self.road_segments.empty()
-        self.generated_roads = [] # ★ 리스트도 초기화
+        self.generated_roads = deque() # ★ 리스트도 초기화
         self.player.reset_position()
         
         self.player_direction = DIR_UP 
         self.world_velocity = [0, -self.base_speed] 
+        self.camera_pos = [0.0, 0.0] # 첫 도로는 카메라 (0, 0) 기준이라 화면 좌표 = 월드 좌표
+        self.prev_camera_pos = [0.0, 0.0]
         self.player.set_direction("UP") 
         
         self.active_mission_segment = None
-        self.pose_buffer = []
+        self.grading_started = False
         
-        # 큐 초기화
-        self.map_queue = []
+        # 큐 초기화 (도로 계획도 세션 rng로 새로 시작)
+        self.map_queue = deque()
         self.logical_direction = DIR_UP
+        self.track = TrackPlan(rng=self.rng)
+        self.removed_segments = 0
         
         self.last_spawned_segment = None
         
         # 초기 도로 생성 (직진)
         start_seg = RoadSegment(self, 'straight')
-        start_seg.rect.center = self.player.rect.center
+        start_seg.rect.center = self.player_world_pos()
+        self.track_origin = start_seg.rect.center
         
         self.road_segments.add(start_seg)
         self.generated_roads.append(start_seg) # ★ 리스트에 추가
@@ -817,6 +1271,16 @@ class Game:
             self.spawn_from_queue()
         
         self.game_state = self.STATE_PLAYING
+        self.timestep.reset() # BGM/도로 준비에 걸린 시간을 첫 프레임에 한꺼번에 따라잡지 않도록
+
+    def pause_game(self):
+        pygame.mixer.music.pause()
+        self.game_state = self.STATE_PAUSE
+
+    def resume_game(self):
+        pygame.mixer.music.unpause()
+        self.game_state = self.STATE_PLAYING
+        self.timestep.reset()
 
     def game_over(self):
 
@@ -825,4 +1289,27 @@ class Game:
             self.user_manager.save_score(self.login_email, self.score)
 
         self.game_state = self.STATE_GAMEOVER
-        self.last_state_change_time = pygame.time.get_ticks()
\ No newline at end of file
+        self.last_state_change_time = self.now_ms()
+        self.game_over_tick = self.session_tick()
+        if self.headless:
+            return
+        self.latency.dump(self.LATENCY_REPORT_PATH, score=self.score, pose_mode=self.POSE_MODE,
+                          pose_stats=self.pose_detector.get_stats())
+        self.save_session(self.SESSION_RECORD_PATH)
+
+    def session_record(self):
+        """재생에 필요한 것: 시드, 화면 크기(도로 배치가 화면 크기에 따라 다름), 틱별 포즈, 그리고 검증용 결과"""
+        return {
+            "seed": self.session_seed,
+            "sim_hz": self.SIM_HZ,
+            "screen_size": [self.SCREEN_WIDTH, self.SCREEN_HEIGHT],
+            "poses": [list(p) for p in self.session_poses],
+            "result": {"score": self.score, "mistakes": self.mistakes, "ticks": self.game_over_tick},
+        }
+
+    def save_session(self, path):
+        try:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(self.session_record(), f, ensure_ascii=False)
+        except Exception as e:
+            print(f"Error: session record could not be written: {e}")
\ No newline at end of file
@@ -0,0 +1,91 @@
+import math
+
+import numpy as np
+
+from pose_types import POSE_CODES, POSE_IDLE, POSE_NAMES
+
+
+class StreamingGrader:
+    """미션 채점기: 포즈 코드를 고정 크기 링 버퍼에 쌓으면서 제스처별 개수를 바로바로 갱신하고,
+    정답 비율이 기준(pass_ratio)보다 확실히 높거나 낮아지면 창이 끝나기 전에 결과를 냅니다.
+
+    - 성공은 min_pass_ms, 실패는 min_fail_ms가 지나야 조기 확정 (늦게 반응한 플레이어에게 불리하지 않도록)
+    - max_window_ms가 지나면 그때까지의 정답 비율로 판정 (기존 2초 창과 같은 기준)
+    - 확정 여부는 정답 비율의 Wilson 신뢰구간(단측, z)으로 판단
+    - 연속 프레임은 같은 자세라 서로 강하게 상관되므로 신뢰구간의 n은 실제 샘플 수가 아니라
+      decorrelation_ms마다 1개로 센 유효 샘플 수 (유효 샘플이 min_samples개는 돼야 조기 확정)
+    """
+    def __init__(self, pass_ratio=0.4, min_pass_ms=1000, min_fail_ms=1500, max_window_ms=2000,
+                 min_samples=5, max_samples=128, z=1.645, decorrelation_ms=200):
+        self.pass_ratio = pass_ratio
+        self.min_pass_ms = min_pass_ms
+        self.min_fail_ms = min_fail_ms
+        self.max_window_ms = max_window_ms
+        self.min_samples = min_samples
+        self.z = z
+        self.decorrelation_ms = decorrelation_ms
+
+        self.ring = np.zeros(max_samples, dtype=np.int8) # 최근 포즈 코드
+        self.counts = [0] * len(POSE_NAMES)              # ring 안의 코드별 개수
+        self.samples = 0
+        self.target = POSE_IDLE
+        self.start_time = 0
+        self.result = None # None: 진행 중, True/False: 성공/실패 확정
+
+    def start(self, mission_name, now):
+        self.ring[:] = POSE_IDLE
+        self.counts = [0] * len(POSE_NAMES)
+        self.samples = 0
+        self.target = POSE_CODES[mission_name]
+        self.start_time = now
+        self.result = None
+
+    def add(self, pose_name):
+        """판정된 포즈 1개 추가 (대기중/인식 불가 등은 모두 POSE_IDLE로 집계)"""
+        code = POSE_CODES.get(pose_name, POSE_IDLE)
+        i = self.samples % len(self.ring)
+        if self.samples >= len(self.ring): # 가득 차면 가장 오래된 샘플을 밀어냄
+            self.counts[self.ring[i]] -= 1
+        self.ring[i] = code
+        self.counts[code] += 1
+        self.samples += 1
+
+    @property
+    def sample_count(self):
+        return min(self.samples, len(self.ring))
+
+    @property
+    def accuracy(self):
+        n = self.sample_count
+        return self.counts[self.target] / n if n else 0.0
+
+    def effective_samples(self, now):
+        """서로 독립에 가깝다고 볼 수 있는 샘플 수 (창 길이 / decorrelation_ms, 실제 샘플 수보다 크지 않음)"""
+        return min(self.sample_count, (now - self.start_time) / self.decorrelation_ms)
+
+    def _bounds(self, n):
+        """정답 비율의 Wilson 신뢰구간 (하한, 상한), n: 유효 샘플 수"""
+        p = self.accuracy
+        z2 = self.z * self.z
+        denom = 1 + z2 / n
+        center = p + z2 / (2 * n)
+        margin = self.z * math.sqrt(p * (1 - p) / n + z2 / (4 * n * n))
+        return (center - margin) / denom, (center + margin) / denom
+
+    def decide(self, now):
+        """결과가 확정되면 True/False, 아직이면 None"""
+        if self.result is not None:
+            return self.result
+        elapsed = now - self.start_time
+        if elapsed >= self.max_window_ms:
+            self.result = self.accuracy >= self.pass_ratio
+        else:
+            n = self.effective_samples(now)
+            if n < self.min_samples:
+                return None
+            lower, upper = self._bounds(n)
+            if elapsed >= self.min_pass_ms and lower > self.pass_ratio:
+                self.result = True
+            elif elapsed >= self.min_fail_ms and upper < self.pass_ratio:
+                self.result = False
+        return self.result
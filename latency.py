@@ -0,0 +1,70 @@
+"""제스처 입력 지연 측정: 플레이어가 팔을 든 뒤 게임이 반응하기까지 단계별로 걸린 시간
+
+PoseDetector가 프레임마다 캡처 / 색 변환 후 / 추론 후 / 판정 시각을 찍어 FrameStamps로 게시하고,
+게임이 그 포즈를 가져다 쓸(update_grading) 때 LatencyTracker.add로 기록합니다.
+단계별로 최근 window개의 지연(ms)을 고정 크기 링 버퍼에 두고 p50/p95/p99를 계산합니다.
+"""
+import json
+import time
+from collections import namedtuple
+
+import numpy as np
+
+# perf_counter 기준 시각 (추론 프로세스의 시각도 같은 시스템 단조 시계라 비교 가능)
+FrameStamps = namedtuple("FrameStamps", ["capture", "convert", "inference", "classify"])
+
+# (단계 이름, 시작 시각, 끝 시각): consumed는 게임이 포즈를 가져간 시각
+STAGES = (
+    ("convert", "capture", "convert"),        # 캡처 -> cvtColor 완료 (flip 포함)
+    ("inference", "convert", "inference"),    # cvtColor 완료 -> pose.process 완료 (프로세스 모드는 큐 대기 포함)
+    ("classify", "inference", "classify"),    # 추론 완료 -> 판정 완료
+    ("consume", "classify", "consumed"),      # 판정 완료 -> 게임이 사용 (게시/미니맵/게임 루프 대기)
+    ("total", "capture", "consumed"),         # 캡처 -> 게임이 사용
+)
+PERCENTILES = (50, 95, 99)
+
+
+class LatencyTracker:
+    """단계별 지연의 최근 window개를 링 버퍼로 유지하며 백분위수를 제공"""
+    def __init__(self, window=600):
+        self.window = window
+        self.samples = np.zeros((len(STAGES), window), dtype=np.float64) # ms
+        self.count = 0 # 지금까지 기록한 프레임 수
+
+    def reset(self):
+        self.count = 0
+
+    def add(self, stamps, consumed=None):
+        """프레임 1개의 시각 기록을 추가합니다. stamps가 None(타임스탬프 없는 결과)이면 무시."""
+        if stamps is None:
+            return
+        times = stamps._asdict()
+        times["consumed"] = time.perf_counter() if consumed is None else consumed
+        i = self.count % self.window
+        for row, (_, start, end) in enumerate(STAGES):
+            self.samples[row, i] = (times[end] - times[start]) * 1000
+        self.count += 1
+
+    def percentiles(self):
+        """{단계: {"p50": ms, "p95": ms, "p99": ms}} (기록이 없으면 빈 dict)"""
+        n = min(self.count, self.window)
+        if n == 0:
+            return {}
+        values = np.percentile(self.samples[:, :n], PERCENTILES, axis=1) # (백분위수, 단계)
+        return {name: {f"p{p}": round(float(values[j, row]), 2) for j, p in enumerate(PERCENTILES)}
+                for row, (name, _, _) in enumerate(STAGES)}
+
+    def dump(self, path, **extra):
+        """백분위수와 표본 수를 JSON 파일로 저장 (extra는 함께 기록할 정보, 예: 점수/포즈 모드)"""
+        report = {
+            "frames": self.count,
+            "window": min(self.count, self.window),
+            "stages_ms": self.percentiles(),
+        }
+        report.update(extra)
+        try:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(report, f, ensure_ascii=False, indent=2)
+        except Exception as e:
+            print(f"Error: latency report could not be written: {e}")
+        return report
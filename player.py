@@ -1,29 +1,24 @@
 import pygame
-import random
 
 class Player(pygame.sprite.Sprite):
     def __init__(self, game):
         super().__init__()
         self.game = game
         
-        # --- 이미지 로드 ---
+        # --- 이미지 로드 --- (에셋 팩에 있으면 크기 조정까지 끝난 이미지를 그대로 사용)
         self.images = {}
         try:
             # 정면 (직진/UP)
-            img_straight = pygame.image.load("assets/player_straight.png").convert_alpha()
-            self.images["UP"] = pygame.transform.scale(img_straight, (60, 100))
+            self.images["UP"] = game.load_image("assets/player_straight.png", (60, 100))
             
             # 좌회전 (LEFT)
-            img_left = pygame.image.load("assets/player_left_turn.png").convert_alpha()
-            self.images["LEFT"] = pygame.transform.scale(img_left, (100, 80)) 
+            self.images["LEFT"] = game.load_image("assets/player_left_turn.png", (100, 80)) 
             
             # 우회전 (RIGHT)
-            img_right = pygame.image.load("assets/player_right_turn.png").convert_alpha()
-            self.images["RIGHT"] = pygame.transform.scale(img_right, (100, 80))
+            self.images["RIGHT"] = game.load_image("assets/player_right_turn.png", (100, 80))
             
             # ★★★ 추가: 후진 (DOWN) 이미지 ★★★
-            img_back = pygame.image.load("assets/player_backward.png").convert_alpha()
-            self.images["DOWN"] = pygame.transform.scale(img_back, (60, 100))
+            self.images["DOWN"] = game.load_image("assets/player_backward.png", (60, 100))
             
         except Exception as e:
             print(f"이미지 로드 실패: {e}")
@@ -54,10 +49,10 @@ class Player(pygame.sprite.Sprite):
         
         # 충돌(Crash) 애니메이션 (흔들림)
         if self.is_animating:
-             self.rect.centerx += random.randint(-5, 5)
+             self.rect.centerx += self.game.rng.randint(-5, 5)
 
     def draw(self, screen):
-        screen.blit(self.image, self.rect)
+        return screen.blit(self.image, self.rect)
 
     def turn(self, direction):
         """game.py에서 호출하는 방향 전환 함수 (애니메이션용)"""
@@ -1,7 +1,19 @@
+import math
+import queue
+import threading
+import time
+
 import cv2
 import mediapipe as mp
 import numpy as np
 
+from frame_source import CameraSource
+from latency import FrameStamps
+from pose_process import PoseInferenceProcess
+from pose_types import (LANDMARK_FIELDS, MODE_PROCESS, MODE_SYNC, MODE_THREAD, NUM_LANDMARKS, POSE_IDLE, POSE_LEFT,
+                        POSE_NAMES, POSE_RIGHT, POSE_STOP, R_ELBOW, R_HIP, R_SHOULDER, R_WRIST, PoseBudget, PoseSnapshot)
+from roi_tracker import RoiTracker
+
 # --- 1. 관절 각도 계산 함수 (이 파일로 이동) ---
 def calculate_angle(a, b, c):
     """세 점 a, b, c 사이의 각도를 계산합니다. (b가 중심점)"""
@@ -17,109 +29,625 @@ def calculate_angle(a, b, c):
         
     return angle
 
+def calculate_angles(a, b, c):
+    """calculate_angle의 배치 버전: (N, 2) 점 배열 a, b, c로 N개의 각도(도)를 한 번에 계산합니다.
+    오프라인 분석에서도 그대로 쓸 수 있습니다."""
+    b = np.asarray(b)
+    v = np.stack((np.asarray(c) - b, np.asarray(a) - b)) # (2, N, 2): 중심점 기준 벡터 b->c, b->a
+    heading = np.arctan2(v[..., 1], v[..., 0])
+    angle = np.abs(heading[0] - heading[1]) * (180.0 / np.pi)
+    return np.minimum(angle, 360.0 - angle) # 180도를 넘으면 반대쪽 각도 사용
+
+def landmarks_to_array(landmarks, out=None):
+    """MediaPipe 랜드마크 리스트를 (33, 4) float32 배열(x, y, z, visibility)로 변환.
+    out을 주면 새로 할당하지 않고 그 배열에 채웁니다 (중간 리스트 없이 메모리에 바로 기록)."""
+    if out is None:
+        out = np.empty((NUM_LANDMARKS, LANDMARK_FIELDS), dtype=np.float32)
+    flat = memoryview(out).cast("B").cast("f") # numpy 원소 대입보다 빠름 (out은 C 연속 float32)
+    i = 0
+    for l in landmarks:
+        flat[i] = l.x
+        flat[i + 1] = l.y
+        flat[i + 2] = l.z
+        flat[i + 3] = l.visibility
+        i += 4
+    return out
+
+# 판정에 쓰는 팔 관절 (어깨, 팔꿈치, 손목, 엉덩이) 순서
+_ARM_JOINTS = np.array([R_SHOULDER, R_ELBOW, R_WRIST, R_HIP])
+# 각도 계산용 삼중쌍 (a, b(중심), c): 팔꿈치 각도 = 어깨-팔꿈치-손목, 팔 각도 = 팔꿈치-어깨-엉덩이
+_ANGLE_A = np.array([0, 1])
+_ANGLE_B = np.array([1, 0])
+_ANGLE_C = np.array([2, 3])
+# 좌표 차이 특징값: (sx, sy, ex, ey, wx, wy, hx, hy) 평탄화 배열에서 [to] - [from]
+# 어깨y-손목y, 어깨y-팔꿈치y, 손목x-어깨x, 손목y-팔꿈치y, 손목y-어깨y
+_DIFF_TO = np.array([1, 1, 4, 5, 5])
+_DIFF_FROM = np.array([5, 3, 0, 3, 1])
+
+# --- ★★★ 사용자님의 포즈 판정 로직 (임계값 그대로, 표로 정리) ★★★ ---
+# 특징값: [팔꿈치 각도, 팔 각도, 어깨y-손목y, 어깨y-팔꿈치y, 손목x-어깨x, 손목y-팔꿈치y, 손목y-어깨y]
+# 각 제스처는 모든 특징값이 (하한, 상한) 사이에 있을 때 성립 (경계값 미포함, |d| < 0.15는 -0.15 < d < 0.15)
+_INF = np.inf
+# (float64: 0.15 같은 임계값을 기존 판정식과 똑같이 비교)
+_GESTURE_LOWER = np.array([
+    [150, 75, -0.15, -_INF, -_INF, -_INF, -_INF],  # 좌회전
+    [75, 75, -_INF, -0.15, -_INF, -_INF, -_INF],   # 우회전
+    [165, 30, -_INF, -_INF, -_INF, -_INF, 0.15],   # 정지
+])
+_GESTURE_UPPER = np.array([
+    [_INF, 105, 0.15, _INF, 0, _INF, _INF],        # 좌회전
+    [105, 105, _INF, 0.15, 0, 0, _INF],            # 우회전
+    [_INF, 80, _INF, _INF, 0, _INF, _INF],         # 정지
+])
+_GESTURE_CODES = np.array([POSE_LEFT, POSE_RIGHT, POSE_STOP], dtype=np.int8)
+# 1프레임 판정용: (포즈 이름, [(하한, 특징값 번호, 상한), ...]) 무한대 경계는 빼고 우선순위 순서대로
+_GESTURE_RULES = [
+    (POSE_NAMES[code], [(lo, i, hi) for i, (lo, hi) in enumerate(zip(lower, upper)) if lo != -_INF or hi != _INF])
+    for code, lower, upper in zip(_GESTURE_CODES.tolist(), _GESTURE_LOWER.tolist(), _GESTURE_UPPER.tolist())
+]
+
+def gesture_features(lms):
+    """(F, 33, 2 이상) 랜드마크 배열에서 판정용 특징값 (F, 7)을 한 번에 계산합니다."""
+    pts = np.asarray(lms)[:, _ARM_JOINTS, :2] # (F, 4, 2): 어깨, 팔꿈치, 손목, 엉덩이
+    angles = calculate_angles(pts[:, _ANGLE_A], pts[:, _ANGLE_B], pts[:, _ANGLE_C]) # (F, 2)
+    flat = pts.reshape(-1, 8)
+    diffs = flat[:, _DIFF_TO] - flat[:, _DIFF_FROM] # (F, 5)
+    return np.concatenate((angles, diffs), axis=1)
+
+def match_gestures(lms):
+    """(F, 33, 2 이상) 랜드마크 배열에서 세 제스처(좌회전, 우회전, 정지) 성립 여부 (F, 3)를 한 번에 계산합니다."""
+    features = gesture_features(lms)[:, np.newaxis, :] # (F, 1, 7)
+    return ((features > _GESTURE_LOWER) & (features < _GESTURE_UPPER)).all(axis=2)
+
+def classify_batch(lms):
+    """(F, 33, 2 이상) 랜드마크 배열 F개 프레임을 한 번에 판정해 (F,) int8 포즈 코드 배열을 반환합니다."""
+    matched = match_gestures(lms)
+    # 우선순위: 좌회전 > 우회전 > 정지 (argmax는 첫 번째 True를 고름)
+    return np.where(matched.any(axis=1), _GESTURE_CODES[matched.argmax(axis=1)], POSE_IDLE).astype(np.int8)
+
+def _angle(ax, ay, bx, by, cx, cy):
+    """calculate_angle의 스칼라 버전 (float만 받음, 배열을 만들지 않음)"""
+    angle = abs(math.atan2(cy - by, cx - bx) - math.atan2(ay - by, ax - bx)) * (180.0 / math.pi)
+    return 360.0 - angle if angle > 180.0 else angle
+
+def classify_landmarks(lm):
+    """(33, 2 이상) 랜드마크 배열 1개 프레임의 포즈 이름을 판정합니다.
+    매 프레임 호출되므로 배치 연산 대신 팔 관절 4개만 꺼내 스칼라로 계산 (결과는 classify_batch와 같음)"""
+    (sx, sy), (ex, ey), (wx, wy), (hx, hy) = lm[_ARM_JOINTS, :2].tolist()
+    features = (_angle(sx, sy, ex, ey, wx, wy), _angle(ex, ey, sx, sy, hx, hy),
+                sy - wy, sy - ey, wx - sx, wy - ey, wy - sy)
+    for name, rule in _GESTURE_RULES:
+        for lo, i, hi in rule:
+            if not lo < features[i] < hi:
+                break
+        else:
+            return name
+    return "대기중"
+
+# MediaPipe Pose 스켈레톤 연결선 (mp.solutions.pose.POSE_CONNECTIONS와 같은 값, 미니맵이 mediapipe 없이 그리도록)
+POSE_CONNECTIONS = frozenset([
+    (0, 1), (1, 2), (2, 3), (3, 7), (0, 4), (4, 5), (5, 6), (6, 8), (9, 10),
+    (11, 12), (11, 13), (13, 15), (15, 17), (15, 19), (15, 21), (17, 19),
+    (12, 14), (14, 16), (16, 18), (16, 20), (16, 22), (18, 20),
+    (11, 23), (12, 24), (23, 24), (23, 25), (24, 26), (25, 27), (26, 28),
+    (27, 29), (28, 30), (29, 31), (30, 32), (27, 31), (28, 32),
+])
+
+def draw_landmark_array(image, lm, connections=POSE_CONNECTIONS, visibility_threshold=0.5):
+    """랜드마크 배열로 스켈레톤을 그립니다 (mediapipe drawing_utils 기본값과 같은 회색 선/빨간 점, RGB 이미지용)"""
+    h, w = image.shape[:2]
+    pts = [(int(x * w), int(y * h)) for x, y in lm[:, :2]]
+    visible = lm[:, 3] > visibility_threshold
+    for a, b in connections:
+        if visible[a] and visible[b]:
+            cv2.line(image, pts[a], pts[b], (224, 224, 224), 2)
+    for i, p in enumerate(pts):
+        if visible[i]:
+            cv2.circle(image, p, 3, (255, 0, 0), -1)
+
 class PoseDetector:
     """MediaPipe와 OpenCV를 관리하고 포즈를 판정하는 클래스"""
-    def __init__(self):
-        # --- MediaPipe & OpenCV 초기화 ---
-        self.mp_pose = mp.solutions.pose
-        self.pose = self.mp_pose.Pose(min_detection_confidence=0.5, min_tracking_confidence=0.5)
-        self.mp_drawing = mp.solutions.drawing_utils
-        
+    MODE_SYNC = MODE_SYNC       # 실행 방식 설명은 pose_types 참고
+    MODE_THREAD = MODE_THREAD
+    MODE_PROCESS = MODE_PROCESS
+
+    def __init__(self, mode=MODE_SYNC, roi_tracking=False, inference_size=320, source=None, minimap_size=(300, 200)):
         # ★★★ 수정: __init__에서는 카메라를 켜지 않습니다. ★★★
-        self.cap = None 
+        # source: 프레임 입력 (기본은 웹캠, frame_source.py의 영상/이미지 폴더/합성 랜드마크 소스로 교체 가능)
+        self.source = source if source is not None else CameraSource(0)
+
+        # --- MediaPipe 초기화 ---
+        # 추론이 필요한 카메라/영상 소스에서만 Pose 모델을 만듦
+        # (프로세스 모드는 자식 프로세스가 만들고, 합성 랜드마크 소스는 추론하지 않음)
+        self.pose = None
+        if mode != self.MODE_PROCESS and not self.source.provides_landmarks:
+            self._ensure_model()
+        self.cap = None # 열려 있는 동안 self.source를 가리킴
         # try:
         #     self.cap = cv2.VideoCapture(0)
         # ... (이하 7줄 삭제)
 
+        # --- ROI 추적 모드: 직전 랜드마크 주변만 잘라 inference_size 이하로 축소해 추론 ---
+        self.roi_tracking = roi_tracking
+        self.inference_size = inference_size
+        # (프로세스 모드에서는 자식 프로세스가 추적하고 통계는 추론 결과에 실려 옴)
+        self.roi = RoiTracker(inference_size) if roi_tracking and mode != self.MODE_PROCESS else None
+
         # --- 현재 상태 저장 변수 ---
-        self.current_pose_name = "대기중"
-        self.latest_frame_rgb = None # 미니맵용
-        self.latest_landmarks = None # 아바타 그리기용 (v3에서는 사용 안함)
+        # pose_name / landmarks(아바타용) / frame(미니맵용)을 한 번에 게시합니다.
+        self._snapshot = PoseSnapshot("대기중", None, None, 0)
+
+        # --- 스레드 모드용 ---
+        self.mode = mode
+        self._worker = None
+        self._result_worker = None # 프로세스 모드: 추론 결과 수신 스레드
+        self._inference = None     # 프로세스 모드: PoseInferenceProcess
+        self._stop_event = threading.Event()
+        self._publish_lock = threading.Lock() # 게시자(워커/update) 간 generation 증가 보호
+        self._cap_lock = threading.RLock()    # 카메라 열기/읽기/해제가 스레드 간에 겹치지 않도록
+
+        # --- 상태별 스케줄링 (apply_schedule 참고) ---
+        self.schedule = {}
+        self._schedule_key = None
+        self._budget = PoseBudget()
+        self._next_due = 0.0
+        self._paused_since = 0.0
+        self._wake_event = threading.Event() # 예산이 바뀌면 대기 중인 워커를 깨움
+        self._warm_frames = None # warm_start 요청 (버릴 프레임 수), 워커가 처리
+
+        # 랜드마크 변환용 미리 할당한 (33, 4) 버퍼 3개 (미니맵 버퍼와 같은 방식으로 넘겨줌, _free_buffer 참고)
+        self._lm_bufs = np.zeros((3, NUM_LANDMARKS, LANDMARK_FIELDS), dtype=np.float32)
+
+        # --- 할당 없는 프레임 경로용 버퍼 (캡처 해상도가 정해지면 한 번만 할당) ---
+        self._capture_buf = None # cap.read()가 매번 새 배열을 만들지 않도록 재사용
+        self._flip_buf = None    # 거울 모드(BGR) 결과
+        self._rgb_buf = None     # 추론용 RGB (동기/스레드 모드 워커에서만 할당)
+        # 미니맵은 워커에서 미리 (W, H) 크기로 줄여 게시
+        self.minimap_size = minimap_size
+        self._minimap_bufs = np.zeros((3, minimap_size[1], minimap_size[0], 3), dtype=np.uint8)
+        # 3중 버퍼 넘겨주기: 워커가 쓰는 것 + 게시된 것 + 게임이 get_snapshot()으로 받아 읽는 것.
+        # (랜드마크, 미니맵) 버퍼 번호를 _publish_lock 안에서 기록하고, 워커는 둘 다 아닌 버퍼에만 씀
+        self._published_bufs = (None, None)
+        self._held_bufs = (None, None)
+        # 이 파이프라인이 프레임 버퍼를 새로 만들거나 다시 만든 바이트 수 (해상도가 정해진 뒤에는 0이어야 함)
+        # numpy/cv2 내부 임시 할당까지 잰 실제 프레임당 할당은 bench_pose.py --trace-alloc (tracemalloc)
+        self._buffer_alloc_bytes = 0
+        self.last_buffer_alloc_bytes = 0
+        self.total_buffer_alloc_bytes = 0
+        self.frames_processed = 0
+
+    def _ensure_model(self):
+        """MediaPipe Pose 모델을 처음 필요할 때 만듦 (프로세스 모드에서 스레드 모드로 바뀐 경우 포함)"""
+        if self.pose is None:
+            self.pose = mp.solutions.pose.Pose(min_detection_confidence=0.5, min_tracking_confidence=0.5)
+        return self.pose
+
+    # --- 최신 결과 접근 (기존 속성 이름 유지) ---
+    @property
+    def current_pose_name(self):
+        return self._snapshot.pose_name
+
+    @property
+    def latest_frame_rgb(self):
+        return self._snapshot.frame
+
+    @property
+    def latest_landmarks(self):
+        return self._snapshot.landmarks
+
+    @property
+    def frame_generation(self):
+        """새 결과가 게시될 때마다 1씩 증가 (같은 프레임 중복 사용 방지용)"""
+        return self._snapshot.generation
+
+    def _publish(self, pose_name, landmarks=None, frame=None, stamps=None, buffers=(None, None)):
+        """새 결과를 원자적으로 교체합니다. frame이 None이면 직전 미니맵 프레임을 유지합니다.
+        stamps는 이 결과를 만든 프레임의 단계별 시각 (FrameStamps, 지연 측정용)
+        buffers: landmarks / frame이 들어 있는 (_lm_bufs, _minimap_bufs) 번호 (버퍼가 아니면 None)"""
+        lm_buf, minimap_buf = buffers
+        with self._publish_lock:
+            prev = self._snapshot
+            if frame is None:
+                frame = prev.frame
+                minimap_buf = self._published_bufs[1]
+            self._snapshot = PoseSnapshot(pose_name, landmarks, frame, prev.generation + 1, stamps)
+            self._published_bufs = (lm_buf, minimap_buf)
+
+    def _free_buffer(self, kind):
+        """kind(0: 랜드마크, 1: 미니맵) 버퍼 중 게시되지도, 게임이 읽고 있지도 않은 것의 번호.
+        게임은 게시된 버퍼만 받아 갈 수 있으므로 워커가 쓰는 동안 읽힐 일이 없음"""
+        with self._publish_lock:
+            busy = (self._published_bufs[kind], self._held_bufs[kind])
+        for index in range(3):
+            if index not in busy:
+                return index
+
+    def get_stats(self):
+        """프로세스 모드의 drop/stale 프레임, ROI 모드의 추적 통계, 카메라 캡처 통계 등 (해당 없으면 빈 dict)"""
+        stats = {}
+        if self._inference is not None:
+            stats.update(self._inference.get_stats())
+        if self.roi is not None:
+            stats.update(self.roi.get_stats())
+        source_stats = getattr(self.source, "get_stats", None) # 카메라: 실제 캡처 FPS, 프레임 지연
+        if source_stats is not None:
+            stats.update(source_stats())
+        return stats
+
+    def get_buffer_alloc_stats(self):
+        """프레임 경로 버퍼(캡처/거울/RGB)를 새로 만든 바이트 수. 해상도가 정해진 뒤에는 프레임당 0이어야 정상
+        (이 모듈이 만드는 버퍼만 셈, 실제 할당량 측정은 bench_pose.py --trace-alloc)"""
+        frames = self.frames_processed
+        return {
+            "last_frame_bytes": self.last_buffer_alloc_bytes,
+            "avg_bytes_per_frame": self.total_buffer_alloc_bytes / frames if frames else 0.0,
+            "total_bytes": self.total_buffer_alloc_bytes,
+            "frames": frames,
+        }
+
+    def _end_frame_buffers(self):
+        """프레임 1장 처리가 끝날 때 버퍼 할당 카운터를 마감"""
+        self.last_buffer_alloc_bytes = self._buffer_alloc_bytes
+        self.total_buffer_alloc_bytes += self._buffer_alloc_bytes
+        self.frames_processed += 1
+        self._buffer_alloc_bytes = 0
+
+    def _read_frame(self, cap):
+        """재사용 버퍼로 캡처해 거울 모드(BGR) 프레임을 반환합니다. 실패 시 None."""
+        with self._cap_lock:
+            if cap is not self.cap: # 읽기 직전에 해제됨
+                return None
+            success, frame = cap.read(self._capture_buf)
+        if not success:
+            return None
+        if frame is not self._capture_buf: # 첫 프레임이거나 해상도가 바뀜 -> 새로 할당됨
+            self._buffer_alloc_bytes += frame.nbytes
+            self._capture_buf = frame
+        if self._flip_buf is None or self._flip_buf.shape != frame.shape:
+            self._flip_buf = np.empty_like(frame)
+            self._buffer_alloc_bytes += self._flip_buf.nbytes
+        return cv2.flip(frame, 1, dst=self._flip_buf)
+
+    @staticmethod
+    def _capture_time(cap):
+        """방금 읽은 프레임의 촬영 시각: 카메라가 추정해 주면 그 값, 아니면 지금"""
+        t = getattr(cap, "last_capture_time", None)
+        return t if t is not None else time.perf_counter()
+
+    def _make_minimap(self, frame_rgb, lm):
+        """RGB 프레임을 미니맵 크기로 줄인 뒤 스켈레톤을 그려 (미니맵, 버퍼 번호) 반환
+        (미리 할당한 버퍼, 게임은 그대로 올리기만 함)"""
+        index = self._free_buffer(1)
+        minimap = self._minimap_bufs[index]
+        cv2.resize(frame_rgb, self.minimap_size, dst=minimap, interpolation=cv2.INTER_AREA)
+        if lm is not None:
+            draw_landmark_array(minimap, lm)
+        return minimap, index
+
+    def set_schedule(self, schedule):
+        """{상태 key: PoseBudget} 스케줄 등록. 없는 key는 제한 없음으로 처리"""
+        self.schedule = dict(schedule)
+        self._schedule_key = None
+
+    def apply_schedule(self, key):
+        """game 루프에서 매 프레임 호출: 현재 상태(key)의 예산을 적용 (바뀔 때만 실제 처리)"""
+        if key == self._schedule_key:
+            return
+        self._schedule_key = key
+        self.set_budget(self.schedule.get(key, PoseBudget()))
+
+    def set_budget(self, budget):
+        if budget.rate == 0 and self._budget.rate != 0:
+            self._paused_since = time.perf_counter()
+        self._budget = budget
+        self._next_due = 0.0
+        self._wake_event.set()
+
+    def _throttle(self, blocking):
+        """현재 예산상 지금 프레임을 처리해도 되는지 반환합니다.
+        blocking이면 차례가 올 때까지 기다리며, 종료 요청 시 False."""
+        while not self._stop_event.is_set():
+            if blocking:
+                self._warm_up_if_requested()
+            budget = self._budget
+            now = time.perf_counter()
+            if budget.rate == 0:
+                self._release_if_idle(budget, now)
+                if not blocking:
+                    return False
+                self._wake_event.wait(0.25)
+                self._wake_event.clear()
+                continue
+            if budget.rate:
+                wait = self._next_due - now
+                if wait > 0:
+                    if not blocking:
+                        return False
+                    self._wake_event.wait(wait)
+                    self._wake_event.clear()
+                    continue
+                self._next_due = now + 1.0 / budget.rate
+            return True
+        return False
+
+    def _release_if_idle(self, budget, now):
+        """오래 일시정지된 상태면 카메라를 해제 (전력/CPU 절약, warm_start로 다시 켬)"""
+        if budget.release_after is None or now - self._paused_since < budget.release_after:
+            return
+        with self._cap_lock:
+            if self.cap:
+                self.cap.release()
+                self.cap = None
+                print("Camera released (idle).")
+
+    def warm_start(self, warmup_frames=3):
+        """게임 시작 직전에 호출: 해제된 카메라를 다시 켜도록 요청만 하고 바로 반환합니다.
+        카메라 열기와 첫 몇 프레임(자동 노출 안정 전) 버리기는 워커 스레드가 합니다 (동기 모드는 별도 스레드)."""
+        self._warm_frames = warmup_frames
+        if self.mode == self.MODE_SYNC:
+            threading.Thread(target=self._warm_up_if_requested, name="PoseWarmStart", daemon=True).start()
+        else:
+            self._start_worker()
+            self._wake_event.set()
+        return True
+
+    def _warm_up_if_requested(self):
+        """warm_start 요청이 있으면 카메라를 다시 열고 첫 몇 프레임을 버림 (워커/PoseWarmStart 스레드에서 실행)"""
+        frames = self._warm_frames
+        if frames is None:
+            return
+        self._warm_frames = None
+        with self._cap_lock:
+            reopened = self.cap is None
+            if not self._open_locked():
+                return
+            if reopened:
+                for _ in range(frames):
+                    self.cap.grab()
+        self._paused_since = time.perf_counter() # 아직 메뉴 예산이어도 방금 켠 카메라를 바로 해제하지 않도록
+
+    def get_snapshot(self):
+        """pose_name, landmarks, frame이 같은 프레임에서 나온 것임이 보장된 묶음 반환 (게임 스레드 전용)
+        landmarks / frame 버퍼는 다음 get_snapshot() 호출 전까지 워커가 덮어쓰지 않습니다."""
+        with self._publish_lock:
+            self._held_bufs = self._published_bufs
+            return self._snapshot
 
     # ★★★ 추가: 카메라를 시작하는 함수 ★★★
     def start(self):
         """게임 시작 시 카메라를 켭니다."""
+        with self._cap_lock:
+            return self._start_locked()
+
+    def _start_locked(self):
+        if not self._open_locked():
+            return False
+        if self.mode in (self.MODE_THREAD, self.MODE_PROCESS):
+            self._start_worker()
+        return True # 이미 켜져 있으면 True 반환
+
+    def _open_locked(self):
+        """카메라(입력 소스)가 꺼져 있으면 엶 (_cap_lock 안에서 호출)"""
         if self.cap is None:
             try:
-                self.cap = cv2.VideoCapture(0)
-                if not self.cap.isOpened():
-                    print("Error: Camera 0 could not be opened.")
-                    self.cap = None
+                if not self.source.open():
+                    print(f"Error: {self.source.name} could not be opened.")
                     return False
-                print("Camera started successfully.")
-                return True
+                self.cap = self.source
+                print(f"{self.source.name} started successfully.")
             except Exception as e:
                 print(f"Error initializing camera: {e}")
                 self.cap = None
                 return False
-        return True # 이미 켜져 있으면 True 반환
+        return True
 
-    def update(self):
-        """매 프레임 호출되어야 하는 함수. 포즈를 감지하고 상태를 업데이트합니다."""
-        if not self.cap:
-            self.current_pose_name = "카메라 없음"
+    def _start_worker(self):
+        """캡처+추론 워커 스레드 시작 (이미 돌고 있으면 무시)"""
+        if self._worker is not None and self._worker.is_alive():
             return
+        self._stop_event.clear()
+        # 합성 랜드마크 소스는 추론이 필요 없으므로 프로세스 모드에서도 일반 워커로 처리
+        if self.mode == self.MODE_PROCESS and not self.source.provides_landmarks:
+            if self._inference is None:
+                self._inference = PoseInferenceProcess(
+                    inference_size=self.inference_size if self.roi_tracking else None)
+            self._worker = threading.Thread(target=self._capture_loop, name="PoseCapture", daemon=True)
+            self._result_worker = threading.Thread(target=self._result_loop, name="PoseResult", daemon=True)
+            self._result_worker.start()
+        else:
+            self._worker = threading.Thread(target=self._worker_loop, name="PoseWorker", daemon=True)
+        self._worker.start()
 
-        success, frame = self.cap.read()
-        if not success:
-            self.current_pose_name = "프레임 없음"
+    def _capture_loop(self):
+        """프로세스 모드: 캡처한 프레임을 빈 링 버퍼 슬롯에 바로 RGB로 기록해 추론 프로세스에 넘김"""
+        seq = 0
+        while self._throttle(blocking=True):
+            cap = self.cap
+            if not cap:
+                self._publish("카메라 없음")
+                self._stop_event.wait(0.05)
+                continue
+            frame = self._read_frame(cap)
+            if frame is None:
+                self._publish("프레임 없음")
+                self._stop_event.wait(0.05)
+                continue
+
+            self._end_frame_buffers()
+            # 해상도가 바뀌면 링/프로세스를 새로 만들고, 죽은 프로세스는 다시 띄움
+            if not self._inference.ensure_started(frame.shape):
+                self._fallback_to_thread()
+                return self._worker_loop() # 이 스레드가 캡처+추론을 이어서 함
+            slot = self._inference.acquire_slot()
+            if slot is None:
+                continue # 추론이 밀려 있음 -> 이 프레임은 drop
+            # 색 변환은 한 번, 결과는 공유 메모리 슬롯에 바로 기록
+            t_capture = self._capture_time(cap)
+            cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=self._inference.ring.slot(slot))
+            seq += 1
+            self._inference.submit(slot, seq, t_capture, time.perf_counter())
+
+    def _fallback_to_thread(self):
+        """추론 프로세스를 다시 띄울 수 없을 때 스레드 모드로 전환 (결과 수신 스레드는 스스로 끝남)"""
+        print("Pose inference process keeps failing, falling back to thread mode.")
+        inference = self._inference
+        self.mode = self.MODE_THREAD
+        self._inference = None
+        print(f"Pose inference stats: {inference.get_stats()}")
+        inference.stop()
+        if self.roi_tracking and self.roi is None:
+            self.roi = RoiTracker(self.inference_size)
+
+    def _result_loop(self):
+        """프로세스 모드: 추론 결과를 받아 판정하고 미니맵 프레임과 함께 게시"""
+        while not self._stop_event.is_set() and self.mode == self.MODE_PROCESS:
+            inference = self._inference
+            if inference is None or inference.ring is None:
+                self._stop_event.wait(0.05)
+                continue
+            try:
+                result = inference.get_result(timeout=0.1)
+            except queue.Empty:
+                continue
+            if result is None:
+                continue
+            generation, slot, seq, t_capture, t_convert, t_inference, lm = result
+
+            pose_name = "대기중"
+            if lm is not None:
+                try:
+                    pose_name = classify_landmarks(lm)
+                except Exception as e:
+                    pose_name = "인식 불가"
+            stamps = FrameStamps(t_capture, t_convert, t_inference, time.perf_counter())
+            # 미니맵은 슬롯에서 바로 축소해 만들므로 슬롯은 즉시 반납 (그 사이 링이 다시 만들어졌으면 버림)
+            with inference.ring_lock:
+                if generation != inference.generation:
+                    continue
+                minimap, minimap_buf = self._make_minimap(inference.ring.slot(slot), lm)
+                inference.release_slot(slot)
+            self._publish(pose_name, lm, minimap, stamps, (None, minimap_buf)) # lm은 결과마다 새 배열
+
+    def _worker_loop(self):
+        """스레드 모드: 카메라가 허용하는 속도로 계속 캡처+추론하여 최신 결과를 게시"""
+        while self._throttle(blocking=True): # 예산(상태별 처리 속도/일시정지)에 맞춰 대기
+            try:
+                ok = self._process_next_frame()
+            except Exception as e:
+                print(f"Pose worker error: {e}")
+                ok = False
+            if not ok:
+                # 카메라 오류 시 CPU를 태우지 않도록 잠시 대기
+                self._stop_event.wait(0.05)
+
+    def update(self):
+        """매 프레임 호출되어야 하는 함수. 포즈를 감지하고 상태를 업데이트합니다.
+        스레드/프로세스 모드에서는 워커가 대신 처리하므로 즉시 반환합니다."""
+        if self.mode != self.MODE_SYNC:
             return
+        if self._throttle(blocking=False):
+            self._process_next_frame()
 
-        # 1. OpenCV 프레임 처리 (거울 모드)
-        frame = cv2.flip(frame, 1) 
-        frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        
-        # 2. 미니맵용 프레임 저장 (game.py가 가져갈 데이터)
-        self.latest_frame_rgb = frame_rgb 
+    def _process_next_frame(self):
+        """프레임 1장을 읽어 포즈를 판정하고 결과를 게시합니다. 프레임을 못 읽으면 False."""
+        cap = self.cap
+        if not cap:
+            self._publish("카메라 없음")
+            return False
+
+        # 1. OpenCV 프레임 처리 (거울 모드, 미리 할당한 버퍼 재사용)
+        frame = self._read_frame(cap)
+        if frame is None:
+            self._publish("프레임 없음")
+            return False
+        t_capture = self._capture_time(cap)
+        # 색 변환은 이 한 번뿐: 추론과 미니맵이 같은 RGB 버퍼를 씀
+        # (RGB 버퍼는 이 경로에서만 할당, 프로세스 모드는 공유 링 슬롯에 바로 변환)
+        if self._rgb_buf is None or self._rgb_buf.shape != frame.shape:
+            self._rgb_buf = np.empty_like(frame)
+            self._buffer_alloc_bytes += self._rgb_buf.nbytes
+        frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=self._rgb_buf)
+        t_convert = time.perf_counter()
         
-        # 3. MediaPipe 포즈 감지
-        results = self.pose.process(frame_rgb)
+        # 합성 랜드마크 소스: MediaPipe를 건너뛰고 바로 판정
+        if cap.provides_landmarks:
+            return self._process_synthetic(cap.last_landmarks, frame_rgb, t_capture, t_convert)
+
+        # 2. MediaPipe 포즈 감지 (ROI 모드면 관심영역만 잘라 축소한 이미지로)
+        infer_input = self.roi.prepare(frame_rgb) if self.roi else frame_rgb
+        results = self._ensure_model().process(infer_input)
+        t_inference = time.perf_counter()
 
-        # 4. 포즈 판정 로직
-        self.current_pose_name = "대기중" # 기본 상태
+        # 3. 포즈 판정 로직
+        pose_name = "대기중" # 기본 상태
+        lm = None
+        lm_buf = None
         if results.pose_landmarks:
-            landmarks = results.pose_landmarks.landmark
+            lm_buf = self._free_buffer(0)
+            lm = landmarks_to_array(results.pose_landmarks.landmark, out=self._lm_bufs[lm_buf])
+            if self.roi:
+                self.roi.to_full_frame(lm) # 판정 임계값이 그대로 맞도록 전체 프레임 좌표로
             try:
-                # --- ★★★ 사용자님의 포즈 판정 로직 (그대로 복사) ★★★ ---
-                shoulder_R = [landmarks[self.mp_pose.PoseLandmark.RIGHT_SHOULDER.value].x, landmarks[self.mp_pose.PoseLandmark.RIGHT_SHOULDER.value].y]
-                elbow_R = [landmarks[self.mp_pose.PoseLandmark.RIGHT_ELBOW.value].x, landmarks[self.mp_pose.PoseLandmark.RIGHT_ELBOW.value].y]
-                wrist_R = [landmarks[self.mp_pose.PoseLandmark.RIGHT_WRIST.value].x, landmarks[self.mp_pose.PoseLandmark.RIGHT_WRIST.value].y]
-                hip_R = [landmarks[self.mp_pose.PoseLandmark.RIGHT_HIP.value].x, landmarks[self.mp_pose.PoseLandmark.RIGHT_HIP.value].y]
-                right_elbow_angle = calculate_angle(shoulder_R, elbow_R, wrist_R)
-                right_arm_angle = calculate_angle(elbow_R, shoulder_R, hip_R)
-                shoulder_wrist_y_diff = abs(shoulder_R[1] - wrist_R[1])
-                shoulder_elbow_y_diff = abs(shoulder_R[1] - elbow_R[1])
-                is_left_turn_gesture = (right_elbow_angle > 150) and (shoulder_wrist_y_diff < 0.15)  and (wrist_R[0] < shoulder_R[0]) and ( 75 < right_arm_angle < 105)
-                is_right_turn_gesture = (75 < right_elbow_angle < 105) and (wrist_R[1] < elbow_R[1]) and (shoulder_elbow_y_diff < 0.15) and (wrist_R[0] < shoulder_R[0]) and ( 75 < right_arm_angle < 105)
-                is_stop_gesture = (right_elbow_angle > 165) and (wrist_R[1] > shoulder_R[1] + 0.15) and (30 < right_arm_angle < 80) and (wrist_R[0] < shoulder_R[0])
-
-                if is_left_turn_gesture: self.current_pose_name = "좌회전"
-                elif is_right_turn_gesture: self.current_pose_name = "우회전"
-                elif is_stop_gesture: self.current_pose_name = "정지"
+                pose_name = classify_landmarks(lm)
             except Exception as e:
-                self.current_pose_name = "인식 불가"
+                pose_name = "인식 불가"
+        stamps = FrameStamps(t_capture, t_convert, t_inference, time.perf_counter())
         
-        # 5. 스켈레톤 그리기 (미니맵용 프레임에 덮어쓰기)
-        #    (game.py가 이 프레임을 가져가서 미니맵으로 사용)
-        if results.pose_landmarks:
-            frame_to_draw = cv2.cvtColor(self.latest_frame_rgb, cv2.COLOR_RGB2BGR)
-            self.mp_drawing.draw_landmarks(
-                frame_to_draw,
-                results.pose_landmarks,
-                self.mp_pose.POSE_CONNECTIONS)
-            self.latest_frame_rgb = cv2.cvtColor(frame_to_draw, cv2.COLOR_BGR2RGB)
+        if self.roi:
+            self.roi.update(lm) # 못 찾았으면 다음 프레임은 전체 프레임 탐색
+
+        # 4. 미니맵 만들기: 축소한 프레임 위에 스켈레톤 그리기
+        #    (game.py가 이 프레임을 가져가서 그대로 미니맵으로 사용)
+        minimap, minimap_buf = self._make_minimap(frame_rgb, lm)
+
+        # 5. 결과 게시 (포즈/랜드마크/미니맵 프레임/단계별 시각을 한 번에 교체)
+        self._end_frame_buffers()
+        self._publish(pose_name, lm, minimap, stamps, (lm_buf, minimap_buf))
+        return True
+
+    def _process_synthetic(self, landmarks, frame_rgb, t_capture, t_convert):
+        """합성 랜드마크 소스의 프레임 처리 (판정/그리기/게시만 수행, 추론 시간은 0으로 기록)"""
+        pose_name = "대기중"
+        lm = None
+        lm_buf = None
+        if landmarks is not None:
+            lm_buf = self._free_buffer(0)
+            lm = self._lm_bufs[lm_buf]
+            np.copyto(lm, landmarks)
+            try:
+                pose_name = classify_landmarks(lm)
+            except Exception as e:
+                pose_name = "인식 불가"
+        stamps = FrameStamps(t_capture, t_convert, t_convert, time.perf_counter())
+        minimap, minimap_buf = self._make_minimap(frame_rgb, lm)
+        self._end_frame_buffers()
+        self._publish(pose_name, lm, minimap, stamps, (lm_buf, minimap_buf))
+        return True
 
     def get_current_pose(self):
-        """game.py가 호출할 함수: 현재 판정된 포즈 이름 반환"""
-        return self.current_pose_name
+        """game.py가 호출할 함수: 현재 판정된 포즈 이름 반환 (대기 없음)"""
+        return self._snapshot.pose_name
 
     def get_minimap_frame(self):
-        """game.py가 호출할 함수: 미니맵에 그릴 프레임 반환"""
-        return self.latest_frame_rgb
+        """game.py가 호출할 함수: 미니맵에 그릴 (H, W, 3) RGB 프레임 반환 (이미 minimap_size로 축소됨, 대기 없음)"""
+        return self._snapshot.frame
 
     def stop(self):
-        """카메라 리소스 해제"""
-        if self.cap:
-            self.cap.release()
-            self.cap = None # ★★★ 추가: cap을 None으로 리셋
-            print("Camera released.")
\ No newline at end of file
+        """워커 종료 후 카메라 리소스 해제"""
+        if self._worker is not None:
+            self._stop_event.set()
+            self._wake_event.set()
+            self._worker.join(timeout=2.0)
+            self._worker = None
+        if self._result_worker is not None:
+            self._result_worker.join(timeout=2.0)
+            self._result_worker = None
+        if self._inference is not None:
+            print(f"Pose inference stats: {self._inference.get_stats()}")
+            self._inference.stop()
+            self._inference = None
+        with self._cap_lock:
+            if self.cap:
+                self.cap.release()
+                self.cap = None # ★★★ 추가: cap을 None으로 리셋
+                print("Camera released.")
\ No newline at end of file
@@ -0,0 +1,161 @@
+"""제스처 판정용 라벨 붙은 랜드마크 fixture 생성/로드
+
+오른팔 관절(어깨, 팔꿈치, 손목, 엉덩이)을 각도로 직접 배치해 (33, 4) 랜드마크를 만듭니다.
+좌회전/우회전/정지/대기 기본 자세(약간의 흔들림 포함)와, 판정 임계값(각도 30/75/80/105/150/165도,
+y 차이 0.15) 바로 안팎의 경계 사례를 함께 담습니다. fixtures/gesture_landmarks.json은 이 파일로 다시 만들 수 있습니다.
+    python pose_fixtures.py
+"""
+import json
+import math
+import os
+
+import numpy as np
+
+from pose_types import NUM_LANDMARKS, POSE_IDLE, POSE_LEFT, POSE_RIGHT, POSE_STOP, R_ELBOW, R_HIP, R_SHOULDER, R_WRIST
+
+FIXTURE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "gesture_landmarks.json")
+LABELS = {"idle": POSE_IDLE, "left_turn": POSE_LEFT, "right_turn": POSE_RIGHT, "stop": POSE_STOP}
+
+SHOULDER = (0.5, 0.4)
+HIP = (0.5, 0.75)
+UPPER_ARM = 0.15
+FOREARM = 0.14
+
+
+def make_arm_pose(elbow_angle, arm_angle, bend_up=True, jitter=0.0, rng=None, lean=0.0, upper_arm=UPPER_ARM):
+    """각도로 오른팔 자세를 만들어 (33, 4) float32 랜드마크로 반환합니다.
+
+    arm_angle: 팔꿈치-어깨-엉덩이 각도 (0이면 팔을 내림, 90이면 화면 왼쪽으로 수평)
+    elbow_angle: 어깨-팔꿈치-손목 각도 (180이면 팔을 곧게 폄)
+    bend_up: 팔꿈치를 굽힐 때 손목이 위(화면 y 감소)로 가면 True
+    lean: 몸 기울기(도). 엉덩이가 어깨 아래에서 화면 오른쪽으로 돌아간 각도 (팔도 같이 돌아감)
+    """
+    lm = np.zeros((NUM_LANDMARKS, 4), dtype=np.float32)
+    lm[:, :2] = (0.5, 0.55) # 판정에 쓰지 않는 관절은 몸 중앙, 보이지 않음으로 둠
+
+    torso = math.dist(SHOULDER, HIP)
+    b = math.radians(lean)
+    hip = (SHOULDER[0] + torso * math.sin(b), SHOULDER[1] + torso * math.cos(b))
+    a = math.radians(arm_angle - lean)
+    upper = (-math.sin(a), math.cos(a)) # 어깨 -> 팔꿈치 (엉덩이 방향에서 arm_angle만큼 회전)
+    elbow = (SHOULDER[0] + upper_arm * upper[0], SHOULDER[1] + upper_arm * upper[1])
+
+    # 팔꿈치 -> 어깨 방향을 elbow_angle만큼 돌리면 팔꿈치 -> 손목 방향
+    t = math.radians(-elbow_angle if bend_up else elbow_angle)
+    back = (-upper[0], -upper[1])
+    fore = (back[0] * math.cos(t) - back[1] * math.sin(t), back[0] * math.sin(t) + back[1] * math.cos(t))
+    wrist = (elbow[0] + FOREARM * fore[0], elbow[1] + FOREARM * fore[1])
+
+    for idx, (x, y) in ((R_SHOULDER, SHOULDER), (R_ELBOW, elbow), (R_WRIST, wrist), (R_HIP, hip)):
+        lm[idx] = (x, y, 0.0, 1.0)
+    if jitter:
+        rng = rng or np.random.default_rng()
+        lm[:, :2] += rng.uniform(-jitter, jitter, size=(NUM_LANDMARKS, 2)).astype(np.float32)
+    return lm
+
+
+def solve_param(make, feature, target, lo, hi, steps=60):
+    """feature(make(x)) == target이 되는 x를 [lo, hi]에서 이분법으로 찾음 (경계 사례용)"""
+    f_lo = feature(make(lo)) - target
+    if f_lo * (feature(make(hi)) - target) > 0:
+        raise ValueError(f"no solution in [{lo}, {hi}] for target {target}")
+    for _ in range(steps):
+        mid = (lo + hi) / 2
+        f_mid = feature(make(mid)) - target
+        if (f_mid < 0) == (f_lo < 0):
+            lo, f_lo = mid, f_mid
+        else:
+            hi = mid
+    return (lo + hi) / 2
+
+
+def _y(lm, a, b):
+    """랜드마크 a의 y - b의 y (판정에 쓰는 y 차이 특징값)"""
+    return float(lm[a, 1]) - float(lm[b, 1])
+
+
+def build_fixtures(samples_per_pose=40, jitter=0.004, seed=0):
+    """[(이름, 라벨, (33, 4) 랜드마크), ...] 목록 생성"""
+    rng = np.random.default_rng(seed)
+    fixtures = []
+
+    # --- 기본 자세 (흔들림 포함) ---
+    canonical = [
+        ("left_turn", 172, 90, True),   # 팔을 옆으로 곧게
+        ("right_turn", 90, 90, True),   # 팔은 옆으로, 팔꿈치를 세워 손은 위로
+        ("stop", 175, 45, True),        # 팔을 비스듬히 아래로 곧게
+        ("idle", 170, 12, True),        # 팔을 내림
+        ("idle", 125, 90, True),        # 애매하게 굽힘
+        ("idle", 90, 90, False),        # 팔꿈치를 아래로 굽힘
+    ]
+    for label, elbow, arm, up in canonical:
+        for i in range(samples_per_pose):
+            fixtures.append((f"{label}_e{elbow}_a{arm}_{i:02d}", label,
+                             make_arm_pose(elbow, arm, up, jitter=jitter, rng=rng)))
+
+    # --- 임계값 경계 사례 (흔들림 없음, 경계에서 1도 안/밖) ---
+    edges = [
+        # 좌회전: 팔꿈치 > 150, 75 < 팔 < 105
+        ("left_turn", 151, 90), ("idle", 149, 90),
+        ("left_turn", 172, 76), ("idle", 172, 74),
+        ("left_turn", 172, 104), ("idle", 172, 106),
+        # 우회전: 75 < 팔꿈치 < 105, 75 < 팔 < 105
+        ("right_turn", 76, 90), ("idle", 74, 90),
+        ("right_turn", 104, 90), ("idle", 106, 90),
+        ("right_turn", 90, 76), ("idle", 90, 74),
+        # 정지: 팔꿈치 > 165, 30 < 팔 < 80 (그리고 손목이 어깨보다 0.15 이상 아래)
+        ("stop", 166, 45), ("idle", 164, 45),
+        ("stop", 175, 31), ("idle", 175, 29),
+    ]
+    for label, elbow, arm in edges:
+        fixtures.append((f"edge_{label}_e{elbow}_a{arm}", label, make_arm_pose(elbow, arm)))
+
+    # 정지 팔 각도 상한 80: 똑바로 선 자세로는 손목이 어깨보다 0.15 아래로 안 내려가므로 몸을 기울여 손목을 0.2 아래로
+    lean = solve_param(lambda x: make_arm_pose(175, 79, lean=x), lambda lm: _y(lm, R_WRIST, R_SHOULDER), 0.2, 0, 60)
+    for label, arm in (("stop", 79), ("idle", 81)):
+        fixtures.append((f"edge_{label}_e175_a{arm}_lean", label, make_arm_pose(175, arm, lean=lean)))
+
+    # y 차이 0.15 경계: 다른 조건은 여유 있게 맞추고 y 차이만 0.145 / 0.155가 되도록 기울기(또는 팔 각도)를 찾음
+    y_edges = [
+        # 좌회전: |어깨y - 손목y| < 0.15 (손목이 위/아래 양쪽)
+        ("left_turn", "sw_up", lambda x: make_arm_pose(175, 90, lean=x), (R_SHOULDER, R_WRIST), 0.145, (-40, 0)),
+        ("idle", "sw_up", lambda x: make_arm_pose(175, 90, lean=x), (R_SHOULDER, R_WRIST), 0.155, (-40, 0)),
+        ("left_turn", "sw_down", lambda x: make_arm_pose(175, 90, lean=x), (R_SHOULDER, R_WRIST), -0.145, (0, 40)),
+        ("idle", "sw_down", lambda x: make_arm_pose(175, 90, lean=x), (R_SHOULDER, R_WRIST), -0.155, (0, 40)),
+        # 우회전: |어깨y - 팔꿈치y| < 0.15 (위팔이 0.15보다 길어야 닿으므로 upper_arm=0.2)
+        ("right_turn", "se_up", lambda x: make_arm_pose(90, 90, lean=x, upper_arm=0.2), (R_SHOULDER, R_ELBOW), 0.145, (-60, 0)),
+        ("idle", "se_up", lambda x: make_arm_pose(90, 90, lean=x, upper_arm=0.2), (R_SHOULDER, R_ELBOW), 0.155, (-60, 0)),
+        ("right_turn", "se_down", lambda x: make_arm_pose(90, 90, lean=x, upper_arm=0.2), (R_SHOULDER, R_ELBOW), -0.145, (0, 60)),
+        ("idle", "se_down", lambda x: make_arm_pose(90, 90, lean=x, upper_arm=0.2), (R_SHOULDER, R_ELBOW), -0.155, (0, 60)),
+        # 정지: 손목y > 어깨y + 0.15 (팔 각도로 맞춤)
+        ("stop", "ws", lambda x: make_arm_pose(175, x), (R_WRIST, R_SHOULDER), 0.155, (75, 40)),
+        ("idle", "ws", lambda x: make_arm_pose(175, x), (R_WRIST, R_SHOULDER), 0.145, (75, 40)),
+    ]
+    for label, name, make, (a, b), target, (lo, hi) in y_edges:
+        x = solve_param(make, lambda lm: _y(lm, a, b), target, lo, hi)
+        fixtures.append((f"edge_{label}_{name}_{target:+.3f}", label, make(x)))
+    return fixtures
+
+
+def write_fixtures(path=FIXTURE_PATH, **kwargs):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    data = [{"name": name, "label": label, "landmarks": np.round(lm.astype(np.float64), 5).tolist()}
+            for name, label, lm in build_fixtures(**kwargs)]
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, separators=(",", ":"))
+    return len(data)
+
+
+def load_fixtures(path=FIXTURE_PATH):
+    """(이름 목록, 라벨 코드 (F,) int8, 랜드마크 (F, 33, 4) float32) 반환"""
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    names = [d["name"] for d in data]
+    labels = np.array([LABELS[d["label"]] for d in data], dtype=np.int8)
+    landmarks = np.array([d["landmarks"] for d in data], dtype=np.float32)
+    return names, labels, landmarks
+
+
+if __name__ == "__main__":
+    count = write_fixtures()
+    print(f"{count} fixtures written to {FIXTURE_PATH}")
@@ -0,0 +1,235 @@
+"""PoseDetector의 프로세스 모드(MODE_PROCESS)용 추론 프로세스 관리 모듈
+
+MediaPipe Pose.process를 별도 프로세스에서 실행해 GIL 경쟁 없이 두 번째 코어를 사용합니다.
+- 프레임: pickle 없이 multiprocessing.shared_memory 링 버퍼 슬롯으로 전달
+- 결과: (33, 4) float32 랜드마크 배열(x, y, z, visibility)의 바이트(528B)만 전달
+"""
+import multiprocessing
+import queue
+import threading
+import time
+from collections import deque
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from pose_types import LANDMARK_FIELDS, NUM_LANDMARKS
+from roi_tracker import RoiTracker
+
+ROI_STATS_EVERY = 30 # 추론 프로세스가 ROI 통계를 결과에 실어 보내는 간격 (프레임)
+
+
+class SharedFrameRing:
+    """같은 크기의 RGB 프레임 슬롯 N개를 담는 공유 메모리 링 버퍼"""
+    def __init__(self, shape, slots, name=None):
+        self.shape = tuple(shape)
+        self.slots = slots
+        slot_bytes = int(np.prod(self.shape))
+        self._owner = name is None # 만든 쪽(게임 프로세스)만 unlink
+
+        if self._owner:
+            self.shm = shared_memory.SharedMemory(create=True, size=slot_bytes * slots)
+        else:
+            self.shm = shared_memory.SharedMemory(name=name)
+        self.frames = np.ndarray((slots,) + self.shape, dtype=np.uint8, buffer=self.shm.buf)
+
+    @property
+    def name(self):
+        return self.shm.name
+
+    def slot(self, index):
+        """슬롯 index의 (H, W, 3) uint8 뷰 (복사 없음)"""
+        return self.frames[index]
+
+    def close(self):
+        self.frames = None
+        try:
+            self.shm.close()
+        except BufferError:
+            # 밖에서 아직 슬롯 뷰를 잡고 있으면 매핑은 GC에 맡기고 이름만 정리
+            pass
+        if self._owner:
+            self.shm.unlink()
+
+
+def _inference_main(shm_name, shape, slots, jobs, results, min_detection_confidence, min_tracking_confidence, inference_size):
+    """추론 프로세스 본체: jobs에서 (slot, seq, t_capture, t_convert)를 받아 추론 완료 시각과 함께 results로 보냅니다.
+    inference_size가 있으면 ROI 추적 모드로 잘라 축소한 이미지를 추론하고 좌표는 전체 프레임 기준으로 돌려줍니다."""
+    import mediapipe as mp # 자식 프로세스에서만 로드
+    from pose_detector import landmarks_to_array # 게임 쪽은 pose_detector가 이 모듈을 import하므로 여기서만
+
+    ring = SharedFrameRing(shape, slots, name=shm_name)
+    lm_buf = np.empty((NUM_LANDMARKS, LANDMARK_FIELDS), dtype=np.float32) # 전송은 tobytes() 복사본
+    roi = RoiTracker(inference_size) if inference_size else None
+    pose = mp.solutions.pose.Pose(min_detection_confidence=min_detection_confidence,
+                                  min_tracking_confidence=min_tracking_confidence)
+    try:
+        while True:
+            job = jobs.get()
+            if job is None: # 종료 신호
+                break
+            slot, seq, t_capture, t_convert = job
+            frame = ring.slot(slot)
+            res = pose.process(roi.prepare(frame) if roi else frame)
+            t_inference = time.perf_counter()
+            lm = landmarks_to_array(res.pose_landmarks.landmark, out=lm_buf) if res.pose_landmarks else None
+            if roi:
+                if lm is not None:
+                    roi.to_full_frame(lm)
+                roi.update(lm)
+            lm_bytes = lm.tobytes() if lm is not None else None
+            # ROI 추적 통계는 게임 쪽 get_stats()에서 보이도록 가끔 함께 보냄
+            roi_stats = roi.get_stats() if roi and seq % ROI_STATS_EVERY == 0 else None
+            results.put((slot, seq, t_capture, t_convert, t_inference, lm_bytes, roi_stats))
+    finally:
+        pose.close()
+        ring.close()
+
+
+class PoseInferenceProcess:
+    """게임 프로세스 쪽에서 링 버퍼 슬롯과 추론 프로세스를 관리하는 클래스
+
+    슬롯은 free -> (캡처 스레드가 기록) -> in-flight(추론 중) -> (결과 수신 후 미니맵으로 축소) -> free 순으로 돕니다.
+    """
+
+    def __init__(self, slots=5, stale_after=0.25, min_detection_confidence=0.5, min_tracking_confidence=0.5, inference_size=None,
+                 max_restarts=3):
+        self.slots = slots
+        self.stale_after = stale_after # 캡처 후 이 시간(초)보다 늦게 도착한 결과는 stale로 집계
+        self.min_detection_confidence = min_detection_confidence
+        self.min_tracking_confidence = min_tracking_confidence
+        self.inference_size = inference_size # None이 아니면 자식 프로세스에서 ROI 추적 모드 사용
+
+        self.ring = None
+        self.process = None
+        self._ctx = multiprocessing.get_context("spawn") # pygame/스레드 상태를 물려받지 않도록
+        self._jobs = None
+        self._results = None
+        self._free = deque()
+        self._lock = threading.Lock()
+        self._last_seq = 0
+        # 링/프로세스를 다시 만들 때마다 증가. 결과 수신 스레드는 ring_lock을 잡고 generation을 확인한 뒤 슬롯을 읽음
+        self.generation = 0
+        self.ring_lock = threading.Lock()
+        self.max_restarts = max_restarts # 자식 프로세스가 죽어서 다시 띄운 횟수 한도 (넘으면 ensure_started가 False)
+
+        # --- 통계 ---
+        self.submitted = 0
+        self.completed = 0
+        self.dropped_frames = 0 # 빈 슬롯이 없어 추론에 못 보낸 캡처 프레임
+        self.stale_results = 0  # 너무 늦게(혹은 순서가 뒤바뀌어) 도착한 결과
+        self.abandoned = 0      # 재시작하면서 결과를 받지 못하고 버린 작업
+        self.restarts = 0       # 자식 프로세스가 죽어서 다시 띄운 횟수
+        self.resizes = 0        # 캡처 해상도가 바뀌어 링 버퍼를 다시 만든 횟수
+        self.roi_stats = {}     # 자식 프로세스의 RoiTracker 통계 (inference_size가 있을 때, 마지막으로 받은 값)
+
+    def ensure_started(self, shape):
+        """프레임 크기에 맞는 링 버퍼와 살아 있는 추론 프로세스를 보장합니다.
+        해상도가 바뀌면 링과 프로세스를 새로 만들고, 프로세스가 죽었으면 다시 띄웁니다.
+        다시 띄운 횟수가 max_restarts를 넘으면 False (호출한 쪽에서 스레드 모드로 전환)."""
+        shape = tuple(shape)
+        if self.ring is not None:
+            if self.ring.shape == shape and self.process.is_alive():
+                return True
+            if self.ring.shape != shape:
+                print(f"Capture resolution changed {self.ring.shape} -> {shape}, restarting pose inference process.")
+                self.resizes += 1
+            else:
+                print(f"Pose inference process died (exitcode={self.process.exitcode}), restarting.")
+                self.restarts += 1
+            self.stop()
+        if self.restarts > self.max_restarts:
+            return False
+
+        with self.ring_lock:
+            self.ring = SharedFrameRing(shape, self.slots)
+            self.generation += 1
+            self._last_seq = 0
+            self._free = deque(range(self.slots))
+            self._jobs = self._ctx.Queue()
+            self._results = self._ctx.Queue()
+        self.process = self._ctx.Process(
+            target=_inference_main,
+            args=(self.ring.name, self.ring.shape, self.slots, self._jobs, self._results,
+                  self.min_detection_confidence, self.min_tracking_confidence, self.inference_size),
+            name="PoseInference",
+            daemon=True)
+        self.process.start()
+        print(f"Pose inference process started (pid={self.process.pid}, slots={self.slots}).")
+        return True
+
+    def acquire_slot(self):
+        """기록할 빈 슬롯 번호 반환. 없으면 None (해당 프레임은 drop으로 집계)"""
+        with self._lock:
+            if self._free:
+                return self._free.popleft()
+            self.dropped_frames += 1
+            return None
+
+    def release_slot(self, slot):
+        with self._lock:
+            self._free.append(slot)
+
+    def submit(self, slot, seq, t_capture, t_convert):
+        self.submitted += 1
+        self._jobs.put((slot, seq, t_capture, t_convert))
+
+    def get_result(self, timeout):
+        """다음 추론 결과 (generation, slot, seq, t_capture, t_convert, t_inference, landmarks|None) 반환.
+        순서가 뒤바뀐 결과는 버리고 None을 반환합니다. 대기 시간 초과 시 queue.Empty.
+        슬롯은 ring_lock을 잡은 채 generation이 그대로일 때만 읽어야 합니다 (그 사이 재시작됐을 수 있음)."""
+        generation, results = self.generation, self._results
+        if results is None: # 재시작 중
+            time.sleep(timeout)
+            raise queue.Empty
+        slot, seq, t_capture, t_convert, t_inference, lm_bytes, roi_stats = results.get(timeout=timeout)
+        if roi_stats is not None:
+            self.roi_stats = roi_stats
+        with self.ring_lock:
+            if generation != self.generation:
+                return None # 재시작 전 프로세스의 결과 (슬롯은 이미 새 링에서 모두 free)
+            self.completed += 1
+            if seq <= self._last_seq:
+                self.stale_results += 1
+                self.release_slot(slot)
+                return None
+            self._last_seq = seq
+        if time.perf_counter() - t_capture > self.stale_after:
+            self.stale_results += 1
+
+        landmarks = None
+        if lm_bytes is not None:
+            landmarks = np.frombuffer(lm_bytes, dtype=np.float32).reshape(NUM_LANDMARKS, LANDMARK_FIELDS)
+        return generation, slot, seq, t_capture, t_convert, t_inference, landmarks
+
+    def get_stats(self):
+        return dict(self.roi_stats, **{
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "dropped_frames": self.dropped_frames,
+            "stale_results": self.stale_results,
+            "in_flight": self.submitted - self.completed - self.abandoned,
+            "abandoned": self.abandoned,
+            "restarts": self.restarts,
+            "resizes": self.resizes,
+        })
+
+    def stop(self):
+        """추론 프로세스 종료 및 공유 메모리 정리"""
+        if self.process is not None:
+            try:
+                self._jobs.put(None)
+                self.process.join(timeout=2.0)
+            except Exception as e:
+                print(f"Pose inference process stop error: {e}")
+            if self.process.is_alive():
+                self.process.terminate()
+            self.process = None
+        with self.ring_lock:
+            if self.ring is not None:
+                self.ring.close()
+                self.ring = None
+            # 진행 중이던 작업의 결과는 더 받지 않음 (재시작하면 새 큐와 모두 free인 슬롯으로 시작)
+            self.generation += 1
+            self.abandoned += self.submitted - self.completed - self.abandoned # 이번에 버린 작업(진행 중이던 것)만 더함
+            self._jobs = self._results = None
@@ -0,0 +1,37 @@
+"""포즈 판정 결과/설정 타입 (cv2, mediapipe 없이 import 가능)
+
+게임 시작 시 무거운 pose_detector를 불러오기 전에도 상태별 예산이나 실행 방식을 정할 수 있도록
+가벼운 상수와 namedtuple만 모아 둡니다. pose_detector에서도 그대로 다시 내보냅니다.
+"""
+from collections import namedtuple
+
+# PoseDetector 실행 방식
+MODE_SYNC = "sync"       # 기존 방식: game 루프에서 update() 호출 시 캡처+추론
+MODE_THREAD = "thread"   # 백그라운드 워커가 계속 캡처+추론, update()는 즉시 반환
+MODE_PROCESS = "process" # 캡처는 스레드, 추론은 별도 프로세스 (공유 메모리 링 버퍼)
+
+# MediaPipe Pose 랜드마크 배열 (33, 4): x, y, z, visibility
+NUM_LANDMARKS = 33
+LANDMARK_FIELDS = 4
+# 판정에 쓰는 오른쪽 팔 관절 인덱스 (mediapipe PoseLandmark 값, 판정기가 mediapipe 없이 돌도록 숫자로 둠)
+R_SHOULDER = 12
+R_ELBOW = 14
+R_WRIST = 16
+R_HIP = 24
+
+# 포즈 판정 결과 코드 (채점 버퍼 등에서 문자열 대신 사용)
+POSE_IDLE = 0
+POSE_LEFT = 1
+POSE_RIGHT = 2
+POSE_STOP = 3
+POSE_NAMES = ("대기중", "좌회전", "우회전", "정지")
+POSE_CODES = {name: code for code, name in enumerate(POSE_NAMES)}
+
+# 상태별 포즈 인식 예산
+# rate: 초당 최대 처리 프레임 수 (None이면 제한 없음, 0이면 일시정지)
+# release_after: 일시정지가 이 시간(초) 이상 이어지면 카메라까지 해제 (None이면 카메라 유지)
+PoseBudget = namedtuple("PoseBudget", ["rate", "release_after"], defaults=[None, None])
+
+# 워커가 한 번에 게시하는 최신 결과 묶음 (통째로 교체되므로 읽는 쪽은 잠금 불필요)
+# (프레임별 단계 시각은 stamps: latency.FrameStamps)
+PoseSnapshot = namedtuple("PoseSnapshot", ["pose_name", "landmarks", "frame", "generation", "stamps"], defaults=[None])
@@ -1,5 +1,7 @@
 import pygame
 
+from asset_pack import entry_name
+
 # 방향 상수 (game.py와 통일)
 DIR_UP = 1
 DIR_DOWN = 2
@@ -7,7 +9,21 @@ DIR_LEFT = 3
 DIR_RIGHT = 4
 
 class RoadSegment(pygame.sprite.Sprite):
+    """도로 조각 1개. rect는 월드 좌표로 생성 시 한 번만 정해지고, 화면에는 카메라 위치만큼 밀어서 그립니다."""
     TILE_SIZE = 400 
+    SEGMENT_TYPES = ('straight', 'left_turn', 'right_turn', 'stop_signal')
+    IMAGE_FILES = {
+        'left_turn': "assets/road_corner_left1.png",
+        'right_turn': "assets/road_corner_right1.png",
+        'straight': "assets/road_straight.png",
+        'stop_signal': "assets/road_straight.png",
+    }
+
+    # 모든 도로 조각이 공유하는 이미지 캐시 (조각마다 따로 불러오고 회전하지 않음, 공유하므로 수정 금지)
+    # (segment_type, in_direction, TILE_SIZE) -> 회전까지 끝난 Surface
+    _image_cache = {}
+    # (segment_type, TILE_SIZE) -> 회전 전 Surface (디스크에서 읽고 크기 조정/횡단보도까지 끝난 것)
+    _base_cache = {}
 
     def __init__(self, game, segment_type, prev_segment=None):
         super().__init__()
@@ -21,7 +37,7 @@ class RoadSegment(pygame.sprite.Sprite):
             start_pos = prev_segment.exit_point
         else:
             self.in_direction = DIR_UP
-            # 첫 도로 위치
+            # 첫 도로 위치 (카메라가 (0, 0)일 때 화면 아래쪽 바깥)
             start_pos = (self.game.SCREEN_WIDTH // 2, self.game.SCREEN_HEIGHT + 100)
 
         self.out_direction = self.in_direction 
@@ -44,8 +60,8 @@ class RoadSegment(pygame.sprite.Sprite):
         elif self.type == 'stop_signal':
             self.mission_name = "정지"
 
-        # 이미지 로드
-        self.image = self.load_and_rotate_image()
+        # 이미지 (캐시에서 공유)
+        self.image = self.get_image(self.game, self.type, self.in_direction)
         self.rect = self.image.get_rect()
         
         # 위치 잡기
@@ -62,44 +78,59 @@ class RoadSegment(pygame.sprite.Sprite):
         elif self.out_direction == DIR_RIGHT: return self.rect.midright
         return self.rect.center
 
-    def load_and_rotate_image(self):
+    @classmethod
+    def get_image(cls, game, segment_type, in_direction):
+        """진입 방향에 맞게 회전된 도로 이미지 (처음 요청될 때 한 번만 만들고 이후엔 캐시에서 반환)"""
+        key = (segment_type, in_direction, cls.TILE_SIZE)
+        image = cls._image_cache.get(key)
+        if image is None:
+            angle = 0
+            if in_direction == DIR_LEFT: angle = 90
+            elif in_direction == DIR_DOWN: angle = 180
+            elif in_direction == DIR_RIGHT: angle = -90
+            # 에셋 팩에 구워져 있으면 디코딩/크기 조정/회전 없이 팩에서 가져옴
+            name = entry_name(f"road/{segment_type}", (cls.TILE_SIZE, cls.TILE_SIZE), rotation=angle)
+            image = game.assets.surface(name, lambda: pygame.transform.rotate(cls.load_base_image(game, segment_type), angle))
+            cls._image_cache[key] = image
+        return image
+
+    @classmethod
+    def load_base_image(cls, game, segment_type):
+        """회전 전 도로 이미지: 파일 로드 + 크기 조정 + (정지 구간이면) 횡단보도"""
+        key = (segment_type, cls.TILE_SIZE)
+        img = cls._base_cache.get(key)
+        if img is not None:
+            return img
         try:
-            if self.type == 'left_turn':
-                img = pygame.image.load("assets/road_corner_left1.png").convert_alpha()
-            elif self.type == 'right_turn':
-                img = pygame.image.load("assets/road_corner_right1.png").convert_alpha()
-            else: 
-                img = pygame.image.load("assets/road_straight.png").convert_alpha()
-
-            img = pygame.transform.scale(img, (self.TILE_SIZE, self.TILE_SIZE))
+            img = pygame.image.load(cls.IMAGE_FILES.get(segment_type, cls.IMAGE_FILES['straight'])).convert_alpha()
+            img = pygame.transform.scale(img, (cls.TILE_SIZE, cls.TILE_SIZE))
             
             # ★★★ 횡단보도 그리기 ★★★
-            if self.type == 'stop_signal':
+            if segment_type == 'stop_signal':
                 # 횡단보도 그리기 설정
                 stripe_width = 40 # 흰색 줄 너비
                 stripe_height = 300 # 흰색 줄 높이 (세로 길이)
                 gap = 30 # 줄 사이 간격
-                y_pos = (self.TILE_SIZE - stripe_height) // 2 # 도로 중앙 y좌표
+                y_pos = (cls.TILE_SIZE - stripe_height) // 2 # 도로 중앙 y좌표
 
                 # 도로 너비만큼 반복해서 그리기
-                for x in range(0, self.TILE_SIZE, stripe_width + gap):
-                    pygame.draw.rect(img, self.game.COLORS["white"], (x, y_pos, stripe_width, stripe_height))
+                for x in range(0, cls.TILE_SIZE, stripe_width + gap):
+                    pygame.draw.rect(img, game.COLORS["white"], (x, y_pos, stripe_width, stripe_height))
 
         except Exception as e:
-            img = pygame.Surface((self.TILE_SIZE, self.TILE_SIZE))
+            img = pygame.Surface((cls.TILE_SIZE, cls.TILE_SIZE))
             img.fill((100, 100, 100))
+        cls._base_cache[key] = img
+        return img
 
-        angle = 0
-        if self.in_direction == DIR_LEFT: angle = 90
-        elif self.in_direction == DIR_DOWN: angle = 180
-        elif self.in_direction == DIR_RIGHT: angle = -90
-        
-        return pygame.transform.rotate(img, angle)
-
-    def update(self):
-        self.rect.x -= self.game.world_velocity[0]
-        self.rect.y -= self.game.world_velocity[1]
-        # 삭제는 game.py의 cleanup_segments가 담당
+    @classmethod
+    def preload(cls, game):
+        """모든 도로 종류 x 진입 방향 이미지를 미리 만들어 둡니다 (게임 중 디스크 I/O·회전으로 인한 끊김 방지)"""
+        for segment_type in cls.SEGMENT_TYPES:
+            for in_direction in (DIR_UP, DIR_DOWN, DIR_LEFT, DIR_RIGHT):
+                cls.get_image(game, segment_type, in_direction)
+        cls._base_cache.clear() # 회전된 이미지만 있으면 충분
 
-    def draw(self, screen):
-        screen.blit(self.image, self.rect)
\ No newline at end of file
+    def draw(self, screen, camera=(0, 0)):
+        # 스크롤은 game.py의 카메라 위치로 처리 (조각마다 좌표를 옮기지 않음), 삭제는 cleanup_segments가 담당
+        return screen.blit(self.image, (self.rect.x - camera[0], self.rect.y - camera[1]))
\ No newline at end of file
@@ -0,0 +1,130 @@
+import math
+
+import cv2
+import numpy as np
+
+
+class RoiTracker:
+    """직전 프레임 랜드마크 주변만 잘라 축소한 이미지로 포즈 추론을 돌리기 위한 관심영역(ROI) 추적기
+
+    - prepare(): 추론에 넣을 이미지 반환 (ROI가 있으면 잘라내기, 항상 inference_size 이하로 축소)
+    - to_full_frame(): 추론 결과 랜드마크를 전체 프레임 기준 정규화 좌표로 되돌림
+    - update(): 다음 프레임의 ROI 갱신 (랜드마크가 없으면 추적 실패 -> 다음은 전체 프레임 탐색)
+
+    MediaPipe Pose(static_image_mode=False)는 프레임 사이에 자체적으로 관심영역을 추적하므로
+    잘라내는 위치가 매 프레임 움직이면 그 추적이 어긋납니다. 그래서 ROI는 프레임과 같은 가로세로 비율로 고정하고,
+    몸이 ROI 안쪽 여백(margin)을 벗어나거나 ROI가 몸에 비해 너무 커졌을 때만 다시 잡습니다.
+    """
+    def __init__(self, inference_size=320, padding=0.25, min_size=0.3, min_visibility=0.5, margin=0.1,
+                 shrink_ratio=0.6):
+        self.inference_size = inference_size # 추론 이미지의 긴 변 최대 픽셀
+        self.padding = padding               # 랜드마크 bbox 긴 변 대비 여백 비율
+        self.min_size = min_size             # ROI 최소 크기 (프레임 대비 비율)
+        self.min_visibility = min_visibility
+        self.margin = margin                 # 몸 bbox가 ROI 가장자리에서 이 비율 안쪽에 있으면 ROI 유지
+        self.shrink_ratio = shrink_ratio     # 새로 잡을 ROI가 지금의 이 비율보다 작아지면 다시 잡음
+
+        self.roi = None    # 다음 프레임에 쓸 (x0, y0, x1, y1) 정규화 좌표, None이면 전체 프레임
+        self._crop = None  # 이번 프레임에 실제로 쓴 (x0, y0, w, h) 픽셀 + 원본 (W, H)
+        self._infer_buf = np.empty(inference_size * inference_size * 3, dtype=np.uint8)
+
+        # --- 통계 ---
+        self.roi_frames = 0
+        self.full_frames = 0
+        self.lost_count = 0
+        self.recrops = 0 # ROI를 새로 잡은 횟수 (적을수록 MediaPipe 추적이 안정적)
+        self.pixels_processed = 0
+
+    def prepare(self, frame_rgb):
+        """추론에 넣을 (h, w, 3) 연속 배열 반환 (미리 할당한 버퍼의 뷰)"""
+        H, W = frame_rgb.shape[:2]
+        if self.roi is not None:
+            cw, ch = self._crop_size(self.roi[2] - self.roi[0], W, H)
+            x0 = min(int(self.roi[0] * W), W - cw)
+            y0 = min(int(self.roi[1] * H), H - ch)
+            x1, y1 = x0 + cw, y0 + ch
+            self.roi_frames += 1
+        else:
+            x0, y0, x1, y1 = 0, 0, W, H
+            self.full_frames += 1
+        crop = frame_rgb[y0:y1, x0:x1]
+        cw, ch = x1 - x0, y1 - y0
+        self._crop = (x0, y0, cw, ch, W, H)
+
+        # 긴 변을 inference_size에 맞춰 축소 (확대는 하지 않음)
+        scale = min(1.0, self.inference_size / max(cw, ch))
+        iw, ih = max(1, int(cw * scale)), max(1, int(ch * scale))
+        self.pixels_processed += iw * ih
+        out = self._infer_buf[:iw * ih * 3].reshape(ih, iw, 3)
+        if (iw, ih) == (cw, ch):
+            out[:] = crop
+        else:
+            cv2.resize(crop, (iw, ih), dst=out, interpolation=cv2.INTER_AREA)
+        return out
+
+    @staticmethod
+    def _crop_size(size, W, H):
+        """정규화 크기 size인 ROI의 픽셀 크기: 반올림으로 비율이 흔들리지 않도록 프레임 비율의 정수배"""
+        g = math.gcd(W, H)
+        if g < 8: # 비율 단위가 너무 작은 해상도
+            return max(1, round(size * W)), max(1, round(size * H))
+        k = max(1, round(size * g))
+        return k * (W // g), k * (H // g)
+
+    def to_full_frame(self, lm):
+        """prepare()에 쓴 잘라내기 기준 랜드마크 (33, 4)를 전체 프레임 정규화 좌표로 제자리 변환"""
+        x0, y0, cw, ch, W, H = self._crop
+        if (cw, ch) == (W, H):
+            return lm
+        lm[:, 0] = (x0 + lm[:, 0] * cw) / W
+        lm[:, 1] = (y0 + lm[:, 1] * ch) / H
+        lm[:, 2] *= cw / W # z는 이미지 너비 기준 스케일
+        return lm
+
+    def update(self, lm):
+        """전체 프레임 기준 랜드마크로 다음 ROI를 정합니다. lm이 None이면 추적 실패로 보고 초기화."""
+        if lm is None:
+            if self.roi is not None:
+                self.lost_count += 1
+            self.roi = None
+            return
+
+        visible = lm[:, 3] > self.min_visibility
+        if visible.sum() < 4:
+            self.roi = None
+            return
+        xs = lm[visible, 0]
+        ys = lm[visible, 1]
+        bx0, bx1, by0, by1 = float(xs.min()), float(xs.max()), float(ys.min()), float(ys.max())
+        size = max(bx1 - bx0, by1 - by0, self.min_size) * (1 + 2 * self.padding)
+        if self.roi is not None and self._keeps(self.roi, bx0, by0, bx1, by1, size):
+            return
+
+        if size >= 0.95:
+            self.roi = None # 거의 전체 프레임이면 잘라낼 이득 없음
+            return
+        # 몸 중심에 놓되 크기는 그대로 두고 프레임 안으로 밀어 넣음 (가장자리에서 잘려 비율이 바뀌지 않도록)
+        x0 = min(max((bx0 + bx1) / 2 - size / 2, 0.0), 1.0 - size)
+        y0 = min(max((by0 + by1) / 2 - size / 2, 0.0), 1.0 - size)
+        self.roi = (x0, y0, x0 + size, y0 + size)
+        self.recrops += 1
+
+    def _keeps(self, roi, bx0, by0, bx1, by1, size):
+        """지금 ROI를 그대로 써도 되는지: 몸 bbox가 안쪽 여백 안에 있고 (프레임 가장자리 쪽은 여백 무시)
+        몸에 비해 ROI가 지나치게 크지 않음"""
+        x0, y0, x1, y1 = roi
+        m = (x1 - x0) * self.margin
+        edge = 1e-6
+        inside = ((bx0 >= x0 + m or x0 <= edge) and (bx1 <= x1 - m or x1 >= 1.0 - edge) and
+                  (by0 >= y0 + m or y0 <= edge) and (by1 <= y1 - m or y1 >= 1.0 - edge))
+        return inside and size >= (x1 - x0) * self.shrink_ratio
+
+    def get_stats(self):
+        frames = self.roi_frames + self.full_frames
+        return {
+            "roi_frames": self.roi_frames,
+            "full_frames": self.full_frames,
+            "lost_count": self.lost_count,
+            "recrops": self.recrops,
+            "avg_pixels_per_frame": self.pixels_processed / frames if frames else 0.0,
+        }
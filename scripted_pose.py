@@ -0,0 +1,69 @@
+"""PoseDetector 대신 쓰는 대본 재생기 (카메라, cv2, mediapipe 없이 헤드리스 시뮬레이션/세션 재생용)
+
+게임의 시뮬레이션 틱(game.sim_ticks - 세션 시작 틱)을 기준으로 포즈 결과를 게시합니다.
+- timeline: [(틱, 포즈 이름), ...] 틱 오름차순. update()에서 그 틱에 도달한 항목을 새 결과로 게시
+  (Game이 녹화한 세션의 "poses"를 그대로 넣으면 채점에 들어간 샘플이 같은 틱에 같은 순서로 다시 들어감)
+- autoplay: timeline 대신 채점 중인 미션의 포즈를 매 틱 게시 (accuracy 비율만 정답, 나머지는 대기중)
+"""
+import random
+
+from pose_types import POSE_NAMES, PoseSnapshot
+
+
+class ScriptedPoseDetector:
+    def __init__(self, game, timeline=(), autoplay=False, accuracy=1.0, seed=0):
+        self.game = game
+        self.timeline = sorted((int(tick), pose) for tick, pose in timeline)
+        self.autoplay = autoplay
+        self.accuracy = accuracy
+        self.rng = random.Random(seed) # 게임의 rng와 분리 (자동 플레이가 도로 생성 순서를 바꾸지 않도록)
+        self._index = 0
+        self._snapshot = PoseSnapshot(POSE_NAMES[0], None, None, 0)
+        self.published = 0
+
+    # --- PoseDetector와 같은 인터페이스 (game.py가 쓰는 것만) ---
+    def set_schedule(self, schedule):
+        pass
+
+    def apply_schedule(self, key):
+        pass
+
+    def start(self):
+        return True
+
+    def warm_start(self, warmup_frames=3):
+        return True
+
+    def stop(self):
+        pass
+
+    @property
+    def frame_generation(self):
+        return self._snapshot.generation
+
+    def get_snapshot(self):
+        return self._snapshot
+
+    def get_current_pose(self):
+        return self._snapshot.pose_name
+
+    def get_stats(self):
+        return {"published": self.published, "timeline": len(self.timeline), "autoplay": self.autoplay}
+
+    def _publish(self, pose_name):
+        prev = self._snapshot
+        self._snapshot = PoseSnapshot(pose_name, None, None, prev.generation + 1)
+        self.published += 1
+
+    def update(self):
+        """이번 틱에 게시할 결과가 있으면 게시 (시뮬레이션 틱마다 update_simulation 전에 한 번 호출)"""
+        if self.autoplay:
+            if self.game.game_state == self.game.STATE_GRADING:
+                correct = self.rng.random() < self.accuracy
+                self._publish(self.game.current_mission if correct else POSE_NAMES[0])
+            return
+
+        tick = self.game.session_tick()
+        while self._index < len(self.timeline) and self.timeline[self._index][0] <= tick:
+            self._publish(self.timeline[self._index][1])
+            self._index += 1
@@ -0,0 +1,177 @@
+"""헤드리스 게임 시뮬레이션: 녹화된 세션 재생 / 자동 플레이로 게임 로직과 그리기 성능을 측정하는 스크립트
+
+창, 카메라, mediapipe 없이 (SDL dummy 드라이버) 프레임 제한 없이 돌립니다. 한 프레임 = 시뮬레이션 틱 1번 + draw 1번.
+게임이 끝날 때 저장되는 last_session.json(시드 + 틱별 포즈)을 넣으면 같은 게임을 그대로 재생하고
+점수/실수/종료 틱이 녹화 때와 같은지 확인합니다 (다르면 종료 코드 1, 회귀 테스트용).
+    python sim_replay.py last_session.json
+    python sim_replay.py --autoplay --seed 7 --frames 20000 --no-draw
+    python sim_replay.py --autoplay --seed 7 --pause 600:300 --verify  (일시정지가 있는 세션도 그대로 재생되는지 확인)
+프레임별 update_playing / update_grading / draw 시간(ms)과 요약(p50/p95/p99)은 --report 파일(JSON)에 기록됩니다.
+"""
+import argparse
+import json
+import sys
+import time
+
+import numpy as np
+
+from game import Game
+from scripted_pose import ScriptedPoseDetector
+
+TIMED_STATES = {Game.STATE_PLAYING: "update_playing", Game.STATE_GRADING: "update_grading"}
+PERCENTILES = (50, 95, 99)
+
+
+def summarize(ms):
+    if len(ms) == 0:
+        return {"count": 0}
+    values = np.percentile(ms, PERCENTILES)
+    summary = {"count": int(len(ms)), "mean": round(float(ms.mean()), 4), "max": round(float(ms.max()), 4)}
+    summary.update({f"p{p}": round(float(v), 4) for p, v in zip(PERCENTILES, values)})
+    return summary
+
+
+def run(record=None, seed=0, autoplay=False, accuracy=1.0, max_frames=None, draw=True, screen_size=(1920, 1080),
+        pause=None):
+    """pause: (세션 틱, 프레임 수) - 주행 중 그 틱에 도달하면 일시정지하고 그 프레임 수만큼 있다가 재개"""
+    timeline = ()
+    if record is not None:
+        if record.get("sim_hz", Game.SIM_HZ) != Game.SIM_HZ:
+            print(f"Error: session was recorded at {record['sim_hz']} Hz, game runs at {Game.SIM_HZ} Hz")
+            return None
+        seed = record["seed"]
+        screen_size = tuple(record["screen_size"])
+        timeline = record["poses"]
+        if max_frames is None: # 녹화된 종료 틱 + 여유
+            max_frames = (record.get("result", {}).get("ticks") or 0) + Game.SIM_HZ * 10
+    if max_frames is None:
+        max_frames = 10000
+
+    game = Game(headless=True, seed=seed, screen_size=screen_size,
+                pose_factory=lambda g: ScriptedPoseDetector(g, timeline, autoplay, accuracy, seed))
+    game.loader.join()
+    if game.load_error:
+        print(f"Error: {game.load_error}")
+        return None
+    game.start_game()
+    game.timestep.alpha = 1.0 # 보간 없이 현재 틱 위치로 그림
+
+    states = np.zeros(max_frames, dtype=np.int8)
+    update_ms = np.zeros(max_frames)
+    draw_ms = np.zeros(max_frames)
+    frames = 0
+    start = time.perf_counter()
+    pause_left = None
+    while frames < max_frames:
+        if pause and pause_left is None and game.game_state == Game.STATE_PLAYING and game.session_tick() >= pause[0]:
+            game.pause_game()
+            pause_left = pause[1]
+        if game.game_state == Game.STATE_PAUSE:
+            pause_left -= 1
+            if pause_left <= 0:
+                game.resume_game()
+        game.pose_detector.update()
+        state = game.game_state
+        t0 = time.perf_counter()
+        game.update_simulation()
+        t1 = time.perf_counter()
+        if draw:
+            game.draw()
+            game.renderer.skip() # 화면에 내보내지는 않음 (등록된 영역만 비움)
+        t2 = time.perf_counter()
+
+        states[frames] = state
+        update_ms[frames] = (t1 - t0) * 1000
+        draw_ms[frames] = (t2 - t1) * 1000
+        frames += 1
+        if game.game_state == Game.STATE_GAMEOVER:
+            break
+    elapsed = time.perf_counter() - start
+
+    states, update_ms, draw_ms = states[:frames], update_ms[:frames], draw_ms[:frames]
+    timings = {name: summarize(update_ms[states == code]) for code, name in TIMED_STATES.items()}
+    if draw:
+        timings["draw"] = summarize(draw_ms)
+
+    result = {"score": game.score, "mistakes": game.mistakes, "ticks": game.game_over_tick}
+    report = {
+        "mode": "replay" if record is not None else ("autoplay" if autoplay else "idle"),
+        "seed": seed,
+        "screen_size": list(screen_size),
+        "frames": frames,
+        "seconds": round(elapsed, 4),
+        "fps": round(frames / elapsed, 1) if elapsed else 0.0,
+        "result": result,
+        "timings_ms": timings,
+        "per_frame": {
+            "state": states.tolist(),
+            "update_ms": np.round(update_ms, 4).tolist(),
+            "draw_ms": np.round(draw_ms, 4).tolist() if draw else [],
+        },
+        "cull_stats": game.cull_stats,
+    }
+    if game.game_over_tick is not None: # 끝난 게임은 그대로 재생할 수 있는 세션 기록도 남김
+        report["session"] = game.session_record()
+    if record is not None and "result" in record:
+        report["expected"] = record["result"]
+        report["match"] = record["result"] == result
+    game.pose_detector.stop()
+    return report
+
+
+def parse_size(text):
+    w, h = text.lower().split("x")
+    return int(w), int(h)
+
+
+def parse_pause(text):
+    tick, length = text.split(":")
+    return int(tick), int(length)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="헤드리스 게임 시뮬레이션 (세션 재생 / 자동 플레이 성능 측정)")
+    parser.add_argument("session", nargs="?", help="재생할 세션 기록 (last_session.json)")
+    parser.add_argument("--autoplay", action="store_true", help="세션 대신 미션 정답 포즈를 자동으로 입력")
+    parser.add_argument("--accuracy", type=float, default=1.0, help="자동 플레이 정답 비율 (0~1)")
+    parser.add_argument("--seed", type=int, default=0, help="도로 생성 시드 (세션 재생 시 무시)")
+    parser.add_argument("--frames", type=int, default=None, help="최대 프레임 수")
+    parser.add_argument("--size", type=parse_size, default=(1920, 1080), help="화면 크기 WxH (세션 재생 시 무시)")
+    parser.add_argument("--no-draw", action="store_true", help="그리기 없이 게임 로직만")
+    parser.add_argument("--report", default="sim_report.json", help="프레임별 타이밍 리포트 (JSON)")
+    parser.add_argument("--pause", type=parse_pause, default=None, help="TICK:FRAMES 주행 중 이 세션 틱에 일시정지")
+    parser.add_argument("--verify", action="store_true", help="끝난 게임의 세션 기록을 다시 재생해 결과가 같은지 확인")
+    args = parser.parse_args()
+
+    record = None
+    if args.session:
+        with open(args.session, "r", encoding="utf-8") as f:
+            record = json.load(f)
+    report = run(record, args.seed, args.autoplay, args.accuracy, args.frames, not args.no_draw, args.size, args.pause)
+    if report is None:
+        sys.exit(2)
+    if args.verify:
+        if "session" not in report:
+            print("Error: game did not finish, nothing to verify (raise --frames)")
+            sys.exit(2)
+        replay = run(report["session"], draw=False)
+        if replay is None:
+            sys.exit(2)
+        report["expected"] = report["result"]
+        report["match"] = replay["result"] == report["result"]
+        report["result"] = replay["result"]
+
+    with open(args.report, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False)
+    print(f"frames: {report['frames']}  time: {report['seconds']:.2f}s  fps: {report['fps']:.1f}")
+    for name, summary in report["timings_ms"].items():
+        print(f"  {name:<15} {summary}")
+    print(f"result: {report['result']}")
+    if "match" in report:
+        print(f"expected: {report['expected']}  match: {report['match']}")
+        if not report["match"]:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
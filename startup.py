@@ -0,0 +1,46 @@
+import threading
+import time
+from contextlib import contextmanager
+
+
+class StartupTimer:
+    """게임 시작 단계별 소요 시간 기록 (메인 스레드와 로딩 스레드에서 함께 사용)
+
+    phase(name)로 감싼 구간의 시작 시각(프로그램 시작 기준)과 걸린 시간, 실행한 스레드를 남기고
+    mark(name)로 첫 화면 표시 같은 시점을 기록합니다. report()는 시작 순서대로 출력합니다.
+    """
+    def __init__(self):
+        self.t0 = time.perf_counter()
+        self.records = [] # (이름, 시작 ms, 걸린 ms, 스레드 이름)
+        self._lock = threading.Lock()
+
+    def _add(self, name, start, end):
+        with self._lock:
+            self.records.append((name, (start - self.t0) * 1000, (end - start) * 1000,
+                                 threading.current_thread().name))
+
+    @contextmanager
+    def phase(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._add(name, start, time.perf_counter())
+
+    def mark(self, name):
+        now = time.perf_counter()
+        self._add(name, now, now)
+
+    def elapsed_ms(self):
+        return (time.perf_counter() - self.t0) * 1000
+
+    def report(self):
+        with self._lock:
+            records = sorted(self.records, key=lambda r: r[1])
+        print("Startup timing (ms from start):")
+        for name, start, duration, thread in records:
+            if duration:
+                print(f"  {name:<16} {start:8.1f} +{duration:8.1f}  [{thread}]")
+            else:
+                print(f"  {name:<16} {start:8.1f}  [{thread}]")
+        return records
@@ -0,0 +1,41 @@
+from collections import OrderedDict
+
+
+class TextCache:
+    """font.render 결과 Surface를 (text, font, color)로 저장하는 LRU 캐시
+
+    HUD 점수나 랭킹 화면처럼 몇 분씩 같은 글자를 매 프레임 그리는 경우 글꼴 래스터화를 건너뜁니다.
+    가득 차면 가장 오래 쓰지 않은 항목부터 버립니다. 반환된 Surface는 공유되므로 수정하면 안 됩니다.
+    """
+    def __init__(self, max_entries=256):
+        self.max_entries = max_entries
+        self._surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def render(self, font, text, color, antialias=True):
+        key = (text, font, tuple(color), antialias)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.max_entries:
+            self._surfaces.popitem(last=False)
+            self.evictions += 1
+        return surface
+
+    def get_stats(self):
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._surfaces),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / total, 3) if total else 0.0,
+        }
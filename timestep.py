@@ -0,0 +1,68 @@
+import time
+from collections import deque
+
+import numpy as np
+
+
+class FixedTimestep:
+    """고정 간격(1/hz초) 시뮬레이션 틱을 렌더링 속도와 분리해서 돌리기 위한 누적 시간 관리
+
+    매 렌더 프레임마다 advance()를 부르면 그동안 쌓인 시간만큼 실행할 틱 수를 돌려주고,
+    남은 시간의 비율(alpha, 0~1)은 직전 틱과 현재 틱 사이를 보간해 그리는 데 씁니다.
+    한 프레임이 크게 밀리면 max_steps까지만 따라잡고 나머지는 버림(missed_ticks로 집계) -
+    따라잡느라 더 느려지는 악순환 방지.
+    """
+    def __init__(self, hz=30, max_steps=5, window=300):
+        self.dt = 1.0 / hz
+        self.max_steps = max_steps
+        self.accumulator = 0.0
+        self.alpha = 0.0
+        self._last = None
+
+        # --- 프레임 페이싱 통계 ---
+        self.frames = 0
+        self.ticks = 0
+        self.missed_ticks = 0
+        self._intervals = deque(maxlen=window) # 최근 렌더 프레임 간격 (초)
+
+    def reset(self):
+        """오래 멈췄다가 다시 시작할 때 (쌓인 시간을 한 번에 따라잡지 않도록)"""
+        self._last = None
+        self.accumulator = 0.0
+        self.alpha = 0.0
+
+    def advance(self, now=None):
+        """지난 호출 이후 흐른 시간을 더하고 이번 프레임에 실행할 틱 수를 반환"""
+        now = time.perf_counter() if now is None else now
+        if self._last is not None:
+            interval = now - self._last
+            self._intervals.append(interval)
+            self.accumulator += interval
+        self._last = now
+        self.frames += 1
+
+        steps = int(self.accumulator / self.dt)
+        if steps > self.max_steps:
+            self.missed_ticks += steps - self.max_steps
+            steps = self.max_steps
+            self.accumulator = self.accumulator % self.dt # 버린 틱만큼의 시간은 잊음
+        else:
+            self.accumulator -= steps * self.dt
+        self.ticks += steps
+        self.alpha = self.accumulator / self.dt
+        return steps
+
+    def get_stats(self):
+        """렌더 FPS, 프레임 간격(ms) 분포, 지터(간격 표준편차), 실행/누락 틱 수"""
+        stats = {"frames": self.frames, "ticks": self.ticks, "missed_ticks": self.missed_ticks}
+        if len(self._intervals) > 1:
+            ms = np.array(self._intervals) * 1000
+            p50, p95 = np.percentile(ms, (50, 95))
+            stats.update({
+                "render_fps": round(float(1000 / ms.mean()), 1),
+                "frame_ms_p50": round(float(p50), 2),
+                "frame_ms_p95": round(float(p95), 2),
+                "frame_ms_max": round(float(ms.max()), 2),
+                "jitter_ms": round(float(ms.std()), 2),
+            })
+        return stats
@@ -0,0 +1,304 @@
+"""시드로 재현 가능한 도로 계획 (타일 단위, 자기 겹침 방지)
+
+도로 조각은 모두 TILE_SIZE 정사각형이라 시작 조각을 (0, 0)으로 하는 타일 격자 위에 놓입니다.
+앞으로 놓을 조각을 블록(직진 3~6개 + 미션 1개, 기존 fill_map_queue와 같은 분포) 단위로 미리 계획해
+타일 좌표 / 종류 / 진입·진출 방향을 array에 저장하고, 점유된 타일은 공간 해시(타일 좌표 -> 조각 번호)로 관리합니다.
+
+- 블록이 차지할 타일과 출구 타일이 비어 있고, 출구에서 free_area칸 이상 빈 공간이 이어져야 채택 (막다른 곳 방지)
+- 누적 회전(좌회전 +1, 우회전 -1)은 ±max_winding 안에서만: 같은 쪽으로 계속 돌며 도로가 소용돌이처럼 자기 쪽으로 말려 들어가지 않도록
+- 뽑은 블록이 안 맞으면 다른 (직진 수, 미션) 조합을 시도하고, 모두 막히면 아직 게임에 넘기지 않은 블록을 되돌려
+  그 자리의 남은 조합으로 다시 계획 (깊이 우선 탐색, max_backtracks번까지)
+  그래도 안 되면 가장 덜 겹치는 조합을 놓고 stats["forced"]에, 실제로 겹쳤으면 stats["overlapped"]에도 셈
+- release(n): 화면에서 지운 앞쪽 n개 조각의 타일을 해시에서 빼서 다시 쓸 수 있게 함
+
+트랙만 생성/검증해 보기 (겹치거나 끊기면 종료 코드 1):
+    python track.py --segments 5000 --seed 1
+"""
+import argparse
+import random
+import sys
+import time
+from array import array
+from collections import deque
+
+from road import DIR_DOWN, DIR_LEFT, DIR_RIGHT, DIR_UP, RoadSegment
+
+SEGMENT_TYPES = RoadSegment.SEGMENT_TYPES # 타입 코드 = 이 튜플의 인덱스
+TYPE_CODES = {name: code for code, name in enumerate(SEGMENT_TYPES)}
+MISSIONS = ('left_turn', 'right_turn', 'stop_signal')
+
+WINDING = {'left_turn': 1, 'right_turn': -1, 'stop_signal': 0} # 미션별 누적 회전 변화 (90도 단위)
+# 게임에서 release되지 않고 남는 넘긴 조각 수 상한 (화면에 남기는 20개 + 큐, 자동 플레이 측정 최대 46)
+LIVE_WINDOW = 50
+
+STEP = {DIR_UP: (0, -1), DIR_DOWN: (0, 1), DIR_LEFT: (-1, 0), DIR_RIGHT: (1, 0)}
+TURN_LEFT = {DIR_UP: DIR_LEFT, DIR_LEFT: DIR_DOWN, DIR_DOWN: DIR_RIGHT, DIR_RIGHT: DIR_UP}
+TURN_RIGHT = {DIR_UP: DIR_RIGHT, DIR_RIGHT: DIR_DOWN, DIR_DOWN: DIR_LEFT, DIR_LEFT: DIR_UP}
+
+
+def out_direction(segment_type, in_direction):
+    if segment_type == 'left_turn':
+        return TURN_LEFT[in_direction]
+    if segment_type == 'right_turn':
+        return TURN_RIGHT[in_direction]
+    return in_direction
+
+
+class TrackPlan:
+    def __init__(self, seed=None, rng=None, min_straight=3, max_straight=6, lookahead=4, free_area=64,
+                 max_backtracks=32, max_winding=2):
+        self.rng = rng if rng is not None else random.Random(seed)
+        self.min_straight = min_straight
+        self.max_straight = max_straight
+        self.lookahead = lookahead           # 게임에 넘긴 블록 뒤로 미리 계획해 둘 블록 수 (되돌릴 수 있는 범위)
+        self.free_area = free_area
+        self.max_backtracks = max_backtracks
+        self.max_winding = max_winding     # None이면 제한 없음
+
+        # 조각 i의 타일 좌표, 종류 코드, 진입/진출 방향
+        self.xs = array("i")
+        self.ys = array("i")
+        self.types = array("b")
+        self.in_dirs = array("b")
+        self.out_dirs = array("b")
+        self.occupied = {}    # 공간 해시: (x, y) -> 조각 번호
+        self.block_starts = array("i")
+        self.windings = array("i", [0])  # 블록마다 그 블록까지의 누적 회전 (0번은 시작 조각)
+        self.handed_blocks = 0 # next_block()으로 넘긴 블록 수 (그 앞은 되돌리지 않음)
+        self._untried = []     # 아직 넘기지 않은 블록마다 시도하지 않은 (직진 수, 미션) 조합 (되돌리면 이어서 시도)
+        self.released = 0      # release()로 해시에서 뺀 앞쪽 조각 수
+        self.stats = {"blocks": 0, "rejected": 0, "backtracks": 0, "forced": 0, "overlapped": 0}
+
+        self._add(0, 0, 'straight', DIR_UP) # 시작 조각 (플레이어 위치)
+
+    def __len__(self):
+        return len(self.types)
+
+    def segment(self, index):
+        """(x, y, 종류, 진입 방향, 진출 방향)"""
+        return (self.xs[index], self.ys[index], SEGMENT_TYPES[self.types[index]],
+                self.in_dirs[index], self.out_dirs[index])
+
+    def index_at(self, x, y):
+        """타일 (x, y)에 있는 조각 번호 (없거나 이미 release된 타일이면 None)"""
+        return self.occupied.get((x, y))
+
+    def _add(self, x, y, segment_type, in_direction):
+        self.xs.append(x)
+        self.ys.append(y)
+        self.types.append(TYPE_CODES[segment_type])
+        self.in_dirs.append(in_direction)
+        self.out_dirs.append(out_direction(segment_type, in_direction))
+        self.occupied[(x, y)] = len(self.types) - 1
+
+    def _head(self):
+        """다음 조각이 놓일 타일과 진입 방향"""
+        last = len(self.types) - 1
+        d = self.out_dirs[last]
+        dx, dy = STEP[d]
+        return self.xs[last] + dx, self.ys[last] + dy, d
+
+    def _block_tiles(self, x, y, d, count, mission):
+        """블록이 차지할 타일 목록, 블록 다음 조각이 놓일 출구 타일과 방향"""
+        dx, dy = STEP[d]
+        tiles = [(x + dx * i, y + dy * i) for i in range(count + 1)]
+        out = out_direction(mission, d)
+        ox, oy = STEP[out]
+        mx, my = tiles[-1]
+        return tiles, (mx + ox, my + oy), out
+
+    def _fits(self, tiles, exit_tile, out):
+        occupied = self.occupied
+        if any(tile in occupied for tile in tiles):
+            return False
+        blocked = set(tiles)
+        # 출구에서 나가는 방향으로 가장 짧은 다음 블록(직진 min_straight개 + 미션 + 그 출구)이 들어갈 자리
+        ex, ey = exit_tile
+        dx, dy = STEP[out]
+        for i in range(self.min_straight + 2):
+            tile = (ex + dx * i, ey + dy * i)
+            if tile in occupied or tile in blocked:
+                return False
+        # 출구에서 빈 타일이 free_area칸 이상 이어지는지 (도로로 둘러싸인 좁은 곳으로 들어가지 않도록)
+        seen = {exit_tile}
+        frontier = deque([exit_tile])
+        while frontier:
+            x, y = frontier.popleft()
+            for dx, dy in STEP.values():
+                tile = (x + dx, y + dy)
+                if tile in seen or tile in blocked or tile in occupied:
+                    continue
+                seen.add(tile)
+                if len(seen) >= self.free_area:
+                    return True
+                frontier.append(tile)
+        return False
+
+    def _candidates(self):
+        """기존과 같은 순서로 뽑은 조합을 먼저, 나머지 조합은 섞어서 뒤에 (누적 회전 한도를 넘는 미션은 뺌)"""
+        first = (self.rng.randint(self.min_straight, self.max_straight), self.rng.choice(MISSIONS))
+        others = [(c, m) for c in range(self.min_straight, self.max_straight + 1) for m in MISSIONS
+                  if (c, m) != first]
+        self.rng.shuffle(others)
+        candidates = [first] + others
+        if self.max_winding is None:
+            return candidates
+        winding = self.windings[-1]
+        return [(c, m) for c, m in candidates if abs(winding + WINDING[m]) <= self.max_winding]
+
+    def _place(self, x, y, d, count, mission, untried):
+        tiles, _, _ = self._block_tiles(x, y, d, count, mission)
+        self.block_starts.append(len(self.types))
+        self.windings.append(self.windings[-1] + WINDING[mission])
+        self._untried.append(untried)
+        for i, (tx, ty) in enumerate(tiles):
+            self._add(tx, ty, 'straight' if i < count else mission, d)
+        self.stats["blocks"] += 1
+
+    def _plan_block(self, candidates=None):
+        """candidates(없으면 새로 뽑음)에서 맞는 첫 조합으로 블록을 놓음. 남은 조합은 되돌릴 때를 위해 기억"""
+        x, y, d = self._head()
+        candidates = self._candidates() if candidates is None else candidates
+        for i, (count, mission) in enumerate(candidates):
+            tiles, exit_tile, out = self._block_tiles(x, y, d, count, mission)
+            if not self._fits(tiles, exit_tile, out):
+                self.stats["rejected"] += 1
+                continue
+            self._place(x, y, d, count, mission, candidates[i + 1:])
+            return True
+        return False
+
+    def _force_block(self):
+        """되돌려도 맞는 블록이 없을 때: 출구 검사를 빼고, 살아 있는 타일과 가장 덜 겹치는 조합으로 놓음"""
+        x, y, d = self._head()
+        occupied = self.occupied
+
+        def cost(candidate):
+            tiles, exit_tile, _ = self._block_tiles(x, y, d, *candidate)
+            return sum(tile in occupied for tile in tiles), exit_tile in occupied
+
+        count, mission = min(self._candidates(), key=cost)
+        overlaps = cost((count, mission))[0]
+        self._place(x, y, d, count, mission, [])
+        self.stats["forced"] += 1
+        if overlaps:
+            self.stats["overlapped"] += 1
+
+    def _drop_last_block(self):
+        """아직 게임에 넘기지 않은 마지막 블록을 계획에서 지우고, 그 자리에서 시도하지 않은 조합을 반환
+        (넘긴 블록밖에 없으면 None)"""
+        if len(self.block_starts) <= self.handed_blocks:
+            return None
+        start = self.block_starts.pop()
+        self.windings.pop()
+        for i in range(len(self.types) - 1, start - 1, -1):
+            tile = (self.xs[i], self.ys[i])
+            if self.occupied.get(tile) == i:
+                del self.occupied[tile]
+            for column in (self.xs, self.ys, self.types, self.in_dirs, self.out_dirs):
+                column.pop()
+        self.stats["blocks"] -= 1
+        self.stats["backtracks"] += 1
+        return self._untried.pop()
+
+    def _plan_ahead(self):
+        """넘기지 않은 블록이 lookahead + 1개가 되도록 계획 (깊이 우선 탐색: 막히면 직전 블록을 되돌려
+        그 자리의 남은 조합으로 다시, 그것도 다 막히면 한 블록 더 되돌림)"""
+        backtracks = 0
+        retry = None # 되돌린 블록 자리에서 이어서 시도할 조합
+        while len(self.block_starts) - self.handed_blocks < self.lookahead + 1:
+            if self._plan_block(retry):
+                retry = None
+                continue
+            if backtracks < self.max_backtracks:
+                retry = self._drop_last_block()
+                if retry is not None:
+                    backtracks += 1
+                    continue
+            retry = None
+            self._force_block()
+
+    def next_block(self):
+        """다음 블록(직진 n개 + 미션 1개)의 조각 종류를 확정해서 반환"""
+        self._plan_ahead()
+        start = self.block_starts[self.handed_blocks]
+        self.handed_blocks += 1
+        self._untried.pop(0) # 넘긴 블록은 되돌리지 않음
+        end = self.block_starts[self.handed_blocks] if self.handed_blocks < len(self.block_starts) else len(self.types)
+        return [SEGMENT_TYPES[code] for code in self.types[start:end]]
+
+    @property
+    def direction(self):
+        """넘긴 블록의 마지막 조각이 나가는 방향 (기존 logical_direction)"""
+        if self.handed_blocks == 0:
+            return self.out_dirs[0]
+        end = self.block_starts[self.handed_blocks] if self.handed_blocks < len(self.block_starts) else len(self.types)
+        return self.out_dirs[end - 1]
+
+    def release(self, count):
+        """앞쪽 count개 조각(화면에서 지운 것)의 타일을 공간 해시에서 뺌"""
+        for i in range(self.released, min(count, len(self.types))):
+            tile = (self.xs[i], self.ys[i])
+            if self.occupied.get(tile) == i:
+                del self.occupied[tile]
+        self.released = max(self.released, count)
+
+    def validate(self, start=0, end=None, window=None):
+        """조각 [start, end)가 끊김 없이 이어지고 겹치지 않는지 검사 (끊기거나 겹치면 ValueError)
+        window: 연속한 window개 조각 안에서만 겹침을 봄 (release로 타일을 다시 쓰는 경우), None이면 전체"""
+        end = len(self.types) if end is None else end
+        broken = 0
+        for i in range(start, end - 1):
+            dx, dy = STEP[self.out_dirs[i]]
+            if (self.xs[i] + dx, self.ys[i] + dy) != (self.xs[i + 1], self.ys[i + 1]) \
+                    or self.in_dirs[i + 1] != self.out_dirs[i]:
+                broken += 1
+
+        overlaps = 0
+        last_seen = {}
+        for i in range(start, end):
+            tile = (self.xs[i], self.ys[i])
+            prev = last_seen.get(tile)
+            if prev is not None and (window is None or i - prev < window):
+                overlaps += 1
+            last_seen[tile] = i
+        result = {"segments": end - start, "broken_links": broken, "overlaps": overlaps}
+        if broken or overlaps:
+            raise ValueError(f"invalid track: {result}")
+        return result
+
+
+def generate(segments, seed=0, window=None, **kwargs):
+    """segments개 이상 계획 (window가 있으면 게임처럼 window개보다 뒤의 조각 타일은 release)"""
+    plan = TrackPlan(seed=seed, **kwargs)
+    handed = 1
+    while handed < segments:
+        handed += len(plan.next_block())
+        if window is not None:
+            plan.release(handed - window)
+    return plan
+
+
+def main():
+    parser = argparse.ArgumentParser(description="도로 계획 생성 속도와 겹침/연결 검사")
+    parser.add_argument("--segments", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--window", type=int, default=LIVE_WINDOW,
+                        help="이만큼 지난 조각의 타일은 다시 사용 (게임과 같은 방식, 0이면 다시 쓰지 않음)")
+    args = parser.parse_args()
+
+    window = args.window or None
+    start = time.perf_counter()
+    plan = generate(args.segments, args.seed, window)
+    elapsed = time.perf_counter() - start
+    print(f"segments: {len(plan)}  time: {elapsed * 1000:.1f} ms  ({elapsed * 1e6 / len(plan):.1f} us/segment)")
+    print(f"stats: {plan.stats}")
+    try:
+        print(f"validate: {plan.validate(window=window)}")
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -13,6 +13,7 @@ class UserManager:
                 json.dump({}, f)
 
         self.users = self.load_users()
+        self.version = 0 # 사용자/점수가 바뀔 때마다 증가 (랭킹 화면 캐시 무효화용)
 
     def load_users(self):
         try:
@@ -22,6 +23,7 @@ class UserManager:
             return {}
 
     def save_users(self):
+        self.version += 1
         with open(self.filepath, "w", encoding="utf-8") as f:
             json.dump(self.users, f, indent=4, ensure_ascii=False)
 